@@ -54,6 +54,8 @@ class RedisStore(BaseStore):
         self._client = client
         self._prefix = prefix.rstrip(":")
         self._namespaces_key = f"{self._prefix}:namespaces"
+        # Parsed namespace tuples keyed by their stored token so hot scans never re-split.
+        self._namespace_cache: dict[str, tuple[str, ...]] = {}
 
     def batch(self, ops: Iterable[Op]) -> list[Result]:
         """Execute store operations synchronously."""
@@ -124,7 +126,7 @@ class RedisStore(BaseStore):
             members_key = self._namespace_members_key(namespace)
             self._client.srem(members_key, key)
             if not self._client.smembers(members_key):
-                self._client.srem(self._namespaces_key, self._namespace_token(namespace))
+                self._forget_namespace(namespace)
             return
 
         now = datetime.now(UTC)
@@ -262,9 +264,18 @@ class RedisStore(BaseStore):
     def _token_to_namespace(self, token: str) -> tuple[str, ...]:
         """Convert stored namespace tokens back into tuples."""
 
-        if not token:
-            return tuple()
-        return tuple(token.split("/"))
+        namespace = self._namespace_cache.get(token)
+        if namespace is None:
+            namespace = tuple(token.split("/")) if token else tuple()
+            self._namespace_cache[token] = namespace
+        return namespace
+
+    def _forget_namespace(self, namespace: Sequence[str]) -> None:
+        """Drop ``namespace`` from the membership index and the parse cache."""
+
+        token = self._namespace_token(namespace)
+        self._client.srem(self._namespaces_key, token)
+        self._namespace_cache.pop(token, None)
 
     def _safe_load(self, payload: Any) -> dict[str, Any] | None:
         """Deserialize stored JSON payloads safely."""
@@ -282,7 +293,7 @@ class RedisStore(BaseStore):
         members_key = self._namespace_members_key(namespace)
         if self._client.srem(members_key, key):
             if not self._client.smembers(members_key):
-                self._client.srem(self._namespaces_key, self._namespace_token(namespace))
+                self._forget_namespace(namespace)
 
     def _materialize_item(self, namespace: Sequence[str], key: str, data: dict[str, Any]) -> Item:
         """Create an :class:`Item` instance from stored metadata."""
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import deque
 from collections.abc import Mapping, Sequence
 from contextlib import AbstractContextManager, ExitStack
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import json
-from threading import Lock
+import logging
+import time
+from threading import Condition, Event, Lock, Thread
 from typing import Any, Callable, Mapping as MappingType, Protocol
 
 try:
@@ -16,9 +18,38 @@ try:
 except (ModuleNotFoundError, ImportError):  # pragma: no cover - fallback for optional dependency
     dh_dtypes = None
 
+LOGGER = logging.getLogger(__name__)
+
+# ``json.dumps`` with keyword options builds a fresh ``JSONEncoder`` on every call;
+# reuse one configured encoder for the per-row payload/labels serialization.
+_dumps = json.JSONEncoder(sort_keys=True, default=str).encode
+_encode_json_str = json.encoder.encode_basestring_ascii
+_EMPTY_JSON = "{}"
+
+
+def _dumps_mapping(value: Mapping[str, Any] | None) -> str:
+    """Serialize payload/labels mappings, skipping the encoder for trivial shapes.
+
+    Empty mappings and single ``str -> str`` dicts (the common label shapes) are
+    formatted directly; the output is identical to :func:`_dumps`.
+    """
+
+    if not value:
+        return _EMPTY_JSON
+    if len(value) == 1 and isinstance(value, dict):
+        ((key, item),) = value.items()
+        if type(key) is str and type(item) is str:
+            return f"{{{_encode_json_str(key)}: {_encode_json_str(item)}}}"
+    return _dumps(value)
+
 
 class _WriterProtocol(Protocol):
-    """Protocol for Deephaven table writers used by the telemetry emitter."""
+    """Protocol for Deephaven table writers used by the telemetry emitter.
+
+    Writers may additionally expose ``write_rows(columns)`` accepting one
+    sequence per column; when present the emitter submits a whole batch through
+    it in a single call instead of looping over ``write_row``.
+    """
 
     def write_row(self, *values: Any) -> None:  # pragma: no cover - interface only
         """Append a row to the underlying table."""
@@ -78,8 +109,69 @@ DEFAULT_EVENT_SCHEMA: tuple[ColumnSpec, ...] = _default_event_schema()
 DEFAULT_METRIC_SCHEMA: tuple[ColumnSpec, ...] = _default_metric_schema()
 
 
+_EVENT_FIELDS: tuple[str, ...] = ("timestamp", "agent_id", "event_type", "run_id", "payload_json")
+_METRIC_FIELDS: tuple[str, ...] = ("timestamp", "agent_id", "metric_name", "metric_value", "labels_json")
+
+_Columns = tuple[list[Any], ...]
+
+
+def _empty_columns(width: int) -> _Columns:
+    """Return a fresh structure-of-arrays buffer with ``width`` columns."""
+
+    return tuple([] for _ in range(width))
+
+
+@dataclass(frozen=True, slots=True)
+class _ColumnLayout:
+    """Precomputed writer metadata for a schema fed from a fixed set of buffered fields."""
+
+    names: tuple[str, ...]
+    types: tuple[Any, ...]
+    # Index into the buffered columns for each schema column, ``None`` when unbuffered.
+    sources: tuple[int | None, ...]
+
+    @classmethod
+    def build(cls, schema: Sequence[ColumnSpec], fields: Sequence[str]) -> "_ColumnLayout":
+        positions = {name: index for index, name in enumerate(fields)}
+        return cls(
+            names=tuple(column.name for column in schema),
+            types=tuple(column.dtype for column in schema),
+            sources=tuple(positions.get(column.name) for column in schema),
+        )
+
+    def project(self, columns: _Columns) -> list[Sequence[Any]]:
+        """Align buffered ``columns`` with the schema.
+
+        Schema columns without a buffered counterpart are filled with ``None`` so
+        custom schemas keep the same semantics as the former per-row ``dict.get``.
+        """
+
+        row_count = len(columns[0]) if columns else 0
+        return [columns[source] if source is not None else [None] * row_count for source in self.sources]
+
+
+# Background flushes faster than this grow the effective batch while a backlog exists;
+# flushes slower than the upper bound shrink it again.
+_FAST_FLUSH_S = 0.010
+_SLOW_FLUSH_S = 0.100
+
+# (table name, column layout, buffered columns) handed to the sink.
+_Batch = tuple[str, _ColumnLayout, _Columns]
+
+
 class DeephavenTelemetryEmitter:
-    """Batching telemetry emitter that writes into Deephaven tables."""
+    """Batching telemetry emitter that writes into Deephaven tables.
+
+    With ``background_flush=True`` full batches are swapped out of the active
+    buffer and handed to a dedicated writer thread, so producers never wait on
+    Deephaven I/O. ``flush()`` and ``close()`` block until the writer drains.
+    The writer backlog is bounded by ``max_buffered_rows`` (eight batches by
+    default); when the sink falls behind, the oldest queued batches are dropped
+    and counted in :attr:`dropped_rows`. In that mode the effective batch size
+    also adapts to flush latency, doubling (up to ``max_batch_size`` and the
+    backlog bound) while fast flushes leave work queued and halving back towards
+    ``batch_size`` when flushes are slow.
+    """
 
     def __init__(
         self,
@@ -91,31 +183,74 @@ class DeephavenTelemetryEmitter:
         event_schema: Sequence[ColumnSpec] | None = None,
         metric_schema: Sequence[ColumnSpec] | None = None,
         writer_factory: WriterFactory | None = None,
+        background_flush: bool = False,
+        max_buffered_rows: int | None = None,
+        max_batch_size: int = 4096,
     ) -> None:
         if batch_size <= 0:
             msg = "batch_size must be positive"
             raise ValueError(msg)
+        if max_buffered_rows is not None and max_buffered_rows < batch_size:
+            msg = "max_buffered_rows must be at least batch_size"
+            raise ValueError(msg)
 
         self._session = session
         self._agent_events_table = agent_events_table
         self._agent_metrics_table = agent_metrics_table
         self._batch_size = batch_size
+        self._effective_batch_size = batch_size
         self._event_schema = tuple(event_schema) if event_schema is not None else DEFAULT_EVENT_SCHEMA
         self._metric_schema = tuple(metric_schema) if metric_schema is not None else DEFAULT_METRIC_SCHEMA
-        self._writer_factory = writer_factory or self._default_writer_factory
-        self._event_buffer: list[dict[str, Any]] = []
-        self._metric_buffer: list[dict[str, Any]] = []
+        self._event_layout = _ColumnLayout.build(self._event_schema, _EVENT_FIELDS)
+        self._metric_layout = _ColumnLayout.build(self._metric_schema, _METRIC_FIELDS)
+        self._writer_factory = writer_factory or self._default_writer_factory(session)
+        # Buffers are stored column-wise (one list per field) rather than as a
+        # list of per-row dicts, so flushing never performs per-cell lookups.
+        self._event_columns: _Columns = _empty_columns(len(_EVENT_FIELDS))
+        self._metric_columns: _Columns = _empty_columns(len(_METRIC_FIELDS))
         self._lock = Lock()
+        # Serializes sink writes so batches reach Deephaven in the order they were swapped.
+        self._write_lock = Lock()
         self._closed = False
+        self._pending: deque[_Batch | Event | None] | None = None
+        self._pending_ready = Condition(Lock())
+        self._pending_rows = 0
+        self._max_pending_rows = max_buffered_rows if max_buffered_rows is not None else batch_size * 8
+        # A single batch must always fit in the backlog, otherwise it would be shed on arrival.
+        self._max_batch_size = max(batch_size, min(max_batch_size, self._max_pending_rows))
+        self._dropped_rows = 0
+        self._writer_thread: Thread | None = None
+        if background_flush:
+            self._pending = deque()
+            self._writer_thread = Thread(
+                target=self._writer_loop,
+                args=(self._pending,),
+                name="deephaven-telemetry-writer",
+                daemon=True,
+            )
+            self._writer_thread.start()
+
+    @property
+    def effective_batch_size(self) -> int:
+        """Row count that currently triggers a flush."""
+
+        return self._effective_batch_size
+
+    @property
+    def dropped_rows(self) -> int:
+        """Number of rows discarded because the background writer fell behind."""
 
-    def _default_writer_factory(
-        self, table_name: str, column_names: Sequence[str], column_types: Sequence[Any]
-    ) -> AbstractContextManager[_WriterProtocol]:
-        batch_writer = getattr(self._session, "batch_table_writer", None)
-        if batch_writer is None:  # pragma: no cover - defensive programming
+        return self._dropped_rows
+
+    @staticmethod
+    def _default_writer_factory(session: Any) -> WriterFactory:
+        """Resolve ``session.batch_table_writer`` once so a missing API fails at construction."""
+
+        batch_writer = getattr(session, "batch_table_writer", None)
+        if batch_writer is None:
             msg = "Session does not expose batch_table_writer"
             raise AttributeError(msg)
-        return batch_writer(table_name, column_names, column_types)
+        return batch_writer
 
     def emit_event(
         self,
@@ -128,18 +263,18 @@ class DeephavenTelemetryEmitter:
     ) -> None:
         """Queue an agent event for persistence."""
 
-        event_payload = json.dumps(payload or {}, sort_keys=True, default=str)
-        row = {
-            "timestamp": timestamp,
-            "agent_id": agent_id,
-            "event_type": event_type,
-            "run_id": run_id,
-            "payload_json": event_payload,
-        }
+        event_payload = _dumps_mapping(payload)
         with self._lock:
-            self._event_buffer.append(row)
-            if len(self._event_buffer) >= self._batch_size:
-                self._flush_events_locked()
+            timestamps, agent_ids, event_types, run_ids, payloads = self._event_columns
+            timestamps.append(timestamp)
+            agent_ids.append(agent_id)
+            event_types.append(event_type)
+            run_ids.append(run_id)
+            payloads.append(event_payload)
+            batches = [self._swap_events_locked()] if len(timestamps) >= self._effective_batch_size else []
+            owns_write = self._submit_locked(batches)
+        if owns_write:
+            self._write_owned(batches)
 
     def emit_metric(
         self,
@@ -152,25 +287,29 @@ class DeephavenTelemetryEmitter:
     ) -> None:
         """Queue an agent metric for persistence."""
 
-        metric_labels = json.dumps(labels or {}, sort_keys=True, default=str)
-        row = {
-            "timestamp": timestamp,
-            "agent_id": agent_id,
-            "metric_name": metric_name,
-            "metric_value": float(metric_value),
-            "labels_json": metric_labels,
-        }
+        metric_labels = _dumps_mapping(labels)
+        value = float(metric_value)
         with self._lock:
-            self._metric_buffer.append(row)
-            if len(self._metric_buffer) >= self._batch_size:
-                self._flush_metrics_locked()
+            timestamps, agent_ids, metric_names, metric_values, labels_json = self._metric_columns
+            timestamps.append(timestamp)
+            agent_ids.append(agent_id)
+            metric_names.append(metric_name)
+            metric_values.append(value)
+            labels_json.append(metric_labels)
+            batches = [self._swap_metrics_locked()] if len(timestamps) >= self._effective_batch_size else []
+            owns_write = self._submit_locked(batches)
+        if owns_write:
+            self._write_owned(batches)
 
     def flush(self) -> None:
         """Flush any buffered telemetry to Deephaven."""
 
         with self._lock:
-            self._flush_events_locked()
-            self._flush_metrics_locked()
+            batches = self._swap_all_locked()
+            owns_write = self._submit_locked(batches)
+        if owns_write:
+            self._write_owned(batches)
+        self._wait_for_writer()
 
     def close(self) -> None:
         """Flush remaining telemetry and prevent future writes."""
@@ -178,9 +317,14 @@ class DeephavenTelemetryEmitter:
         with self._lock:
             if self._closed:
                 return
-            self._flush_events_locked()
-            self._flush_metrics_locked()
+            batches = self._swap_all_locked()
+            owns_write = self._submit_locked(batches)
             self._closed = True
+        if owns_write:
+            self._write_owned(batches)
+        if self._pending is not None and self._writer_thread is not None:
+            self._enqueue(None)
+            self._writer_thread.join()
 
     def __enter__(self) -> "DeephavenTelemetryEmitter":  # pragma: no cover - convenience
         return self
@@ -188,31 +332,135 @@ class DeephavenTelemetryEmitter:
     def __exit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - convenience
         self.close()
 
-    def _flush_events_locked(self) -> None:
-        if not self._event_buffer:
+    def _swap_events_locked(self) -> _Batch:
+        columns = self._event_columns
+        self._event_columns = _empty_columns(len(_EVENT_FIELDS))
+        return (self._agent_events_table, self._event_layout, columns)
+
+    def _swap_metrics_locked(self) -> _Batch:
+        columns = self._metric_columns
+        self._metric_columns = _empty_columns(len(_METRIC_FIELDS))
+        return (self._agent_metrics_table, self._metric_layout, columns)
+
+    def _swap_all_locked(self) -> list[_Batch]:
+        batches: list[_Batch] = []
+        if self._event_columns[0]:
+            batches.append(self._swap_events_locked())
+        if self._metric_columns[0]:
+            batches.append(self._swap_metrics_locked())
+        return batches
+
+    def _submit_locked(self, batches: list[_Batch]) -> bool:
+        """Hand swapped-out ``batches`` to the sink while the buffer lock is held.
+
+        In background mode the batches are queued for the writer thread. Otherwise
+        the write lock is acquired before the buffer lock is released, preserving
+        batch order, and ``True`` tells the caller to finish with
+        :meth:`_write_owned` once the buffer lock has been dropped.
+        """
+
+        if not batches:
+            return False
+        if self._pending is not None:
+            for batch in batches:
+                self._enqueue(batch)
+            return False
+        self._write_lock.acquire()
+        return True
+
+    def _write_owned(self, batches: list[_Batch]) -> None:
+        """Write ``batches`` and release the write lock taken by :meth:`_submit_locked`."""
+
+        try:
+            for batch in batches:
+                self._write_batch(batch)
+        finally:
+            self._write_lock.release()
+
+    def _write_batch(self, batch: _Batch) -> None:
+        table_name, layout, columns = batch
+        self._write_rows(table_name, layout, layout.project(columns))
+
+    def _wait_for_writer(self) -> None:
+        """Block until every batch queued before this call has been written."""
+
+        if self._pending is None or self._writer_thread is None or not self._writer_thread.is_alive():
             return
-        rows = self._event_buffer
-        self._event_buffer = []
-        self._write_rows(self._agent_events_table, self._event_schema, rows)
+        drained = Event()
+        self._enqueue(drained)
+        drained.wait()
+
+    def _enqueue(self, item: _Batch | Event | None) -> None:
+        """Append ``item`` to the writer backlog, shedding the oldest batches on overflow."""
 
-    def _flush_metrics_locked(self) -> None:
-        if not self._metric_buffer:
+        pending = self._pending
+        if pending is None:
             return
-        rows = self._metric_buffer
-        self._metric_buffer = []
-        self._write_rows(self._agent_metrics_table, self._metric_schema, rows)
+        with self._pending_ready:
+            pending.append(item)
+            if isinstance(item, tuple):
+                self._pending_rows += len(item[2][0])
+                while self._pending_rows > self._max_pending_rows:
+                    self._drop_oldest_batch_locked(pending)
+            self._pending_ready.notify()
+
+    def _drop_oldest_batch_locked(self, pending: deque[_Batch | Event | None]) -> None:
+        # Flush markers and the stop sentinel are never dropped, only data batches.
+        for index, queued in enumerate(pending):
+            if isinstance(queued, tuple):
+                del pending[index]
+                row_count = len(queued[2][0])
+                self._pending_rows -= row_count
+                self._dropped_rows += row_count
+                return
+
+    def _writer_loop(self, pending: deque[_Batch | Event | None]) -> None:
+        while True:
+            with self._pending_ready:
+                while not pending:
+                    self._pending_ready.wait()
+                item = pending.popleft()
+                if isinstance(item, tuple):
+                    self._pending_rows -= len(item[2][0])
+            if item is None:
+                return
+            if isinstance(item, Event):
+                item.set()
+                continue
+            started = time.perf_counter()
+            try:
+                with self._write_lock:
+                    self._write_batch(item)
+            except Exception:  # pragma: no cover - keep the writer alive on sink failures
+                LOGGER.exception("Failed to write telemetry batch to Deephaven table '%s'", item[0])
+                continue
+            self._tune_batch_size(time.perf_counter() - started)
+
+    def _tune_batch_size(self, flush_duration_s: float) -> None:
+        """Adapt the flush threshold to the observed background flush latency."""
+
+        current = self._effective_batch_size
+        if flush_duration_s < _FAST_FLUSH_S and self._pending_rows > 0:
+            self._effective_batch_size = min(current * 2, self._max_batch_size)
+        elif flush_duration_s > _SLOW_FLUSH_S:
+            self._effective_batch_size = max(current // 2, self._batch_size)
 
     def _write_rows(
         self,
         table_name: str,
-        schema: Sequence[ColumnSpec],
-        rows: Sequence[Mapping[str, Any]],
+        layout: _ColumnLayout,
+        columns: Sequence[Sequence[Any]],
     ) -> None:
-        column_names = [column.name for column in schema]
-        column_types = [column.dtype for column in schema]
-        with self._writer_factory(table_name, column_names, column_types) as writer:
-            for row in rows:
-                writer.write_row(*(row.get(column) for column in column_names))
+        """Write column-aligned data (one sequence per ``layout`` column)."""
+
+        with self._writer_factory(table_name, layout.names, layout.types) as writer:
+            write_rows = getattr(writer, "write_rows", None)
+            if callable(write_rows):
+                write_rows(columns)
+                return
+            write_row = writer.write_row
+            for values in zip(*columns):
+                write_row(*values)
 
     def persist_events(
         self,
@@ -231,8 +479,10 @@ class DeephavenTelemetryEmitter:
         if not rows:
             return
         target_table = table_name or self._agent_events_table
-        with self._lock:
-            self._write_rows(target_table, self._event_schema, rows)
+        layout = self._event_layout
+        columns = [[row.get(name) for row in rows] for name in layout.names]
+        with self._write_lock:
+            self._write_rows(target_table, layout, columns)
 
 
 class MCPStreamClient(Protocol):
@@ -251,6 +501,29 @@ class MCPStreamClient(Protocol):
 BusPublisher = Callable[[Mapping[str, Any]], None]
 
 
+@dataclass(slots=True)
+class _StreamBuffer:
+    """Per-stream update buffer guarded by its own lock."""
+
+    lock: Lock = field(default_factory=Lock)
+    updates: list[Mapping[str, Any]] = field(default_factory=list)
+
+    def append(self, update: Mapping[str, Any]) -> int:
+        """Append ``update`` and return the resulting buffer length."""
+
+        with self.lock:
+            self.updates.append(update)
+            return len(self.updates)
+
+    def drain(self) -> list[Mapping[str, Any]]:
+        """Atomically swap in an empty buffer and return the buffered updates."""
+
+        with self.lock:
+            updates = self.updates
+            self.updates = []
+        return updates
+
+
 @dataclass(slots=True)
 class MCPStreamBridgeConfig:
     """Runtime configuration for bridging MCP stream telemetry."""
@@ -295,7 +568,7 @@ class MCPStreamSubscriber:
         self._emitter = emitter
         self._config = bridge_config
         self._bus_publisher = bus_publisher
-        self._buffers: dict[str, list[Mapping[str, Any]]] = defaultdict(list)
+        self._buffers: dict[str, _StreamBuffer] = {}
         self._subscriptions: dict[str, AbstractContextManager[Any]] = {}
         self._stack = ExitStack()
 
@@ -305,6 +578,8 @@ class MCPStreamSubscriber:
         if stream in self._subscriptions:
             return
 
+        self._buffers.setdefault(stream, _StreamBuffer())
+
         def _handler(payload: Mapping[str, Any]) -> None:
             self._handle_event(stream, payload)
 
@@ -317,30 +592,35 @@ class MCPStreamSubscriber:
             _ = entered
 
     def _handle_event(self, stream: str, payload: Mapping[str, Any]) -> None:
-        buffer = self._buffers[stream]
-        buffer.append(dict(payload))
-        if len(buffer) >= self._config.buffer_size:
+        buffer = self._buffers.get(stream)
+        if buffer is None:
+            buffer = self._buffers.setdefault(stream, _StreamBuffer())
+        if buffer.append(dict(payload)) >= self._config.buffer_size:
             self._flush_stream(stream)
 
     def _flush_stream(self, stream: str) -> None:
-        buffer = self._buffers.get(stream)
+        stream_buffer = self._buffers.get(stream)
+        if stream_buffer is None:
+            return
+        # Swap the buffer under the stream lock only; persisting and publishing
+        # happen without holding any subscriber lock so streams flush in parallel.
+        buffer = stream_buffer.drain()
         if not buffer:
             return
+        event_payload = _dumps(
+            {
+                "stream": stream,
+                "topic": self._config.resolve_topic(stream),
+                "updates": buffer,
+            }
+        )
         rows = [
             {
                 "timestamp": datetime.now(timezone.utc),
                 "agent_id": self._config.agent_id,
                 "event_type": self._config.resolve_event(stream),
                 "run_id": self._config.run_id,
-                "payload_json": json.dumps(
-                    {
-                        "stream": stream,
-                        "topic": self._config.resolve_topic(stream),
-                        "updates": buffer,
-                    },
-                    sort_keys=True,
-                    default=str,
-                ),
+                "payload_json": event_payload,
             }
         ]
 
@@ -348,15 +628,6 @@ class MCPStreamSubscriber:
         self._emitter.persist_events(rows, table_name=table_override)
 
         if self._bus_publisher is not None:
-            event_payload = json.dumps(
-                {
-                    "stream": stream,
-                    "topic": self._config.resolve_topic(stream),
-                    "updates": buffer,
-                },
-                sort_keys=True,
-                default=str,
-            )
             bus_event = {
                 "ts": self._now_ns(),
                 "agent_id": self._config.agent_id,
@@ -366,8 +637,6 @@ class MCPStreamSubscriber:
             }
             self._bus_publisher(bus_event)
 
-        self._buffers[stream] = []
-
     def flush(self) -> None:
         """Flush all buffered stream updates."""
 
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from threading import Lock
 from typing import Any, Mapping, Protocol, runtime_checkable
 
 from langchain_core.tools import BaseTool
@@ -51,15 +54,35 @@ def _tool_name(tool: ToolLike) -> str | None:
 
 
 def _deduplicate_tools(tools: Iterable[ToolLike]) -> list[ToolLike]:
-    seen: set[str] = set()
-    ordered: list[ToolLike] = []
+    # A single insertion-ordered dict keeps the first tool per name; anonymous
+    # tools get a unique sentinel key so they are all kept in their original slot.
+    unique: dict[object, ToolLike] = {}
+    setdefault = unique.setdefault
     for tool in tools:
-        name = _tool_name(tool)
-        if name is None or name not in seen:
-            if name:
-                seen.add(name)
-            ordered.append(tool)
-    return ordered
+        setdefault(_tool_name(tool) or object(), tool)
+    return list(unique.values())
+
+
+_ADAPTER_POOL_MAX_WORKERS = 8
+_adapter_pool: ThreadPoolExecutor | None = None
+_adapter_pool_lock = Lock()
+
+
+def _shared_adapter_pool() -> ThreadPoolExecutor:
+    """Return the process-wide pool used to build MCP tool adapters concurrently."""
+
+    global _adapter_pool
+    with _adapter_pool_lock:
+        if _adapter_pool is None:
+            _adapter_pool = ThreadPoolExecutor(
+                max_workers=_ADAPTER_POOL_MAX_WORKERS,
+                thread_name_prefix="deepagents-mcp-adapters",
+            )
+        return _adapter_pool
+
+
+def _materialize_mcp_tools(transport: MCPAdapterProvider) -> list[ToolLike]:
+    return [adapter.to_tool() for adapter in transport.build_tool_adapters()]
 
 
 class ToolCatalog(ToolProvider):
@@ -81,9 +104,14 @@ class ToolCatalog(ToolProvider):
 
     def get_tools(self) -> list[ToolLike]:
         tools: list[ToolLike] = list(self._local_provider.get_tools())
-        for transport in self._mcp_providers:
-            adapters = list(transport.build_tool_adapters())
-            tools.extend(adapter.to_tool() for adapter in adapters)
+        providers = list(self._mcp_providers)
+        if len(providers) > 1:
+            # Adapter construction compiles a model per tool; fan providers out so
+            # independent catalogs compile in parallel. ``map`` keeps provider order.
+            tools.extend(chain.from_iterable(_shared_adapter_pool().map(_materialize_mcp_tools, providers)))
+        else:
+            for transport in providers:
+                tools.extend(_materialize_mcp_tools(transport))
         return _deduplicate_tools(tools)
 
 
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import threading
 from dataclasses import dataclass
-from typing import Any, Iterable, Mapping, Protocol, Sequence
+from functools import lru_cache
+from typing import Any, Iterable, Literal, Mapping, Optional, Protocol, Sequence, Union, get_args, get_origin
 
-from pydantic import BaseModel, Field, ValidationError, create_model
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, create_model
 from langchain_core.tools import StructuredTool
 
 
@@ -38,6 +41,15 @@ class MCPToolSchema:
     metadata: Mapping[str, Any] | None = None
 
 
+_JSON_PRIMITIVE_TYPES: dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "object": dict[str, Any],
+}
+
+
 def _map_json_type(schema: Mapping[str, Any]) -> Any:
     """Translate a JSON schema primitive into a Python annotation."""
 
@@ -46,37 +58,53 @@ def _map_json_type(schema: Mapping[str, Any]) -> Any:
         # Handle nullable schemas expressed as ["null", "type"]
         non_null_types = [t for t in schema_type if t != "null"]
         if len(non_null_types) == 1:
-            from typing import Optional
-
             base = _map_json_type({"type": non_null_types[0], **{k: v for k, v in schema.items() if k != "type"}})
             return Optional[base]
         schema_type = non_null_types[0] if non_null_types else None
 
     if "enum" in schema:
-        from typing import Literal
-
         enum_values = schema["enum"]
         if isinstance(enum_values, Sequence) and enum_values:
             return Literal[tuple(enum_values)]  # type: ignore[arg-type]
 
-    if schema_type == "string":
-        return str
-    if schema_type == "integer":
-        return int
-    if schema_type == "number":
-        return float
-    if schema_type == "boolean":
-        return bool
+    mapped = _JSON_PRIMITIVE_TYPES.get(schema_type) if isinstance(schema_type, str) else None
+    if mapped is not None:
+        return mapped
     if schema_type == "array":
         item_schema = schema.get("items", {})
         item_type = _map_json_type(item_schema) if item_schema else Any
         return list[item_type]  # type: ignore[valid-type]
-    if schema_type == "object":
-        return dict[str, Any]
     return Any
 
 
+def _schema_cache_key(schema: Mapping[str, Any]) -> str | None:
+    """Return a canonical JSON key for ``schema`` or ``None`` when it is not JSON-serializable."""
+
+    try:
+        return json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _build_cached_model(name: str, schema_key: str) -> type[BaseModel]:
+    return _compile_model_from_schema(name, json.loads(schema_key))
+
+
 def _build_model_from_schema(name: str, schema: Mapping[str, Any]) -> type[BaseModel]:
+    """Return a Pydantic model mirroring ``schema``, reusing previously compiled models.
+
+    Adapter sets are rebuilt whenever a catalog is queried, so identical
+    ``(name, schema)`` pairs share one model class instead of recompiling it.
+    """
+
+    schema_key = _schema_cache_key(schema)
+    if schema_key is None:
+        return _compile_model_from_schema(name, schema)
+    return _build_cached_model(name, schema_key)
+
+
+def _compile_model_from_schema(name: str, schema: Mapping[str, Any]) -> type[BaseModel]:
     """Create a Pydantic model mirroring the provided JSON schema."""
 
     if schema.get("type", "object") != "object":
@@ -84,20 +112,20 @@ def _build_model_from_schema(name: str, schema: Mapping[str, Any]) -> type[BaseM
         return create_model(name, __base__=BaseModel, payload=(dict[str, Any], ...))
 
     properties: Mapping[str, JSONType] = schema.get("properties", {})
-    required_fields = set(schema.get("required", []))
-    field_definitions: dict[str, tuple[Any, Any]] = {}
-
-    for prop, prop_schema in properties.items():
-        annotation = _map_json_type(prop_schema)
-        description = prop_schema.get("description")
-        default = prop_schema.get("default")
-        if prop in required_fields and default is None:
-            field_definitions[prop] = (annotation, Field(..., description=description))
-        else:
-            field_definitions[prop] = (
-                annotation,
-                Field(default, description=description),
-            )
+    required_fields = frozenset(schema.get("required", ()))
+    field = Field
+    map_type = _map_json_type
+    # Required properties without a default become ``...`` (required) fields.
+    field_definitions: dict[str, tuple[Any, Any]] = {
+        prop: (
+            map_type(prop_schema),
+            field(
+                ... if prop in required_fields and prop_schema.get("default") is None else prop_schema.get("default"),
+                description=prop_schema.get("description"),
+            ),
+        )
+        for prop, prop_schema in properties.items()
+    }
 
     additional_props = schema.get("additionalProperties", False)
     if additional_props:
@@ -116,8 +144,127 @@ def _build_model_from_schema(name: str, schema: Mapping[str, Any]) -> type[BaseM
     return model
 
 
+_PRIMITIVE_ANNOTATIONS: tuple[Any, ...] = (str, int, float, bool)
+
+# (field name, validator, required, default) for each argument of a primitive-only model.
+_FieldPlan = tuple[str, TypeAdapter[Any], bool, Any]
+
+
+def _is_primitive_annotation(annotation: Any) -> bool:
+    if annotation in _PRIMITIVE_ANNOTATIONS:
+        return True
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return True
+    if origin is Union:
+        return all(arg is type(None) or _is_primitive_annotation(arg) for arg in get_args(annotation))
+    return False
+
+
+@lru_cache(maxsize=256)
+def _type_adapter(annotation: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(annotation)
+
+
+def _primitive_field_plan(model: type[BaseModel]) -> tuple[_FieldPlan, ...] | None:
+    """Return per-field validators when every field of ``model`` is a primitive.
+
+    Such models can be coerced field by field without instantiating the model
+    and dumping it back to a dict; ``None`` signals the full model path is needed.
+    """
+
+    plan: list[_FieldPlan] = []
+    for name, info in model.model_fields.items():
+        if not _is_primitive_annotation(info.annotation):
+            return None
+        plan.append((name, _type_adapter(info.annotation), info.is_required(), info.default))
+    return tuple(plan)
+
+
+_CONSTRAINT_KEYWORDS = frozenset(
+    {
+        "const",
+        "enum",
+        "exclusiveMaximum",
+        "exclusiveMinimum",
+        "format",
+        "maxItems",
+        "maxLength",
+        "maxProperties",
+        "maximum",
+        "minItems",
+        "minLength",
+        "minProperties",
+        "minimum",
+        "multipleOf",
+        "pattern",
+        "required",
+        "uniqueItems",
+    }
+)
+
+
+def _has_constraint(schema: Any) -> bool:
+    """Return ``True`` when ``schema`` (or any nested schema) restricts values beyond their shape."""
+
+    if not isinstance(schema, Mapping):
+        return False
+    if not _CONSTRAINT_KEYWORDS.isdisjoint(schema):
+        return True
+    properties = schema.get("properties")
+    if isinstance(properties, Mapping) and any(_has_constraint(child) for child in properties.values()):
+        return True
+    return _has_constraint(schema.get("items"))
+
+
+def _output_needs_validation(schema: Mapping[str, Any] | None) -> bool:
+    """Decide whether tool results must round-trip through the output model.
+
+    Purely structural object schemas (no required fields, no value constraints)
+    cannot reject a result, so results are forwarded untouched.
+    """
+
+    if not schema:
+        return False
+    if schema.get("type", "object") != "object":
+        return True
+    return _has_constraint(schema)
+
+
+_SYNC_LOOP: asyncio.AbstractEventLoop | None = None
+_SYNC_LOOP_LOCK = threading.Lock()
+
+
+def _ensure_sync_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop used to run async-only MCP clients synchronously.
+
+    The loop is created lazily on first use and runs forever on a daemon thread,
+    so sync tool calls neither pay for a fresh loop nor clash with a caller's
+    already-running loop.
+    """
+
+    global _SYNC_LOOP
+    loop = _SYNC_LOOP
+    if loop is not None:
+        return loop
+    with _SYNC_LOOP_LOCK:
+        if _SYNC_LOOP is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="mcp-tool-sync-loop", daemon=True)
+            thread.start()
+            _SYNC_LOOP = loop
+        return _SYNC_LOOP
+
+
 class MCPToolAdapter:
-    """Bridge between MCP tool schemas and LangChain-compatible tools."""
+    """Bridge between MCP tool schemas and LangChain-compatible tools.
+
+    Results are validated against the output schema only when it can reject
+    something: required fields, value constraints or a non-object type. For a
+    purely structural object schema, mapping results are forwarded unchanged,
+    so property ``type`` declarations are not enforced or coerced; results that
+    are not mappings are still validated and rejected.
+    """
 
     def __init__(
         self,
@@ -141,6 +288,8 @@ class MCPToolAdapter:
             if schema.output_schema
             else None
         )
+        self._input_plan = _primitive_field_plan(self._args_model)
+        self._validate_output = self._output_model is not None and _output_needs_validation(schema.output_schema)
 
     @property
     def tool_name(self) -> str:
@@ -149,6 +298,8 @@ class MCPToolAdapter:
         return f"{self._server_name}:{self._schema.name}"
 
     def _coerce_input(self, payload: Mapping[str, Any]) -> Mapping[str, Any]:
+        if self._input_plan is not None:
+            return self._coerce_primitive_input(self._input_plan, payload)
         try:
             model = self._args_model(**payload)
         except ValidationError as exc:  # pragma: no cover - defensive branch
@@ -157,9 +308,29 @@ class MCPToolAdapter:
         data.pop("__root__extras", None)
         return data
 
+    def _coerce_primitive_input(self, plan: tuple[_FieldPlan, ...], payload: Mapping[str, Any]) -> Mapping[str, Any]:
+        # Mirrors ``model(**payload).model_dump(exclude_none=True)``: unknown keys are
+        # ignored, defaults fill absent optional fields and ``None`` values are dropped.
+        data: dict[str, Any] = {}
+        for name, adapter, required, default in plan:
+            if name in payload:
+                try:
+                    value = adapter.validate_python(payload[name])
+                except ValidationError as exc:
+                    raise ValueError(f"Invalid arguments for tool '{self.tool_name}': {exc}") from exc
+            elif required:
+                raise ValueError(f"Invalid arguments for tool '{self.tool_name}': missing required argument '{name}'")
+            else:
+                value = default
+            if value is not None:
+                data[name] = value
+        return data
+
     def _coerce_output(self, result: Any) -> Any:
         if self._output_model is None:
             return result
+        if not self._validate_output and isinstance(result, Mapping):
+            return result
         try:
             model = self._output_model.model_validate(result)
         except ValidationError as exc:
@@ -176,19 +347,15 @@ class MCPToolAdapter:
                 arguments=arguments,
             )
 
-        async def _runner() -> Any:
-            return await self._client.call_tool(
+        future = asyncio.run_coroutine_threadsafe(
+            self._client.call_tool(
                 self._server_name,
                 self._schema.name,
                 arguments=arguments,
-            )
-
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            return asyncio.run(_runner())
-        else:  # pragma: no cover - exercised in async contexts at runtime
-            return loop.run_until_complete(_runner())
+            ),
+            _ensure_sync_loop(),
+        )
+        return future.result()
 
     def _call_async(self, arguments: Mapping[str, Any]) -> Any:
         return self._client.call_tool(
@@ -10,10 +10,16 @@ for tests) and production-grade backends such as Deephaven.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from queue import Empty, Queue
-from threading import Lock
-from typing import Any, Callable, Iterable, Mapping, Protocol
+import asyncio
+import math
+from collections import deque
+from functools import lru_cache
+from queue import Empty, Full, Queue, SimpleQueue
+from threading import Condition, Event, Lock
+from typing import Any, AsyncIterator, Callable, Iterable, Literal, Mapping, Protocol, Sequence
+
+OverflowPolicy = Literal["block", "drop_newest", "drop_oldest"]
+_OVERFLOW_POLICIES: tuple[OverflowPolicy, ...] = ("block", "drop_newest", "drop_oldest")
 
 
 class TransportError(RuntimeError):
@@ -33,6 +39,12 @@ class MessageTransport(Protocol):
     def publish_message(self, message: Mapping[str, Any]) -> None:
         """Publish a routed message to the transport."""
 
+    def publish_messages_batch(self, messages: Sequence[Mapping[str, Any]]) -> None:
+        """Publish several routed messages; transports may override to batch the work."""
+
+        for message in messages:
+            self.publish_message(message)
+
     def publish_event(self, event: Mapping[str, Any]) -> None:
         """Emit a lifecycle event describing work performed by the agent."""
 
@@ -46,27 +58,61 @@ class MessageTransport(Protocol):
         """Dispose of the transport and release held resources."""
 
 
-@dataclass(slots=True)
-class _QueueWatcher:
-    """Internal helper representing a queue tied to a subscription filter."""
+# A subscription's filter predicate paired with its queue's bound ``put_nowait``.
+_QueueWatcher = tuple[Callable[[Mapping[str, Any]], bool], Callable[[Mapping[str, Any]], None]]
+
+
+class _DropOldestQueue:
+    """Bounded FIFO that discards its oldest entry instead of blocking producers."""
+
+    __slots__ = ("_items", "_ready")
+
+    def __init__(self, maxsize: int) -> None:
+        self._items: deque[Mapping[str, Any]] = deque(maxlen=maxsize)
+        self._ready = Condition(Lock())
+
+    def put_nowait(self, item: Mapping[str, Any]) -> None:
+        with self._ready:
+            self._items.append(item)
+            self._ready.notify()
 
-    queue: Queue[Mapping[str, Any]]
-    filter_predicate: Callable[[Mapping[str, Any]], bool]
+    def get(self, timeout: float | None = None) -> Mapping[str, Any]:
+        with self._ready:
+            if not self._ready.wait_for(self._items.__len__, timeout):
+                raise Empty
+            return self._items.popleft()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+
+class _ClosedQueue:
+    """Stand-in queue installed on closed subscriptions so ``get`` needs no flag check."""
+
+    def get(self, timeout: float | None = None) -> Mapping[str, Any]:
+        raise TransportError("Subscription already closed")
 
-    def push(self, message: Mapping[str, Any]) -> None:
-        """Push a message onto the queue when it passes the predicate."""
 
-        if self.filter_predicate(message):
-            self.queue.put(message)
+_CLOSED_QUEUE = _ClosedQueue()
 
 
 class TransportSubscription:
-    """A context-managed wrapper around a subscription queue."""
+    """A context-managed wrapper around a subscription queue.
+
+    Subscriptions backed by an :class:`asyncio.Queue` are consumed with
+    :meth:`aget` or ``async for`` without tying up a thread per subscriber;
+    every other subscription is consumed with :meth:`get` or ``for``.
+    """
+
+    __slots__ = ("_on_close", "_queue")
 
-    def __init__(self, queue: Queue[Mapping[str, Any]], on_close: Callable[[], None] | None = None) -> None:
+    def __init__(
+        self,
+        queue: SimpleQueue[Mapping[str, Any]] | asyncio.Queue[Mapping[str, Any]],
+        on_close: Callable[[], None] | None = None,
+    ) -> None:
         self._queue = queue
         self._on_close = on_close
-        self._closed = False
 
     def __enter__(self) -> "TransportSubscription":
         return self
@@ -74,36 +120,123 @@ class TransportSubscription:
     def __exit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - standard context protocol
         self.close()
 
+    async def __aenter__(self) -> "TransportSubscription":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - standard context protocol
+        self.close()
+
     def __iter__(self) -> Iterable[Mapping[str, Any]]:
         while True:
             yield self.get()
 
+    async def __aiter__(self) -> AsyncIterator[Mapping[str, Any]]:
+        while True:
+            yield await self.aget()
+
     def get(self, timeout: float | None = None) -> Mapping[str, Any]:
-        """Retrieve the next message, optionally waiting up to ``timeout`` seconds."""
+        """Retrieve the next message, optionally waiting up to ``timeout`` seconds.
+
+        Raises:
+            TransportError: If the subscription is closed or is bound to an event
+                loop, in which case it must be consumed with :meth:`aget`.
+        """
 
-        if self._closed:
-            raise TransportError("Subscription already closed")
+        queue = self._queue
+        if isinstance(queue, asyncio.Queue):
+            msg = "Async subscriptions must be consumed with aget() or 'async for'"
+            raise TransportError(msg)
         try:
-            return self._queue.get(timeout=timeout)
+            return queue.get(timeout=timeout)
         except Empty as exc:  # pragma: no cover - exercised indirectly in tests
             msg = "Timed out waiting for a message"
             raise TimeoutError(msg) from exc
 
+    async def aget(self, timeout: float | None = None) -> Mapping[str, Any]:
+        """Await the next message, optionally waiting up to ``timeout`` seconds.
+
+        Raises:
+            TransportError: If the subscription is closed or is not bound to an
+                event loop. A worker thread blocked in :meth:`get` could not be
+                cancelled and would swallow the next message after a timeout.
+        """
+
+        queue = self._queue
+        if queue is _CLOSED_QUEUE:
+            return queue.get()
+        if not isinstance(queue, asyncio.Queue):
+            msg = "Synchronous subscriptions must be consumed with get() or 'for'; use an async subscription"
+            raise TransportError(msg)
+        try:
+            return await asyncio.wait_for(queue.get(), timeout)
+        except TimeoutError as exc:
+            msg = "Timed out waiting for a message"
+            raise TimeoutError(msg) from exc
+
     def close(self) -> None:
         """Close the subscription and notify the transport."""
 
-        if self._closed:
+        if self._queue is _CLOSED_QUEUE:
             return
-        self._closed = True
+        self._queue = _CLOSED_QUEUE
         if self._on_close is not None:
             self._on_close()
 
 
+def _match_all(message: Mapping[str, Any]) -> bool:
+    return True
+
+
+def _is_literal(value: Any) -> bool:
+    """Return ``True`` when ``repr(value)`` evaluates back to an equal constant."""
+
+    kind = type(value)
+    if kind is float:
+        return math.isfinite(value)
+    return kind is str or kind is int or kind is bool or value is None
+
+
+@lru_cache(maxsize=256)
+def _compile_filter_predicate(items: tuple[tuple[str, Any], ...]) -> Callable[[Mapping[str, Any]], bool]:
+    """Generate a single-expression predicate comparing each filter item inline.
+
+    ``None`` and plain ``str``/``int``/``bool``/finite ``float`` items are rendered
+    as literals so they compile to constants. Anything else is bound through the
+    evaluation namespace rather than rendered with ``repr``, so arbitrary values
+    compare exactly as they do in the generic loop.
+    """
+
+    namespace: dict[str, Any] = {}
+    clauses = []
+    for index, (key, expected) in enumerate(items):
+        if _is_literal(key):
+            key_source = repr(key)
+        else:
+            key_source = f"k{index}"
+            namespace[key_source] = key
+        if _is_literal(expected):
+            expected_source = repr(expected)
+        else:
+            expected_source = f"v{index}"
+            namespace[expected_source] = expected
+        clauses.append(f"m.get({key_source}) == {expected_source}")
+    return eval("lambda m: " + " and ".join(clauses), namespace)  # noqa: S307 - source built from fixed templates
+
+
 def build_filter_predicate(filters: Mapping[str, Any] | None) -> Callable[[Mapping[str, Any]], bool]:
-    """Create a predicate function for filtering routed messages."""
+    """Create a predicate function for filtering routed messages.
+
+    Hashable filters compile to a cached, specialised predicate shared by every
+    subscription using the same filters; unhashable values fall back to a loop.
+    """
 
     if not filters:
-        return lambda message: True
+        return _match_all
+
+    try:
+        return _compile_filter_predicate(tuple(sorted(filters.items())))
+    except TypeError:
+        pass
 
     def _predicate(message: Mapping[str, Any]) -> bool:
         for key, expected in filters.items():
@@ -114,49 +247,178 @@ def build_filter_predicate(filters: Mapping[str, Any] | None) -> Callable[[Mappi
     return _predicate
 
 
+# How often a publisher blocked on a full subscription re-checks whether it was closed.
+_BLOCKED_PUT_POLL_S = 0.05
+
+
+def _bounded_queue(
+    maxsize: int, policy: OverflowPolicy, closed: Event
+) -> tuple[Any, Callable[[Mapping[str, Any]], Any], Callable[[Mapping[str, Any]], Any]]:
+    """Return ``(queue, put, offer)`` for a bounded subscription; ``offer`` never blocks.
+
+    A blocking ``put`` gives up, dropping its message, once ``closed`` is set.
+    """
+
+    if policy == "drop_oldest":
+        ring = _DropOldestQueue(maxsize)
+        return ring, ring.put_nowait, ring.put_nowait
+
+    queue: Queue[Mapping[str, Any]] = Queue(maxsize)
+    put_nowait = queue.put_nowait
+
+    def _offer(message: Mapping[str, Any]) -> None:
+        try:
+            put_nowait(message)
+        except Full:
+            pass
+
+    if policy != "block":
+        return queue, _offer, _offer
+
+    put = queue.put
+
+    def _put_until_closed(message: Mapping[str, Any]) -> None:
+        while not closed.is_set():
+            try:
+                put(message, timeout=_BLOCKED_PUT_POLL_S)
+            except Full:
+                continue
+            return
+
+    return queue, _put_until_closed, _offer
+
+
 class QueueBackedTransport(MessageTransport):
-    """Utility base class for transports that multiplex onto in-memory queues."""
+    """Utility base class for transports that multiplex onto in-memory queues.
+
+    Subscriptions are registered in identity-keyed dictionaries so removal is a
+    single ``pop``. Broadcasting reads immutable tuple snapshots of those
+    registries, rebuilt under the lock on every change, so it never locks or
+    copies. Unfiltered subscriptions only keep their queue's ``put`` and skip
+    the predicate call entirely.
+    """
 
     def __init__(self) -> None:
         self._lock = Lock()
-        self._watchers: list[_QueueWatcher] = []
+        self._filtered: dict[int, _QueueWatcher] = {}
+        self._unfiltered: dict[int, Callable[[Mapping[str, Any]], None]] = {}
+        self._watchers: tuple[_QueueWatcher, ...] = ()
+        self._unfiltered_puts: tuple[Callable[[Mapping[str, Any]], None], ...] = ()
+
+    def _refresh_watchers_locked(self) -> None:
+        self._watchers = tuple(self._filtered.values())
+        self._unfiltered_puts = tuple(self._unfiltered.values())
 
     def _broadcast(self, message: Mapping[str, Any]) -> None:
-        with self._lock:
-            watchers_snapshot = list(self._watchers)
-        for watcher in watchers_snapshot:
-            watcher.push(message)
+        for put in self._unfiltered_puts:
+            put(message)
+        for predicate, put in self._watchers:
+            if predicate(message):
+                put(message)
+
+    def _broadcast_many(self, messages: Sequence[Mapping[str, Any]]) -> None:
+        unfiltered_puts = self._unfiltered_puts
+        watchers = self._watchers
+        if not unfiltered_puts and not watchers:
+            return
+        for message in messages:
+            for put in unfiltered_puts:
+                put(message)
+            for predicate, put in watchers:
+                if predicate(message):
+                    put(message)
 
     def _create_subscription(
         self,
         *,
         filters: Mapping[str, Any] | None = None,
-        on_close: Callable[[Queue[Mapping[str, Any]]], None] | None = None,
+        on_close: Callable[[Any], None] | None = None,
         replay: Iterable[Mapping[str, Any]] | None = None,
+        async_mode: bool = False,
+        maxsize: int = 0,
+        policy: OverflowPolicy = "block",
     ) -> TransportSubscription:
-        queue: Queue[Mapping[str, Any]] = Queue()
+        """Register a watcher and return its subscription.
+
+        With ``async_mode`` the subscription is backed by an :class:`asyncio.Queue`
+        bound to the running event loop, and publishers hand messages over with
+        ``call_soon_threadsafe``.
+
+        A positive ``maxsize`` bounds the queue of a slow consumer. ``policy``
+        decides what publishers do when it is full: ``"block"`` waits for room
+        or until the subscription is closed, ``"drop_newest"`` discards the
+        incoming message and ``"drop_oldest"`` evicts the oldest queued one.
+        Replayed history never blocks; it is subject to the same bound.
+
+        Raises:
+            ValueError: If ``policy`` is unknown or a bounded queue is requested in
+                ``async_mode``.
+        """
+
+        if policy not in _OVERFLOW_POLICIES:
+            msg = f"Unknown overflow policy {policy!r}; expected one of {', '.join(_OVERFLOW_POLICIES)}"
+            raise ValueError(msg)
+        if maxsize > 0 and async_mode:
+            msg = "Bounded subscriptions are not supported in async mode"
+            raise ValueError(msg)
+
+        queue: SimpleQueue[Mapping[str, Any]] | Queue[Mapping[str, Any]] | _DropOldestQueue | asyncio.Queue[Mapping[str, Any]]
+        put: Callable[[Mapping[str, Any]], Any]
+        closed = Event()
+        if maxsize > 0:
+            queue, put, offer = _bounded_queue(maxsize, policy, closed)
+        elif async_mode:
+            loop = asyncio.get_running_loop()
+            queue = asyncio.Queue()
+            enqueue = queue.put_nowait
+
+            def put(message: Mapping[str, Any]) -> None:
+                try:
+                    loop.call_soon_threadsafe(enqueue, message)
+                except RuntimeError:
+                    # The subscribing loop is closed: drop the dead watcher instead of
+                    # failing the publisher and starving the remaining watchers.
+                    _unregister()
+
+        else:
+            queue = SimpleQueue()
+            put = queue.put_nowait
+        if maxsize <= 0:
+            offer = put
         predicate = build_filter_predicate(filters)
-        watcher = _QueueWatcher(queue=queue, filter_predicate=predicate)
+        key = id(queue)
 
-        def _remove() -> None:
+        def _unregister() -> None:
             with self._lock:
-                if watcher in self._watchers:
-                    self._watchers.remove(watcher)
+                self._filtered.pop(key, None)
+                self._unfiltered.pop(key, None)
+                self._refresh_watchers_locked()
+
+        def _remove() -> None:
+            closed.set()
+            _unregister()
             if on_close is not None:
                 on_close(queue)
 
         with self._lock:
-            self._watchers.append(watcher)
+            if filters:
+                self._filtered[key] = (predicate, put)
+            else:
+                self._unfiltered[key] = put
+            self._refresh_watchers_locked()
 
         subscription = TransportSubscription(queue, on_close=_remove)
 
         if replay is not None:
-            for message in replay:
-                if predicate(message):
-                    queue.put(dict(message))
+            # Replayed history is copied so subscribers cannot mutate the transport's
+            # record; CPython's dict free list already recycles these allocations.
+            for message in filter(predicate, replay):
+                offer(dict(message))
 
         return subscription
 
     def close(self) -> None:  # pragma: no cover - default noop, overridable
         with self._lock:
-            self._watchers.clear()
+            self._filtered.clear()
+            self._unfiltered.clear()
+            self._refresh_watchers_locked()
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
-from queue import Queue
-from typing import Any, Callable, Mapping, Protocol
+from queue import SimpleQueue
+from threading import Lock, Timer
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Protocol, Sequence
 
 from deepagents.transports.base import MessageTransport, TransportSubscription, build_filter_predicate
 
+LOGGER = logging.getLogger(__name__)
+
 
 class DeephavenSubscription(Protocol):
     """Protocol describing the handle returned by Deephaven subscriptions."""
@@ -20,7 +25,11 @@ class DeephavenSession(Protocol):
     """Subset of ``pydeephaven.Session`` leveraged by the transport."""
 
     def publish(self, table: str, data: Mapping[str, Any]) -> None:
-        """Append a single row to ``table``."""
+        """Append a single row to ``table``.
+
+        Sessions may additionally expose ``publish_many(table, rows)`` to append
+        several rows in one call; the transport uses it for batched publishes.
+        """
 
     def subscribe(
         self,
@@ -29,7 +38,21 @@ class DeephavenSession(Protocol):
         *,
         where: Mapping[str, Any] | None = None,
     ) -> DeephavenSubscription:
-        """Subscribe to updates on ``table`` and return a disposable handle."""
+        """Subscribe to updates on ``table`` and return a disposable handle.
+
+        Rows are only delivered to ``callback`` when they equal every value in
+        ``where``. Each delivered mapping is owned by the callback; sessions that
+        reuse row buffers must be paired with ``copy_on_deliver=True``.
+        """
+
+
+_SCALAR_FILTER_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_pushdown_filter(filters: Mapping[str, Any] | None) -> bool:
+    """Return ``True`` when the session's ``where=`` clause fully enforces ``filters``."""
+
+    return not filters or all(isinstance(value, _SCALAR_FILTER_TYPES) for value in filters.values())
 
 
 @dataclass(slots=True)
@@ -42,48 +65,154 @@ class DeephavenTables:
 
 
 class DeephavenTransport(MessageTransport):
-    """Transport that persists data to Deephaven tables."""
+    """Transport that persists data to Deephaven tables.
 
-    def __init__(self, *, session: DeephavenSession, tables: DeephavenTables | None = None) -> None:
+    Delivered rows are handed to subscribers as-is. Pass ``copy_on_deliver=True``
+    when the session reuses its row mappings to receive read-only snapshots instead.
+
+    With ``publish_batch_size`` above one, published messages are buffered and
+    written through :meth:`publish_messages_batch` once the buffer is full or,
+    when ``flush_interval_ms`` is set, once the oldest buffered message is that
+    old: a timer armed by the first buffered message flushes the buffer even if
+    no further publish arrives. :meth:`flush` and :meth:`close` write any
+    remainder. Messages are copied when buffered, and a batch whose write fails
+    is kept ahead of newer messages for the next flush.
+    """
+
+    def __init__(
+        self,
+        *,
+        session: DeephavenSession,
+        tables: DeephavenTables | None = None,
+        copy_on_deliver: bool = False,
+        publish_batch_size: int = 1,
+        flush_interval_ms: float | None = None,
+    ) -> None:
         self._session = session
         self._tables = tables or DeephavenTables()
-        self._subscriptions: list[TransportSubscription] = []
+        self._messages_table = self._tables.messages
+        self._events_table = self._tables.events
+        self._metrics_table = self._tables.metrics
+        self._copy_on_deliver = copy_on_deliver
+        self._subscriptions: dict[int, TransportSubscription] = {}
+        self._publish_batch_size = publish_batch_size
+        self._flush_interval_s = flush_interval_ms / 1000 if flush_interval_ms is not None else None
+        self._pending_messages: list[Mapping[str, Any]] = []
+        self._pending_lock = Lock()
+        self._flush_timer: Timer | None = None
 
     def publish_message(self, message: Mapping[str, Any]) -> None:
-        self._session.publish(self._tables.messages, message)
+        if self._publish_batch_size <= 1:
+            self._session.publish(self._messages_table, message)
+            return
+        with self._pending_lock:
+            pending = self._pending_messages
+            if not pending:
+                self._arm_flush_timer()
+            pending.append(dict(message))
+            if len(pending) < self._publish_batch_size:
+                return
+            self._pending_messages = []
+            timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+        self._publish_pending(pending)
+
+    def flush(self) -> None:
+        """Write any buffered messages to the messages table."""
+
+        with self._pending_lock:
+            pending, self._pending_messages = self._pending_messages, []
+            timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+        if pending:
+            self._publish_pending(pending)
+
+    def _publish_pending(self, pending: list[Mapping[str, Any]]) -> None:
+        try:
+            self.publish_messages_batch(pending)
+        except Exception:
+            self._restore_pending(pending)
+            raise
+
+    def _restore_pending(self, pending: list[Mapping[str, Any]]) -> None:
+        """Put an unsent batch back ahead of anything buffered since it was taken."""
+
+        with self._pending_lock:
+            self._pending_messages = pending + self._pending_messages
+            if self._flush_timer is None:
+                self._arm_flush_timer()
+
+    def _arm_flush_timer(self) -> None:
+        # Callers hold ``_pending_lock``.
+        if self._flush_interval_s is None:
+            return
+        timer = Timer(self._flush_interval_s, self._flush_on_timer)
+        timer.daemon = True
+        self._flush_timer = timer
+        timer.start()
+
+    def _flush_on_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            LOGGER.warning("Timed flush of buffered Deephaven messages failed", exc_info=True)
+
+    def publish_messages_batch(self, messages: Sequence[Mapping[str, Any]]) -> None:
+        publish_many = getattr(self._session, "publish_many", None)
+        if callable(publish_many):
+            publish_many(self._messages_table, messages)
+            return
+        for message in messages:
+            self._session.publish(self._messages_table, message)
 
     def publish_event(self, event: Mapping[str, Any]) -> None:
-        self._session.publish(self._tables.events, event)
+        self._session.publish(self._events_table, event)
 
     def publish_metrics(self, metrics: Mapping[str, Any]) -> None:
-        self._session.publish(self._tables.metrics, metrics)
+        self._session.publish(self._metrics_table, metrics)
 
     def subscribe_messages(self, *, filters: Mapping[str, Any] | None = None) -> TransportSubscription:
-        predicate = build_filter_predicate(filters)
-        queue: Queue[Mapping[str, Any]] = Queue()
+        queue: SimpleQueue[Mapping[str, Any]] = SimpleQueue()
+        put: Callable[[Mapping[str, Any]], None]
+        if self._copy_on_deliver:
+
+            def _put_copy(message: Mapping[str, Any]) -> None:
+                queue.put(MappingProxyType(dict(message)))
+
+            put = _put_copy
+        else:
+            put = queue.put
+
+        if _is_pushdown_filter(filters):
+            # Scalar equality filters are applied by the session via ``where=``.
+            _callback = put
+        else:
+            predicate = build_filter_predicate(filters)
 
-        def _callback(message: Mapping[str, Any]) -> None:
-            if predicate(message):
-                queue.put(dict(message))
+            def _callback(message: Mapping[str, Any]) -> None:
+                if predicate(message):
+                    put(message)
 
         subscription_handle = self._session.subscribe(
-            self._tables.messages,
+            self._messages_table,
             _callback,
             where=filters,
         )
 
-        subscription: TransportSubscription | None = None
+        key = id(queue)
 
         def _on_close() -> None:
             subscription_handle.close()
-            if subscription is not None and subscription in self._subscriptions:
-                self._subscriptions.remove(subscription)
+            self._subscriptions.pop(key, None)
 
         subscription = TransportSubscription(queue, on_close=_on_close)
-        self._subscriptions.append(subscription)
+        self._subscriptions[key] = subscription
         return subscription
 
     def close(self) -> None:
-        for subscription in list(self._subscriptions):
+        self.flush()
+        for subscription in list(self._subscriptions.values()):
             subscription.close()
         self._subscriptions.clear()
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import json
 import logging
+import os
 import threading
 import time
-import uuid
+from binascii import hexlify
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
+from queue import Empty
 from typing import Any, Callable, Iterable, Mapping, MutableMapping, Sequence
 
 try:  # pragma: no cover - optional dependency at runtime
@@ -18,6 +24,11 @@ except Exception:  # pragma: no cover - fallback typing stubs when pydeephaven i
     Session = Any  # type: ignore[assignment]
     dh_table = None  # type: ignore[assignment]
 
+try:  # pragma: no cover - ticking listeners are only available in newer pydeephaven releases
+    from pydeephaven.table_listener import listen as dh_listen
+except Exception:  # pragma: no cover
+    dh_listen = None  # type: ignore[assignment]
+
 try:  # pragma: no cover - convert Deephaven tables to Arrow for polling
     import pyarrow as pa
 except Exception:  # pragma: no cover
@@ -30,15 +41,151 @@ except Exception:  # pragma: no cover
 
 LOGGER = logging.getLogger(__name__)
 
+# Busy polling subscriptions shorten their interval down to this floor.
+_MIN_POLL_INTERVAL_S = 0.05
+# How long a successful session liveness probe is trusted.
+_SESSION_ALIVE_TTL_NS = 1_000_000_000
+
+# Bus schema type names resolved to Deephaven column types once at import.
+_DH_COLUMN_TYPES = getattr(dh_table, "ColumnType", None)
+_COLUMN_TYPE_MAP: dict[str, Any] = {
+    name: column_type
+    for name, attribute in (("string", "STRING"), ("long", "LONG"), ("int", "INT32"), ("double", "DOUBLE"))
+    if (column_type := getattr(_DH_COLUMN_TYPES, attribute, None)) is not None
+}
+
+
+_encode_json_str = json.encoder.encode_basestring_ascii
+
+_ID_BYTES = 16
+_ID_POOL_BYTES = 4096
+_id_pool = threading.local()
+# A forked child must not replay the parent's remaining random bytes.
+os.register_at_fork(after_in_child=lambda: _id_pool.__dict__.clear())
+
+
+def _next_message_id() -> str:
+    """Return a random 128-bit hex id drawn from a per-thread ``os.urandom`` pool.
+
+    Matches the length and alphabet of ``uuid.uuid4().hex`` while amortising the
+    system call and skipping the ``UUID`` object.
+    """
+
+    buffer = getattr(_id_pool, "buffer", b"")
+    offset = getattr(_id_pool, "offset", 0)
+    if offset + _ID_BYTES > len(buffer):
+        buffer = _id_pool.buffer = os.urandom(_ID_POOL_BYTES)
+        offset = 0
+    _id_pool.offset = offset + _ID_BYTES
+    return hexlify(buffer[offset : offset + _ID_BYTES]).decode()
+
+
+_ARROW_TYPE_NAMES = {"string": "string", "long": "int64", "int": "int32", "double": "float64"}
+
+
+def _arrow_schema(schema: tuple[tuple[str, str], ...]) -> Any:
+    """Translate a bus table schema into a ``pyarrow.Schema``, or ``None`` without pyarrow."""
+
+    if pa is None:
+        return None
+    return pa.schema([(name, getattr(pa, _ARROW_TYPE_NAMES[column_type])()) for name, column_type in schema])
+
+
+def _rows_to_arrow(rows: Sequence[Mapping[str, Any]], column_names: tuple[str, ...], arrow_schema: Any) -> Any:
+    """Transpose row mappings into one Arrow table, a single pass per column."""
+
+    columns = {name: [row.get(name) for row in rows] for name in column_names}
+    return pa.Table.from_pydict(columns, schema=arrow_schema)
+
+
+def _encode_details(details: Mapping[str, Any] | None) -> str:
+    """Encode event details exactly as ``json.dumps`` would, skipping the encoder for flat payloads.
+
+    Bus events carry a handful of string, integer or null fields, which are
+    rendered directly; anything else goes through :func:`json.dumps`.
+    """
+
+    if not details:
+        return "{}"
+    parts = []
+    for key, value in details.items():
+        if type(key) is not str:
+            return json.dumps(details)
+        if type(value) is str:
+            encoded = _encode_json_str(value)
+        elif value is None:
+            encoded = "null"
+        elif type(value) is int:
+            encoded = str(value)
+        else:
+            return json.dumps(details)
+        parts.append(f"{_encode_json_str(key)}: {encoded}")
+    return "{" + ", ".join(parts) + "}"
+
+
+def _columns_to_rows(columns: Mapping[str, list[Any]]) -> list[dict[str, Any]]:
+    """Transpose a column mapping into mutable row dictionaries."""
+
+    names = tuple(columns)
+    values = columns.values()
+    if not names:
+        return []
+    if len(columns[names[0]]) == 1:
+        # Single-row lookups (claim/ack by id) skip the zip machinery entirely.
+        return [{name: column[0] for name, column in columns.items()}]
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+@lru_cache(maxsize=256)
+def _build_filter(
+    topic: str | None,
+    session_id: str | None,
+    agent_id: str | None,
+    statuses: tuple[str, ...],
+) -> str | None:
+    """Render a subscription filter; equal filters share one expression string.
+
+    ``statuses`` must be sorted so equivalent status sets hit the same entry.
+    """
+
+    filters: list[str] = []
+    if topic:
+        filters.append(f"topic == `{topic}`")
+    if session_id:
+        filters.append(f"session_id == `{session_id}`")
+    if agent_id:
+        filters.append(f"agent_id == `{agent_id}`")
+    if statuses:
+        status_clause = " || ".join(f"status == `{value}`" for value in statuses)
+        filters.append(f"({status_clause})")
+    return " && ".join(filters) if filters else None
+
 
 @dataclass(frozen=True)
 class _TableHandles:
-    """Cached table and input table handles."""
+    """Cached table and input table handles with their fixed column layouts."""
 
     messages_table: Any
     messages_input: Any
     events_input: Any
     metrics_input: Any
+    messages_columns: tuple[str, ...] = ()
+    events_columns: tuple[str, ...] = ()
+    metrics_columns: tuple[str, ...] = ()
+    messages_arrow_schema: Any = None
+    events_arrow_schema: Any = None
+    metrics_arrow_schema: Any = None
+
+    def arrow_layout(self, input_table: Any) -> tuple[tuple[str, ...], Any]:
+        """Return the column names and Arrow schema of one of these input tables."""
+
+        if input_table is self.messages_input:
+            return self.messages_columns, self.messages_arrow_schema
+        if input_table is self.events_input:
+            return self.events_columns, self.events_arrow_schema
+        if input_table is self.metrics_input:
+            return self.metrics_columns, self.metrics_arrow_schema
+        return (), None
 
 
 @dataclass(frozen=True)
@@ -56,10 +203,92 @@ class DeephavenBusConfig:
     reconnect_backoff: Sequence[float] = (0.25, 0.5, 1.0, 2.0, 5.0)
     max_reconnect_attempts: int | None = None
     poll_interval_s: float = 1.0
+    use_ticking_listener: bool = False
+    max_batch_rows: int = 256
+    max_flush_latency_ms: float = 5.0
+    local_claim_index: bool = False
+
+
+class _RowBatcher:
+    """Coalesce event and metric rows per input table on a background writer thread.
+
+    Rows are written once ``max_rows`` are pending or ``max_latency_s`` after the
+    first pending row, whichever comes first, with one ``add`` call per table.
+    Rows submitted with a ``key`` replace any pending row with the same key, so
+    only the latest version of an upserted row is written.
+    """
+
+    def __init__(self, write: Callable[[Any, Sequence[Mapping[str, Any]]], None], *, max_rows: int, max_latency_s: float) -> None:
+        self._write = write
+        self._max_rows = max_rows
+        self._max_latency_s = max_latency_s
+        self._ready = threading.Condition(threading.Lock())
+        self._write_lock = threading.Lock()
+        self._pending: dict[int, tuple[Any, list[Mapping[str, Any]], dict[Any, Mapping[str, Any]]]] = {}
+        self._pending_rows = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="deephaven-bus-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, input_table: Any, rows: Sequence[Mapping[str, Any]], *, key: Any = None) -> None:
+        with self._ready:
+            entry = self._pending.get(id(input_table))
+            if entry is None:
+                entry = self._pending[id(input_table)] = (input_table, [], {})
+            if key is None:
+                entry[1].extend(rows)
+                self._pending_rows += len(rows)
+            else:
+                keyed = entry[2]
+                self._pending_rows += len(rows) - (key in keyed)
+                keyed[key] = rows[-1]
+            self._ready.notify()
+
+    def flush(self) -> None:
+        """Write every pending row from the calling thread."""
+
+        with self._write_lock:
+            self._write_batches(self._swap())
+
+    def close(self) -> None:
+        with self._ready:
+            self._closed = True
+            self._ready.notify()
+        self._thread.join()
+        self.flush()
+
+    def _swap(self) -> list[tuple[Any, list[Mapping[str, Any]]]]:
+        with self._ready:
+            batches = [(input_table, [*rows, *keyed.values()]) for input_table, rows, keyed in self._pending.values()]
+            self._pending = {}
+            self._pending_rows = 0
+        return batches
+
+    def _run(self) -> None:
+        while True:
+            with self._ready:
+                self._ready.wait_for(lambda: self._pending_rows or self._closed)
+                if self._closed:
+                    return
+                self._ready.wait_for(lambda: self._pending_rows >= self._max_rows or self._closed, self._max_latency_s)
+            self.flush()
+
+    def _write_batches(self, batches: list[tuple[Any, list[Mapping[str, Any]]]]) -> None:
+        for input_table, rows in batches:
+            try:
+                self._write(input_table, rows)
+            except Exception:  # pragma: no cover - keep the writer alive on sink failures
+                LOGGER.exception("Failed to write %d buffered Deephaven rows", len(rows))
 
 
 class DeephavenSubscription:
-    """Subscription handle that continuously polls Deephaven for updates."""
+    """Subscription handle that delivers Deephaven message updates.
+
+    When ``use_ticking_listener`` is enabled and the installed pydeephaven
+    supports table listeners, rows are pushed as they are added. Otherwise a
+    background thread polls for rows newer than the last ingest watermark,
+    halving its interval whenever rows arrive and doubling it while idle.
+    """
 
     def __init__(
         self,
@@ -73,45 +302,126 @@ class DeephavenSubscription:
         self._bus = bus
         self._filter_expr = filter_expr
         self._callback = callback
-        self._poll_interval = poll_interval_s or bus.config.poll_interval_s
-        from queue import Queue
-
-        self._queue: "Queue[dict[str, Any]]" = Queue(maxsize=queue_size)
+        poll_interval = poll_interval_s or bus.config.poll_interval_s
+        self._poll_interval = poll_interval
+        self._min_poll_interval = min(_MIN_POLL_INTERVAL_S, poll_interval)
+        self._max_poll_interval = max(1.0, poll_interval * 4)
+        # Lock-free hand-off: deque appends and pops are atomic and the event only
+        # wakes a waiting consumer. A bounded subscription drops its oldest messages.
+        self._messages: deque[dict[str, Any]] = deque(maxlen=queue_size or None)
+        self._not_empty = threading.Event()
+        # Event loop and event of the latest ``aget`` caller, woken thread-safely on delivery.
+        self._async_waiter: tuple[asyncio.AbstractEventLoop, asyncio.Event] | None = None
         self._stop_event = threading.Event()
-        self._thread = threading.Thread(target=self._run, daemon=True)
         self._last_ingest_ns: int | None = None
-        self._thread.start()
+        self._view: Any = None
+        self._view_generation = -1
+        self._listener: Any = None
+        self._thread: threading.Thread | None = None
+        if bus.config.use_ticking_listener:
+            self._listener = bus._register_listener(filter_expr, self._deliver)
+        if self._listener is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
 
     def _run(self) -> None:
         while not self._stop_event.is_set():
             try:
-                messages = self._bus._fetch_messages(self._filter_expr, self._last_ingest_ns)
+                messages, self._last_ingest_ns = self._bus._poll_messages(self._last_ingest_ns, self._filtered_view())
                 if messages:
-                    self._last_ingest_ns = max(msg.get("ingest_ts", 0) or 0 for msg in messages) or self._last_ingest_ns
-                    if self._callback:
-                        try:
-                            self._callback(messages)
-                        except Exception:  # pragma: no cover - user callback failure
-                            LOGGER.exception("Deephaven subscription callback raised an exception")
-                    else:
-                        for msg in messages:
-                            self._queue.put(msg)
+                    self._poll_interval = max(self._min_poll_interval, self._poll_interval * 0.5)
+                    self._deliver(messages)
+                else:
+                    self._poll_interval = min(self._max_poll_interval, self._poll_interval * 2)
             except Exception:  # pragma: no cover - avoid crashing the subscription loop
                 LOGGER.exception("Failed to poll Deephaven subscription")
             self._stop_event.wait(self._poll_interval)
 
+    def _filtered_view(self) -> Any:
+        """Reuse the filtered messages view until the bus rebuilds its table handles."""
+
+        self._bus._ensure_tables()
+        if self._view is None or self._view_generation != self._bus._tables_generation:
+            self._view, self._view_generation = self._bus._filtered_messages_view(self._filter_expr)
+        return self._view
+
+    def _deliver(self, messages: list[dict[str, Any]]) -> None:
+        if self._callback:
+            try:
+                self._callback(messages)
+            except Exception:  # pragma: no cover - user callback failure
+                LOGGER.exception("Deephaven subscription callback raised an exception")
+        else:
+            self._messages.extend(messages)
+            self._not_empty.set()
+            waiter = self._async_waiter
+            if waiter is not None:
+                loop, event = waiter
+                try:
+                    loop.call_soon_threadsafe(event.set)
+                except RuntimeError:  # pragma: no cover - the awaiting loop already closed
+                    self._async_waiter = None
+
     def get(self, timeout: float | None = None) -> dict[str, Any]:
-        """Block until the next message is available."""
+        """Block until the next message is available.
+
+        Raises:
+            queue.Empty: If no message arrives within ``timeout`` seconds.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._messages.popleft()
+            except IndexError:
+                pass
+            self._not_empty.clear()
+            if self._messages:
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise Empty
+            self._not_empty.wait(remaining)
+
+    async def aget(self, timeout: float | None = None) -> dict[str, Any]:
+        """Await the next message without tying up a thread.
 
-        item = self._queue.get(timeout=timeout)
-        self._queue.task_done()
-        return item
+        Raises:
+            queue.Empty: If no message arrives within ``timeout`` seconds.
+        """
+
+        loop = asyncio.get_running_loop()
+        waiter = self._async_waiter
+        if waiter is None or waiter[0] is not loop:
+            waiter = self._async_waiter = (loop, asyncio.Event())
+        event = waiter[1]
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            try:
+                return self._messages.popleft()
+            except IndexError:
+                pass
+            event.clear()
+            if self._messages:
+                continue
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                raise Empty
+            try:
+                await asyncio.wait_for(event.wait(), remaining)
+            except TimeoutError:
+                pass
 
     def close(self, timeout: float | None = None) -> None:
-        """Stop the background polling thread."""
+        """Stop the table listener or background polling thread."""
 
         self._stop_event.set()
-        self._thread.join(timeout)
+        if self._listener is not None:
+            stop = getattr(self._listener, "stop", None)
+            if callable(stop):
+                stop()
+        if self._thread is not None:
+            self._thread.join(timeout)
 
 
 class DeephavenBus:
@@ -161,11 +471,33 @@ class DeephavenBus:
         if not config.session_factory and not config.host:
             raise ValueError("Either session_factory or host must be supplied")
 
-        self._lock = threading.RLock()
+        # Messages, events, metrics and the session each get their own lock so a
+        # slow event or metric write never stalls a publish. Lock order is
+        # ``_msg_lock`` before ``_session_lock``; the others are never nested.
+        self._msg_lock = threading.Lock()
+        self._event_lock = threading.Lock()
+        self._metric_lock = threading.Lock()
+        self._session_lock = threading.Lock()
         self._session: Session | None = None
+        # Liveness probes may be a network round-trip; a healthy result is trusted until this deadline.
+        self._session_alive_until_ns = 0
         self._tables: _TableHandles | None = None
         self._closed = False
+        # Priority index of messages this bus knows to be queued: (-priority, ts, id, topic, session).
+        self._queued_heap: list[tuple[int, int, str, str, str]] = []
+        self._queued_ids: set[str] = set()
+        # Running per-window metric totals: key -> [processed, errors, latency_sum, samples].
+        self._metric_totals: dict[tuple[int, str, str], list[float]] = {}
+        # Bumped whenever table handles are rebuilt so cached views know to refresh.
+        self._tables_generation = 0
         self._connect_with_retry()
+        self._row_batcher: _RowBatcher | None = None
+        if config.max_flush_latency_ms > 0:
+            self._row_batcher = _RowBatcher(
+                self._add_rows,
+                max_rows=config.max_batch_rows,
+                max_latency_s=config.max_flush_latency_ms / 1000,
+            )
 
     # ------------------------------------------------------------------
     # Public API
@@ -174,7 +506,7 @@ class DeephavenBus:
         """Publish a message to the Deephaven bus."""
 
         msg = dict(message)
-        message_id = msg.setdefault("message_id", uuid.uuid4().hex)
+        message_id = msg.setdefault("message_id", _next_message_id())
         now_ns = self._now_ns()
         msg.setdefault("ts", now_ns)
         msg.setdefault("ingest_ts", now_ns)
@@ -187,16 +519,18 @@ class DeephavenBus:
         msg.setdefault("latency_ms", 0.0)
         msg.setdefault("retry_count", 0)
 
-        with self._lock:
-            tables = self._ensure_tables()
+        tables = self._ensure_tables()
+        with self._msg_lock:
             self._add_rows(tables.messages_input, [msg])
-            self._append_event(
-                tables,
-                event="publish",
-                agent_id=msg.get("agent_id"),
-                session_id=msg.get("session_id"),
-                details={"message_id": message_id, "topic": msg.get("topic")},
-            )
+            if msg["status"] == "queued":
+                self._index_queued(msg)
+        self._append_event(
+            tables,
+            event="publish",
+            agent_id=msg.get("agent_id"),
+            session_id=msg.get("session_id"),
+            details={"message_id": message_id, "topic": msg.get("topic")},
+        )
         return message_id
 
     def subscribe(
@@ -212,17 +546,7 @@ class DeephavenBus:
     ) -> DeephavenSubscription:
         """Subscribe to message ticks matching the supplied filters."""
 
-        filters: list[str] = []
-        if topic:
-            filters.append(f"topic == `{topic}`")
-        if session_id:
-            filters.append(f"session_id == `{session_id}`")
-        if agent_id:
-            filters.append(f"agent_id == `{agent_id}`")
-        if status:
-            status_clause = " || ".join(f"status == `{value}`" for value in status)
-            filters.append(f"({status_clause})")
-        filter_expr = " && ".join(filters) if filters else None
+        filter_expr = _build_filter(topic, session_id, agent_id, tuple(sorted(set(status or ()))))
         return DeephavenSubscription(
             self,
             filter_expr=filter_expr,
@@ -241,52 +565,37 @@ class DeephavenBus:
     ) -> dict[str, Any] | None:
         """Attempt to claim the next available message for processing."""
 
-        with self._lock:
-            tables = self._ensure_tables()
-            self._expire_leases(tables)
-            where_clause = ["status == `queued`"]
-            if topic:
-                where_clause.append(f"topic == `{topic}`")
-            if session_id:
-                where_clause.append(f"session_id == `{session_id}`")
-            candidates = self._fetch_messages(" && ".join(where_clause))
-            if not candidates:
-                return None
-            candidates.sort(key=lambda row: (-int(row.get("priority", 0) or 0), int(row.get("ts", 0) or 0)))
-            selected = candidates[0]
-            ttl_ms = int(selected.get("ttl_ms") or self.config.default_ttl_ms)
-            now_ns = self._now_ns()
-            lease_duration_ms = lease_ms or self.config.lease_extension_ms
-            lease_expiration_ns = now_ns + lease_duration_ms * 1_000_000
-            selected.update(
-                {
-                    "status": "processing",
-                    "lease_owner": agent_id,
-                    "lease_expires_ts": lease_expiration_ns,
-                    "heartbeat_ts": now_ns,
-                    "ingest_ts": selected.get("ingest_ts", now_ns),
-                }
-            )
-            if ttl_ms and now_ns > selected.get("ts", now_ns) + ttl_ms * 1_000_000:
-                selected["status"] = "expired"
-            self._add_rows(tables.messages_input, [selected])
-            self._append_event(
-                tables,
-                event="claimed",
-                agent_id=agent_id,
-                session_id=selected.get("session_id"),
-                details={"message_id": selected.get("message_id"), "topic": selected.get("topic")},
-            )
-            return dict(selected)
+        where_clause = ["status == `queued`"]
+        if topic:
+            where_clause.append(f"topic == `{topic}`")
+        if session_id:
+            where_clause.append(f"session_id == `{session_id}`")
+        queued_expr = " && ".join(where_clause)
+
+        tables = self._ensure_tables()
+        with self._msg_lock:
+            selected, expired = self._claim_locked(tables, agent_id, lease_ms, topic, session_id, queued_expr)
+        self._append_expired_events(tables, expired)
+        if selected is None:
+            return None
+        self._append_event(
+            tables,
+            event="claimed",
+            agent_id=agent_id,
+            session_id=selected.get("session_id"),
+            details={"message_id": selected.get("message_id"), "topic": selected.get("topic")},
+        )
+        return dict(selected)
 
     def ack(self, message_id: str, *, agent_id: str | None = None, latency_ms: float | None = None) -> bool:
         """Acknowledge a claimed message."""
 
-        with self._lock:
-            tables = self._ensure_tables()
+        tables = self._ensure_tables()
+        with self._msg_lock:
             record = self._get_message_by_id(message_id)
             if not record:
                 return False
+            self._queued_ids.discard(message_id)
             record.update(
                 {
                     "status": "done",
@@ -298,27 +607,27 @@ class DeephavenBus:
             if latency_ms is not None:
                 record["latency_ms"] = float(latency_ms)
             self._add_rows(tables.messages_input, [record])
-            self._append_event(
-                tables,
-                event="ack",
-                agent_id=agent_id or record.get("agent_id"),
-                session_id=record.get("session_id"),
-                details={"message_id": message_id},
-            )
-            self._record_metric(
-                tables,
-                agent_id=agent_id or record.get("agent_id"),
-                session_id=record.get("session_id"),
-                latency_ms=record.get("latency_ms"),
-                success=True,
-            )
-            return True
+        self._append_event(
+            tables,
+            event="ack",
+            agent_id=agent_id or record.get("agent_id"),
+            session_id=record.get("session_id"),
+            details={"message_id": message_id},
+        )
+        self._record_metric(
+            tables,
+            agent_id=agent_id or record.get("agent_id"),
+            session_id=record.get("session_id"),
+            latency_ms=record.get("latency_ms"),
+            success=True,
+        )
+        return True
 
     def nack(self, message_id: str, *, agent_id: str | None = None, reason: str | None = None) -> bool:
         """Return a claimed message to the queue."""
 
-        with self._lock:
-            tables = self._ensure_tables()
+        tables = self._ensure_tables()
+        with self._msg_lock:
             record = self._get_message_by_id(message_id)
             if not record:
                 return False
@@ -332,27 +641,28 @@ class DeephavenBus:
                 }
             )
             self._add_rows(tables.messages_input, [record])
-            self._append_event(
-                tables,
-                event="nack",
-                agent_id=agent_id or record.get("agent_id"),
-                session_id=record.get("session_id"),
-                details={"message_id": message_id, "reason": reason},
-            )
-            self._record_metric(
-                tables,
-                agent_id=agent_id or record.get("agent_id"),
-                session_id=record.get("session_id"),
-                latency_ms=record.get("latency_ms"),
-                success=False,
-            )
-            return True
+            self._index_queued(record)
+        self._append_event(
+            tables,
+            event="nack",
+            agent_id=agent_id or record.get("agent_id"),
+            session_id=record.get("session_id"),
+            details={"message_id": message_id, "reason": reason},
+        )
+        self._record_metric(
+            tables,
+            agent_id=agent_id or record.get("agent_id"),
+            session_id=record.get("session_id"),
+            latency_ms=record.get("latency_ms"),
+            success=False,
+        )
+        return True
 
     def heartbeat(self, *, agent_id: str, message_id: str, lease_extension_ms: int | None = None) -> bool:
         """Extend the lease for an in-flight message."""
 
-        with self._lock:
-            tables = self._ensure_tables()
+        tables = self._ensure_tables()
+        with self._msg_lock:
             record = self._get_message_by_id(message_id)
             if not record:
                 return False
@@ -368,19 +678,27 @@ class DeephavenBus:
                 }
             )
             self._add_rows(tables.messages_input, [record])
-            self._append_event(
-                tables,
-                event="heartbeat",
-                agent_id=agent_id,
-                session_id=record.get("session_id"),
-                details={"message_id": message_id, "lease_extension_ms": extension_ms},
-            )
-            return True
+        self._append_event(
+            tables,
+            event="heartbeat",
+            agent_id=agent_id,
+            session_id=record.get("session_id"),
+            details={"message_id": message_id, "lease_extension_ms": extension_ms},
+        )
+        return True
+
+    def flush(self) -> None:
+        """Write any buffered event and metric rows immediately."""
+
+        if self._row_batcher is not None:
+            self._row_batcher.flush()
 
     def close(self) -> None:
         """Close the Deephaven session and stop background activity."""
 
-        with self._lock:
+        if self._row_batcher is not None:
+            self._row_batcher.close()
+        with self._msg_lock, self._session_lock:
             self._closed = True
             if self._session is not None:
                 close_fn = getattr(self._session, "close", None)
@@ -396,6 +714,13 @@ class DeephavenBus:
     # Internal helpers
     # ------------------------------------------------------------------
     def _ensure_tables(self) -> _TableHandles:
+        tables = self._tables
+        if tables is not None:
+            return tables
+        with self._session_lock:
+            return self._ensure_tables_locked()
+
+    def _ensure_tables_locked(self) -> _TableHandles:
         tables = self._tables
         if tables is not None:
             return tables
@@ -423,13 +748,26 @@ class DeephavenBus:
             messages_input=messages_input,
             events_input=events_input,
             metrics_input=metrics_input,
+            messages_columns=tuple(name for name, _ in self.MESSAGE_SCHEMA),
+            events_columns=tuple(name for name, _ in self.EVENT_SCHEMA),
+            metrics_columns=tuple(name for name, _ in self.METRIC_SCHEMA),
+            messages_arrow_schema=_arrow_schema(self.MESSAGE_SCHEMA),
+            events_arrow_schema=_arrow_schema(self.EVENT_SCHEMA),
+            metrics_arrow_schema=_arrow_schema(self.METRIC_SCHEMA),
         )
         self._tables = tables
+        self._tables_generation += 1
         return tables
 
     def _ensure_session(self) -> Session:
-        if self._session is not None and self._session_alive(self._session):
-            return self._session
+        session = self._session
+        if session is not None:
+            now_ns = time.monotonic_ns()
+            if now_ns < self._session_alive_until_ns:
+                return session
+            if self._session_alive(session):
+                self._session_alive_until_ns = now_ns + _SESSION_ALIVE_TTL_NS
+                return session
         self._connect_with_retry()
         if self._session is None:
             raise RuntimeError("Failed to establish Deephaven session")
@@ -444,6 +782,7 @@ class DeephavenBus:
             try:
                 self._session = self._connect_once()
                 LOGGER.debug("Connected to Deephaven server")
+                self._session_alive_until_ns = time.monotonic_ns() + _SESSION_ALIVE_TTL_NS
                 self._tables = None
                 return
             except Exception as exc:  # pragma: no cover - connection failures depend on environment
@@ -517,56 +856,246 @@ class DeephavenBus:
         return input_table
 
     def _resolve_column_type(self, column_type: str) -> Any:
-        mapping = {
-            "string": getattr(dh_table.ColumnType, "STRING", None),
-            "long": getattr(dh_table.ColumnType, "LONG", None),
-            "int": getattr(dh_table.ColumnType, "INT32", None),
-            "double": getattr(dh_table.ColumnType, "DOUBLE", None),
-        }
-        dtype = mapping.get(column_type)
+        dtype = _COLUMN_TYPE_MAP.get(column_type)
         if dtype is None:
             raise ValueError(f"Unsupported column type: {column_type}")
         return dtype
 
     def _add_rows(self, input_table: Any, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Append ``rows`` to ``input_table``.
+
+        When pyarrow is installed and the session can import Arrow data, the rows
+        are transposed column-wise into a single Arrow table and added in one call.
+        """
+
         if not rows:
             return
-        add_fn = getattr(input_table, "add", None)
-        if callable(add_fn):
-            add_fn(list(rows))
+        try:
+            add_fn = getattr(input_table, "add", None)
+            if callable(add_fn):
+                tables = self._tables
+                import_table = getattr(self._session, "import_table", None)
+                if tables is not None and callable(import_table):
+                    column_names, arrow_schema = tables.arrow_layout(input_table)
+                    if arrow_schema is not None:
+                        add_fn(import_table(_rows_to_arrow(rows, column_names, arrow_schema)))
+                        return
+                add_fn(list(rows))
+                return
+            add_dicts = getattr(input_table, "add_dicts", None)
+            if callable(add_dicts):  # pragma: no cover - compatibility path
+                add_dicts(list(rows))
+                return
+        except Exception:
+            self._invalidate_session()
+            raise
+        raise RuntimeError("InputTable does not support add operations")
+
+    def _invalidate_session(self) -> None:
+        """Distrust the session after a failed operation so the next call re-probes it and reopens tables."""
+
+        self._session_alive_until_ns = 0
+        self._tables = None
+
+    def _claim_locked(
+        self,
+        tables: _TableHandles,
+        agent_id: str,
+        lease_ms: int | None,
+        topic: str | None,
+        session_id: str | None,
+        queued_expr: str,
+    ) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+        """Expire lapsed leases and lease the best candidate; caller holds ``_msg_lock``.
+
+        Returns the leased row, if any, and the rows whose leases were expired.
+        """
+
+        selected = None
+        candidates: list[dict[str, Any]] | None = None
+        if self.config.local_claim_index:
+            expired = self._expire_leases(tables)
+            selected = self._claim_from_index(topic, session_id)
+        else:
+            # One snapshot serves both lease expiry and candidate selection.
+            now_ns = self._now_ns()
+            rows = self._fetch_messages(f"({self._lapsed_lease_expr(now_ns)}) || ({queued_expr})")
+            candidates = [row for row in rows if row.get("status") == "queued"]
+            expired = self._mark_expired(tables, [row for row in rows if row.get("status") == "processing"], now_ns)
+        if selected is None:
+            if candidates is None:
+                candidates = self._fetch_messages(queued_expr)
+            if not candidates:
+                return None, expired
+            candidates.sort(key=lambda row: (-int(row.get("priority", 0) or 0), int(row.get("ts", 0) or 0)))
+            selected = candidates[0]
+            for row in candidates[1:]:
+                self._index_queued(row)
+        self._queued_ids.discard(selected.get("message_id"))
+        ttl_ms = int(selected.get("ttl_ms") or self.config.default_ttl_ms)
+        now_ns = self._now_ns()
+        lease_duration_ms = lease_ms or self.config.lease_extension_ms
+        lease_expiration_ns = now_ns + lease_duration_ms * 1_000_000
+        selected.update(
+            {
+                "status": "processing",
+                "lease_owner": agent_id,
+                "lease_expires_ts": lease_expiration_ns,
+                "heartbeat_ts": now_ns,
+                "ingest_ts": selected.get("ingest_ts", now_ns),
+            }
+        )
+        if ttl_ms and now_ns > selected.get("ts", now_ns) + ttl_ms * 1_000_000:
+            selected["status"] = "expired"
+        self._add_rows(tables.messages_input, [selected])
+        return selected, expired
+
+    def _index_queued(self, row: Mapping[str, Any]) -> None:
+        """Record a queued message in the local claim index when it is enabled."""
+
+        if not self.config.local_claim_index:
             return
-        add_dicts = getattr(input_table, "add_dicts", None)
-        if callable(add_dicts):  # pragma: no cover - compatibility path
-            add_dicts(list(rows))
+        message_id = row.get("message_id")
+        if not message_id:
             return
-        raise RuntimeError("InputTable does not support add operations")
+        entry = (
+            -int(row.get("priority", 0) or 0),
+            int(row.get("ts", 0) or 0),
+            message_id,
+            row.get("topic") or "",
+            row.get("session_id") or "",
+        )
+        heapq.heappush(self._queued_heap, entry)
+        self._queued_ids.add(message_id)
 
-    def _fetch_messages(self, filter_expr: str | None = None, min_ingest_ns: int | None = None) -> list[dict[str, Any]]:
-        table = self._ensure_tables().messages_table
-        filtered = table
+    def _claim_from_index(self, topic: str | None, session_id: str | None) -> dict[str, Any] | None:
+        """Pick the highest-priority indexed message that is still queued.
+
+        Only the chosen candidate is fetched from Deephaven. Returns ``None`` when
+        the index holds no matching message so the caller falls back to a scan,
+        which also picks up messages queued by other processes.
+        """
+
+        heap = self._queued_heap
+        skipped: list[tuple[int, int, str, str, str]] = []
+        selected: dict[str, Any] | None = None
+        while heap:
+            entry = heapq.heappop(heap)
+            message_id = entry[2]
+            if message_id not in self._queued_ids:
+                continue
+            if (topic and entry[3] != topic) or (session_id and entry[4] != session_id):
+                skipped.append(entry)
+                continue
+            record = self._get_message_by_id(message_id)
+            if record is None or record.get("status") != "queued":
+                self._queued_ids.discard(message_id)
+                continue
+            selected = record
+            break
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        return selected
+
+    def _fetch_messages(
+        self,
+        filter_expr: str | None = None,
+        min_ingest_ns: int | None = None,
+        *,
+        limit: int | None = None,
+        table: Any = None,
+    ) -> list[dict[str, Any]]:
+        """Snapshot message rows matching ``filter_expr`` and newer than ``min_ingest_ns``.
+
+        Both predicates are pushed into the Deephaven ``where`` clause so only
+        matching rows are transferred and converted; ``limit`` is applied with
+        ``head`` on the server as well. ``table`` overrides the messages table,
+        e.g. with a pre-filtered view.
+        """
+
+        try:
+            snapshot, pushed_down = self._snapshot_messages(filter_expr, min_ingest_ns, limit=limit, table=table)
+            records = self._table_to_dicts(snapshot)
+        except Exception:
+            self._invalidate_session()
+            raise
+        if min_ingest_ns is not None and not pushed_down:
+            records = [row for row in records if (row.get("ingest_ts") or 0) > min_ingest_ns]
+        return records if limit is None else records[:limit]
+
+    def _poll_messages(self, min_ingest_ns: int | None, table: Any) -> tuple[list[dict[str, Any]], int | None]:
+        """Fetch rows of ``table`` newer than ``min_ingest_ns`` and the new ingest watermark.
+
+        When the snapshot converts column-wise, the watermark is reduced over the
+        ``ingest_ts`` column before any row dictionaries are built.
+        """
+
+        try:
+            snapshot, pushed_down = self._snapshot_messages(None, min_ingest_ns, table=table)
+            if pushed_down or min_ingest_ns is None:
+                to_arrow = getattr(snapshot, "to_arrow", None)
+                arrow_table = to_arrow() if callable(to_arrow) else None
+                to_pydict = getattr(arrow_table, "to_pydict", None)
+                if callable(to_pydict):
+                    if getattr(arrow_table, "num_rows", None) == 0:
+                        return [], min_ingest_ns
+                    columns = to_pydict()
+                    watermark = max(filter(None, columns.get("ingest_ts") or ()), default=0)
+                    return _columns_to_rows(columns), watermark or min_ingest_ns
+            records = self._table_to_dicts(snapshot)
+        except Exception:
+            self._invalidate_session()
+            raise
+        if min_ingest_ns is not None and not pushed_down:
+            records = [row for row in records if (row.get("ingest_ts") or 0) > min_ingest_ns]
+        watermark = max((row.get("ingest_ts") or 0 for row in records), default=0)
+        return records, watermark or min_ingest_ns
+
+    def _snapshot_messages(
+        self,
+        filter_expr: str | None,
+        min_ingest_ns: int | None,
+        *,
+        limit: int | None = None,
+        table: Any = None,
+    ) -> tuple[Any, bool]:
+        """Return a snapshot of the filtered messages and whether the predicates were pushed down."""
+
+        if table is None:
+            table = self._ensure_tables().messages_table
+        clauses: list[str] = []
         if filter_expr:
+            clauses.append(f"({filter_expr})" if min_ingest_ns is not None else filter_expr)
+        if min_ingest_ns is not None:
+            clauses.append(f"ingest_ts > {int(min_ingest_ns)}")
+        filtered = table
+        pushed_down = False
+        if clauses:
             where_fn = getattr(filtered, "where", None)
             if callable(where_fn):
-                filtered = where_fn(filter_expr)
+                filtered = where_fn(" && ".join(clauses))
+                pushed_down = True
+        if limit is not None:
+            head_fn = getattr(filtered, "head", None)
+            if callable(head_fn):
+                filtered = head_fn(limit)
         static_snapshot = getattr(filtered, "snapshot", None)
         if callable(static_snapshot):
-            snapshot = static_snapshot()
-        else:
-            snapshot = filtered
-        records = self._table_to_dicts(snapshot)
-        if min_ingest_ns is not None:
-            records = [row for row in records if (row.get("ingest_ts") or 0) > min_ingest_ns]
-        return records
+            return static_snapshot(), pushed_down
+        return filtered, pushed_down
 
     def _table_to_dicts(self, table: Any) -> list[dict[str, Any]]:
         if table is None:
             return []
         if hasattr(table, "to_arrow") and callable(table.to_arrow):
             arrow_table = table.to_arrow()
-            if pa is not None and isinstance(arrow_table, pa.Table):
-                return [dict(zip(arrow_table.column_names, row)) for row in arrow_table.to_pylist()]
+            if getattr(arrow_table, "num_rows", None) == 0:
+                return []
+            to_pydict = getattr(arrow_table, "to_pydict", None)
+            if callable(to_pydict):
+                return _columns_to_rows(to_pydict())
             if hasattr(arrow_table, "to_pylist"):
-                return [dict(zip(arrow_table.schema.names, row)) for row in arrow_table.to_pylist()]
+                return [dict(row) for row in arrow_table.to_pylist()]
         if hasattr(table, "to_pandas") and callable(table.to_pandas):
             df = table.to_pandas()
             if pd is not None and isinstance(df, pd.DataFrame):
@@ -578,8 +1107,49 @@ class DeephavenBus:
         LOGGER.debug("Falling back to empty snapshot for Deephaven table conversion")
         return []
 
+    def _register_listener(
+        self,
+        filter_expr: str | None,
+        deliver: Callable[[list[dict[str, Any]]], None],
+    ) -> Any:
+        """Listen for rows added to the filtered messages table.
+
+        Returns the started listener handle, or ``None`` when pydeephaven offers no
+        table listeners so the caller can fall back to polling.
+        """
+
+        if dh_listen is None:
+            return None
+        table = self._ensure_tables().messages_table
+        if filter_expr:
+            table = table.where(filter_expr)
+
+        def _on_update(update: Any) -> None:
+            added = update.added()
+            rows = _columns_to_rows(
+                {name: column.to_pylist() if hasattr(column, "to_pylist") else list(column) for name, column in added.items()}
+            )
+            if rows:
+                deliver(rows)
+
+        handle = dh_listen(table, _on_update)
+        start = getattr(handle, "start", None)
+        if callable(start):
+            start()
+        return handle
+
+    def _filtered_messages_view(self, filter_expr: str | None) -> tuple[Any, int]:
+        """Return the messages table filtered by ``filter_expr`` and its table generation."""
+
+        table = self._ensure_tables().messages_table
+        if filter_expr:
+            where_fn = getattr(table, "where", None)
+            if callable(where_fn):
+                table = where_fn(filter_expr)
+        return table, self._tables_generation
+
     def _get_message_by_id(self, message_id: str) -> dict[str, Any] | None:
-        records = self._fetch_messages(filter_expr=f"message_id == `{message_id}`")
+        records = self._fetch_messages(filter_expr=f"message_id == `{message_id}`", limit=1)
         return records[0] if records else None
 
     def _append_event(
@@ -596,9 +1166,13 @@ class DeephavenBus:
             "agent_id": agent_id or "",
             "session_id": session_id or "",
             "event": event,
-            "details_json": json.dumps(details or {}),
+            "details_json": _encode_details(details),
         }
-        self._add_rows(tables.events_input, [payload])
+        if self._row_batcher is not None:
+            self._row_batcher.submit(tables.events_input, [payload])
+            return
+        with self._event_lock:
+            self._add_rows(tables.events_input, [payload])
 
     def _record_metric(
         self,
@@ -609,24 +1183,52 @@ class DeephavenBus:
         latency_ms: float | None,
         success: bool,
     ) -> None:
+        """Fold one outcome into the running totals of its one-minute window.
+
+        The metrics table is keyed by window, agent and session, so each write
+        upserts the cumulative row; pending writes for the same key coalesce.
+        """
+
         now_ns = self._now_ns()
         window_start = now_ns - (now_ns % (60_000_000_000))
-        payload = {
-            "window_start": window_start,
-            "agent_id": agent_id or "",
-            "session_id": session_id or "",
-            "messages_processed": 1 if success else 0,
-            "avg_latency_ms": float(latency_ms or 0.0),
-            "errors": 0 if success else 1,
-            "token_usage": 0,
-            "last_update_ts": now_ns,
-        }
-        self._add_rows(tables.metrics_input, [payload])
+        key = (window_start, agent_id or "", session_id or "")
+        with self._metric_lock:
+            totals = self._metric_totals.get(key)
+            if totals is None:
+                # A new window started: earlier windows will not receive further updates.
+                self._metric_totals = {k: v for k, v in self._metric_totals.items() if k[0] >= window_start}
+                totals = self._metric_totals[key] = [0, 0, 0.0, 0]
+            totals[0 if success else 1] += 1
+            totals[2] += float(latency_ms or 0.0)
+            totals[3] += 1
+            payload = {
+                "window_start": window_start,
+                "agent_id": key[1],
+                "session_id": key[2],
+                "messages_processed": totals[0],
+                "avg_latency_ms": totals[2] / totals[3],
+                "errors": totals[1],
+                "token_usage": 0,
+                "last_update_ts": now_ns,
+            }
+            if self._row_batcher is None:
+                # Written under the lock so an older cumulative row never lands last.
+                self._add_rows(tables.metrics_input, [payload])
+                return
+        self._row_batcher.submit(tables.metrics_input, [payload], key=key)
 
-    def _expire_leases(self, tables: _TableHandles) -> None:
+    @staticmethod
+    def _lapsed_lease_expr(now_ns: int) -> str:
+        return f"status == `processing` && lease_expires_ts > 0 && lease_expires_ts <= {now_ns}"
+
+    def _expire_leases(self, tables: _TableHandles) -> list[dict[str, Any]]:
         now_ns = self._now_ns()
-        records = self._fetch_messages("status == `processing`")
-        expired = [row for row in records if (row.get("lease_expires_ts") or 0) > 0 and row.get("lease_expires_ts") <= now_ns]
+        # Only rows whose lease already lapsed leave the server.
+        return self._mark_expired(tables, self._fetch_messages(self._lapsed_lease_expr(now_ns)), now_ns)
+
+    def _mark_expired(self, tables: _TableHandles, expired: list[dict[str, Any]], now_ns: int) -> list[dict[str, Any]]:
+        """Write lapsed leases back as expired; callers announce them once ``_msg_lock`` is released."""
+
         for row in expired:
             row.update(
                 {
@@ -638,14 +1240,17 @@ class DeephavenBus:
             )
         if expired:
             self._add_rows(tables.messages_input, expired)
-            for row in expired:
-                self._append_event(
-                    tables,
-                    event="timeout",
-                    agent_id=row.get("agent_id"),
-                    session_id=row.get("session_id"),
-                    details={"message_id": row.get("message_id")},
-                )
+        return expired
+
+    def _append_expired_events(self, tables: _TableHandles, expired: list[dict[str, Any]]) -> None:
+        for row in expired:
+            self._append_event(
+                tables,
+                event="timeout",
+                agent_id=row.get("agent_id"),
+                session_id=row.get("session_id"),
+                details={"message_id": row.get("message_id")},
+            )
 
     def _session_alive(self, session: Session) -> bool:
         alive_fn = getattr(session, "is_alive", None)
@@ -1,9 +1,18 @@
 """Utilities for bootstrapping Deephaven transport tables."""
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
-from typing import Any, Protocol
+import hashlib
+import json
+import os
+import re
+import sys
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple, Protocol
 
 __all__ = [
     "ColumnSpec",
@@ -40,11 +49,28 @@ class TableSpec:
     columns: tuple[ColumnSpec, ...]
     key_columns: tuple[str, ...] = ()
     description: str | None = None
+    _columns_soa: tuple[tuple[str, ...], tuple[str, ...], tuple[str | None, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+    _column_types: dict[str, str] = field(init=False, repr=False, compare=False)
+    _lower_types: dict[str, str] = field(init=False, repr=False, compare=False)
+    _column_names: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Specs are immutable, so the column layout is transposed into parallel
+        # name/dtype/description tuples and the expected types derived once.
+        names = tuple(column.name for column in self.columns)
+        dtypes = tuple(sys.intern(column.dtype) for column in self.columns)
+        descriptions = tuple(column.description for column in self.columns)
+        object.__setattr__(self, "_columns_soa", (names, dtypes, descriptions))
+        object.__setattr__(self, "_column_types", dict(zip(names, dtypes)))
+        object.__setattr__(self, "_lower_types", dict(zip(names, (dtype.lower() for dtype in dtypes))))
+        object.__setattr__(self, "_column_names", frozenset(names))
 
     def column_types(self) -> Mapping[str, str]:
-        """Return a mapping of column names to their expected Deephaven dtypes."""
+        """Return a shared read-only mapping of column names to their expected Deephaven dtypes."""
 
-        return {column.name: column.dtype for column in self.columns}
+        return MappingProxyType(self._column_types)
 
 
 @dataclass(slots=True)
@@ -112,17 +138,28 @@ DEFAULT_TABLE_SPECS: tuple[TableSpec, ...] = (
 )
 
 
-def _normalize_dtype(dtype: Any) -> str:
-    """Normalize a Deephaven column type to the canonical string representation."""
-
+def _normalize_dtype_uncached(dtype: Any) -> str:
+    # Interned so comparisons against the (interned) spec literals short-circuit on identity.
     if dtype is None:
         return ""
     if isinstance(dtype, str):
-        return dtype
+        return sys.intern(dtype)
     name = getattr(dtype, "name", None)
     if isinstance(name, str):
-        return name
-    return str(dtype)
+        return sys.intern(name)
+    return sys.intern(str(dtype))
+
+
+_normalize_dtype_cached = lru_cache(maxsize=256)(_normalize_dtype_uncached)
+
+
+def _normalize_dtype(dtype: Any) -> str:
+    """Normalize a Deephaven column type to the canonical string representation."""
+
+    try:
+        return _normalize_dtype_cached(dtype)
+    except TypeError:  # unhashable dtype objects
+        return _normalize_dtype_uncached(dtype)
 
 
 def _table_column_types(table: TableLike) -> Mapping[str, str]:
@@ -143,13 +180,29 @@ class _PublisherFactory(Protocol):
         """Create or update a Deephaven table matching ``spec``."""
 
 
+class _DeephavenSymbols(NamedTuple):
+    DHError: type[Exception]
+    ColumnDefinition: Any
+    TableDefinition: Any
+    TablePublisher: Any
+
+
+@cache
+def _lazy_deephaven_symbols() -> _DeephavenSymbols:
+    """Import the Deephaven publishing API once per process; import failures are not cached."""
+
+    from deephaven import DHError
+    from deephaven.table import ColumnDefinition, TableDefinition
+    from deephaven.table.publisher import TablePublisher
+
+    return _DeephavenSymbols(DHError, ColumnDefinition, TableDefinition, TablePublisher)
+
+
 def _default_publisher_factory(session: Any, spec: TableSpec, *, replace: bool) -> None:
     """Create or update a Deephaven table using Deephaven's TablePublisher API."""
 
     try:  # pragma: no cover - exercised indirectly in tests through patching
-        from deephaven import DHError
-        from deephaven.table import ColumnDefinition, TableDefinition
-        from deephaven.table.publisher import TablePublisher
+        DHError, ColumnDefinition, TableDefinition, TablePublisher = _lazy_deephaven_symbols()
     except ModuleNotFoundError as exc:  # pragma: no cover - environment dependent
         raise SchemaBootstrapError(
             "deephaven package is required to bootstrap tables; install the 'deephaven' extra"
@@ -168,13 +221,13 @@ def _default_publisher_factory(session: Any, spec: TableSpec, *, replace: bool)
         raise SchemaBootstrapError(f"Failed to {'update' if replace else 'create'} Deephaven table '{spec.name}'") from exc
 
 
+_MISSING_TABLE_RE = re.compile(r"not found|does not exist", re.IGNORECASE)
+
+
 def _is_missing_table_error(error: Exception) -> bool:
     """Heuristically detect whether an exception indicates a missing table."""
 
-    if isinstance(error, KeyError):
-        return True
-    message = str(error).lower()
-    return "not found" in message or "does not exist" in message
+    return isinstance(error, KeyError) or _MISSING_TABLE_RE.search(str(error)) is not None
 
 
 def _open_table(session: Any, table_name: str) -> TableLike | None:
@@ -188,36 +241,124 @@ def _open_table(session: Any, table_name: str) -> TableLike | None:
         raise SchemaBootstrapError(f"Failed to inspect Deephaven table '{table_name}'") from exc
 
 
-def _ensure_table(
-    session: Any,
-    spec: TableSpec,
-    publisher_factory: _PublisherFactory,
-) -> TableBootstrapResult:
-    existing = _open_table(session, spec.name)
-    if existing is None:
-        publisher_factory(session, spec, replace=False)
+def _bulk_fetch_column_types(session: Any, names: Iterable[str]) -> dict[str, Mapping[str, str] | None]:
+    """Fetch the column types of every table in ``names``, ``None`` marking missing tables.
+
+    Sessions whose ``table_service`` exposes ``describe_tables(names)`` are asked
+    once for all tables; it returns a mapping of table name to table for the
+    tables that exist. Other sessions fall back to one ``open_table`` per name.
+    """
+
+    names = tuple(dict.fromkeys(names))
+    describe_tables = getattr(getattr(session, "table_service", None), "describe_tables", None)
+    if not callable(describe_tables):
+        results: dict[str, Mapping[str, str] | None] = {}
+        for name in names:
+            existing = _open_table(session, name)
+            results[name] = None if existing is None else _table_column_types(existing)
+        return results
+
+    try:
+        described = describe_tables(list(names))
+    except Exception as exc:
+        raise SchemaBootstrapError(f"Failed to inspect Deephaven tables {', '.join(names)}") from exc
+    return {
+        name: _table_column_types(described[name]) if described.get(name) is not None else None
+        for name in names
+    }
+
+
+def _plan_table(spec: TableSpec, column_types: Mapping[str, str] | None) -> TableBootstrapResult:
+    """Decide whether ``spec`` must be created or updated without publishing anything."""
+
+    if column_types is None:
         return TableBootstrapResult(spec=spec, created=True, updated=False)
 
-    column_types = _table_column_types(existing)
-    expected = spec.column_types()
-    missing_columns = [name for name in expected if name not in column_types]
-    mismatched = [
-        name for name in expected if name in column_types and column_types[name].lower() != expected[name].lower()
-    ]
+    expected = spec._column_types
+    expected_lower = spec._lower_types
+    # Membership is settled by C-level set operations; only shared columns are compared.
+    has_missing = not spec._column_names.issubset(column_types.keys())
+    mismatched: set[str] = set()
+    for name in spec._column_names.intersection(column_types.keys()):
+        found = column_types[name]
+        dtype = expected[name]
+        # Exact matches, the common case, skip lowercasing the fetched type entirely.
+        if found is not dtype and found != dtype and found.lower() != expected_lower[name]:
+            mismatched.add(name)
 
     if mismatched:
         mismatched_pairs = ", ".join(
-            f"{name} (expected {expected[name]}, found {column_types[name]})" for name in mismatched
+            f"{name} (expected {expected[name]}, found {column_types[name]})"
+            for name in spec._columns_soa[0]
+            if name in mismatched
         )
         raise SchemaBootstrapError(
             f"Existing Deephaven table '{spec.name}' has incompatible columns: {mismatched_pairs}"
         )
 
-    if missing_columns:
-        publisher_factory(session, spec, replace=True)
-        return TableBootstrapResult(spec=spec, created=False, updated=True)
+    return TableBootstrapResult(spec=spec, created=False, updated=has_missing)
+
+
+_MAX_PUBLISH_WORKERS = 8
+
+
+def _publish_tables(session: Any, plans: Sequence[TableBootstrapResult], publisher_factory: _PublisherFactory) -> None:
+    """Create or update every planned table, concurrently when there are several."""
+
+    if len(plans) <= 1:
+        for plan in plans:
+            publisher_factory(session, plan.spec, replace=plan.updated)
+        return
+    with ThreadPoolExecutor(
+        max_workers=min(_MAX_PUBLISH_WORKERS, len(plans)), thread_name_prefix="deephaven-schema"
+    ) as executor:
+        futures = [executor.submit(publisher_factory, session, plan.spec, replace=plan.updated) for plan in plans]
+        for future in futures:
+            future.result()
+
+
+_SCHEMA_CACHE_FILE = "deepagents_schema.json"
+
+
+def _spec_fingerprint(specs: Iterable[TableSpec]) -> str:
+    """Return a stable content hash of ``specs``."""
+
+    canonical = [[spec.name, spec._columns_soa[0], spec._columns_soa[1], spec.key_columns] for spec in specs]
+    return hashlib.blake2b(json.dumps(canonical).encode(), digest_size=16).hexdigest()
 
-    return TableBootstrapResult(spec=spec, created=False, updated=False)
+
+def _server_identity(session: Any) -> str:
+    server_url = getattr(session, "server_url", None)
+    if server_url:
+        return str(server_url)
+    return f"{getattr(session, 'host', '')}:{getattr(session, 'port', '')}"
+
+
+def _schema_cache_path(session: Any) -> Path | None:
+    cache_dir = getattr(session, "cache_dir", None)
+    return Path(cache_dir) / _SCHEMA_CACHE_FILE if cache_dir else None
+
+
+def _read_schema_cache(path: Path) -> dict[str, str]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_schema_cache(path: Path, server: str, fingerprint: str) -> None:
+    """Record ``fingerprint`` as verified for ``server``; cache write failures are ignored."""
+
+    entries = _read_schema_cache(path)
+    entries[server] = fingerprint
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_text(json.dumps(entries, sort_keys=True))
+        os.replace(temporary, path)
+    except OSError:
+        temporary.unlink(missing_ok=True)
 
 
 def bootstrap_deephaven_tables(
@@ -225,15 +366,22 @@ def bootstrap_deephaven_tables(
     *,
     table_specs: Iterable[TableSpec] = DEFAULT_TABLE_SPECS,
     publisher_factory: _PublisherFactory | None = None,
+    force_refresh: bool = False,
 ) -> tuple[TableBootstrapResult, ...]:
     """Ensure the canonical Deephaven transport tables exist.
 
+    Missing or outdated tables are published concurrently once every table has
+    been validated. Sessions exposing a ``cache_dir`` remember the fingerprint of the specs they
+    last verified per server. When it matches, the tables are assumed to be in
+    place and no inspection round-trips are made.
+
     Args:
         session: A connected Deephaven session or compatible test double exposing
             ``open_table`` and ``table_service`` APIs.
         table_specs: Iterable of table specifications to ensure.
         publisher_factory: Factory responsible for creating or updating tables.
             When ``None`` the Deephaven ``TablePublisher`` implementation is used.
+        force_refresh: Inspect the tables even when the cached fingerprint matches.
 
     Returns:
         Tuple with one :class:`TableBootstrapResult` per table.
@@ -243,7 +391,18 @@ def bootstrap_deephaven_tables(
     """
 
     factory = publisher_factory or _default_publisher_factory
-    results: list[TableBootstrapResult] = []
-    for spec in table_specs:
-        results.append(_ensure_table(session, spec, factory))
-    return tuple(results)
+    specs = tuple(table_specs)
+    cache_path = _schema_cache_path(session)
+    server = _server_identity(session)
+    fingerprint = _spec_fingerprint(specs)
+    if cache_path is not None and not force_refresh and _read_schema_cache(cache_path).get(server) == fingerprint:
+        return tuple(TableBootstrapResult(spec=spec, created=False, updated=False) for spec in specs)
+
+    column_types_by_table = _bulk_fetch_column_types(session, (spec.name for spec in specs))
+    # Every table is validated before any is published, so an incompatible
+    # schema aborts the bootstrap without touching the others.
+    results = tuple(_plan_table(spec, column_types_by_table[spec.name]) for spec in specs)
+    _publish_tables(session, [result for result in results if result.created or result.updated], factory)
+    if cache_path is not None:
+        _write_schema_cache(cache_path, server, fingerprint)
+    return results
@@ -19,11 +19,17 @@ class DeephavenTransport:
         table_specs: Iterable[TableSpec] = DEFAULT_TABLE_SPECS,
     ) -> None:
         self._session = session
+        self._table_specs = tuple(table_specs)
         if bootstrap:
-            bootstrap_deephaven_tables(session, table_specs=table_specs)
+            bootstrap_deephaven_tables(session, table_specs=self._table_specs)
 
     @property
     def session(self) -> Any:
         """Return the underlying Deephaven session."""
 
         return self._session
+
+    def refresh_schema(self) -> None:
+        """Re-inspect the tables, bypassing the session's cached schema fingerprint."""
+
+        bootstrap_deephaven_tables(self._session, table_specs=self._table_specs, force_refresh=True)
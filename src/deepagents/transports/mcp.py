@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import itertools
 import logging
-from dataclasses import dataclass
-from queue import Queue
-from threading import Event, Lock, Thread
-from typing import Any, Callable, Mapping, Protocol
+import os
+import time
+import weakref
+from collections import deque
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from queue import SimpleQueue
+from threading import Condition, Event, Lock, Thread, Timer
+from typing import Any, Callable, Iterable, Mapping, MutableMapping, Protocol
 
 from deepagents.transports.base import (
     MessageTransport,
@@ -54,17 +62,206 @@ class MCPClientProtocol(Protocol):
 
 @dataclass(slots=True)
 class DeephavenMCPTools:
-    """Container describing MCP tool identifiers leveraged by the transport."""
+    """Container describing MCP tool identifiers leveraged by the transport.
+
+    The configured, non-empty tool names are collected once at construction into
+    ``active_tool_names``; treat instances as immutable after creation.
+    """
 
     publish_message: str = "deephaven.messages.publish"
     publish_event: str = "deephaven.events.publish"
     publish_metrics: str = "deephaven.metrics.publish"
     subscribe_messages: str = "deephaven.messages.subscribe"
     heartbeat: str | None = "deephaven.heartbeat"
+    active_tool_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        names = (self.publish_message, self.publish_event, self.publish_metrics, self.subscribe_messages)
+        self.active_tool_names = tuple(name for name in names if name)
+
+
+class _CoalescingBuffer:
+    """Collect delivered messages and hand each window's burst to ``put`` as one list."""
+
+    __slots__ = ("_lock", "_pending", "_put", "_timer", "_window_s")
+
+    def __init__(self, put: Callable[[list[Mapping[str, Any]]], None], window_s: float) -> None:
+        self._lock = Lock()
+        self._pending: list[Mapping[str, Any]] = []
+        self._put = put
+        self._timer: Timer | None = None
+        self._window_s = window_s
+
+    def append(self, message: Mapping[str, Any]) -> None:
+        with self._lock:
+            self._pending.append(message)
+            if self._timer is None:
+                self._timer = Timer(self._window_s, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._timer = None
+        if batch:
+            self._put(batch)
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending = []
+
+
+class _UnbatchingQueue:
+    """Queue of message batches that a single consumer reads one message at a time."""
+
+    __slots__ = ("_batches", "_ready")
+
+    def __init__(self) -> None:
+        self._batches: SimpleQueue[list[Mapping[str, Any]]] = SimpleQueue()
+        self._ready: deque[Mapping[str, Any]] = deque()
+
+    def put(self, batch: list[Mapping[str, Any]]) -> None:
+        self._batches.put(batch)
+
+    def get(self, timeout: float | None = None) -> Mapping[str, Any]:
+        try:
+            return self._ready.popleft()
+        except IndexError:
+            pass
+        batch = self._batches.get(timeout=timeout)
+        self._ready.extend(batch[1:])
+        return batch[0]
+
+
+class _Heartbeat:
+    """Registration handle returned by :meth:`_HeartbeatScheduler.register`."""
+
+    __slots__ = ("callback", "cancelled", "in_flight", "interval")
+
+    def __init__(self, callback: Callable[[], None], interval: float) -> None:
+        self.callback = callback
+        self.interval = interval
+        self.cancelled = False
+        self.in_flight = False
+
+
+_HEARTBEAT_WORKERS = 4
+
+
+class _HeartbeatScheduler:
+    """Process-wide timer thread that fires every transport's periodic heartbeat.
+
+    The timer thread only keeps time; callbacks, which block on network RPCs, run
+    on a small worker pool so one slow server cannot delay other transports. A
+    heartbeat whose previous callback is still running skips that beat.
+    Cancelled heartbeats are dropped lazily once they reach the top of the heap.
+    """
+
+    def __init__(self) -> None:
+        self._ready = Condition(Lock())
+        self._heap: list[tuple[float, int, _Heartbeat]] = []
+        self._counter = itertools.count()
+        self._thread: Thread | None = None
+        self._due: SimpleQueue[_Heartbeat] | None = None
+
+    def register(self, callback: Callable[[], None], interval: float) -> _Heartbeat:
+        heartbeat = _Heartbeat(callback, interval)
+        with self._ready:
+            heapq.heappush(self._heap, (time.monotonic() + interval, next(self._counter), heartbeat))
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="deephaven-mcp-heartbeat", daemon=True)
+                self._thread.start()
+            self._ready.notify()
+        return heartbeat
+
+    def cancel(self, heartbeat: _Heartbeat) -> None:
+        with self._ready:
+            heartbeat.cancelled = True
+            self._ready.notify()
+
+    def _after_fork_in_child(self) -> None:
+        # The timer thread does not survive ``fork``; the child starts afresh.
+        self._ready = Condition(Lock())
+        self._heap = []
+        self._thread = None
+        self._due = None
+
+    def _run(self) -> None:
+        while True:
+            with self._ready:
+                heap = self._heap
+                while not heap:
+                    self._ready.wait()
+                due, _, heartbeat = heap[0]
+                delay = due - time.monotonic()
+                if delay > 0 and not heartbeat.cancelled:
+                    self._ready.wait(delay)
+                    continue
+                heapq.heappop(heap)
+                if heartbeat.cancelled:
+                    continue
+                next_due = max(due + heartbeat.interval, time.monotonic())
+                heapq.heappush(heap, (next_due, next(self._counter), heartbeat))
+                if heartbeat.in_flight:
+                    continue
+                heartbeat.in_flight = True
+                due_queue = self._due
+                if due_queue is None:
+                    due_queue = self._due = self._start_workers()
+            due_queue.put(heartbeat)
+
+    @staticmethod
+    def _start_workers() -> SimpleQueue[_Heartbeat]:
+        # Daemon threads, unlike an executor's, never hold up interpreter exit on a
+        # heartbeat stuck in a hung RPC.
+        due_queue: SimpleQueue[_Heartbeat] = SimpleQueue()
+
+        def _work() -> None:
+            while True:
+                heartbeat = due_queue.get()
+                try:
+                    heartbeat.callback()
+                except Exception:  # pragma: no cover - callbacks handle their own errors
+                    LOGGER.warning("MCP heartbeat callback failed", exc_info=True)
+                finally:
+                    heartbeat.in_flight = False
+
+        for index in range(_HEARTBEAT_WORKERS):
+            Thread(target=_work, name=f"deephaven-mcp-heartbeat-worker-{index}", daemon=True).start()
+        return due_queue
+
+
+_HEARTBEATS = _HeartbeatScheduler()
+os.register_at_fork(after_in_child=_HEARTBEATS._after_fork_in_child)
+
+
+def _coerce_payload(payload: Mapping[str, Any]) -> dict[str, Any]:
+    """Return ``payload`` itself when it is a plain ``dict``, otherwise a ``dict`` copy."""
+
+    return payload if type(payload) is dict else dict(payload)
 
 
 class DeephavenMCPTransport(MessageTransport):
-    """Transport implementation that communicates via a Deephaven MCP client."""
+    """Transport implementation that communicates via a Deephaven MCP client.
+
+    Unbatched plain ``dict`` payloads are forwarded to the client without
+    copying. Delivered messages are queued as-is; pass ``copy_on_deliver=True``
+    when the client reuses the mappings it hands to subscription callbacks.
+
+    Tool calls keep the MCP session alive, so by default a heartbeat is skipped
+    when a tool was invoked or subscribed to within the last interval. Pass
+    ``skip_heartbeat_when_active=False`` to always send it.
+
+    With ``batch_size`` above zero, publishes are copied and buffered per tool,
+    then sent as a single ``{"batch": [...]}`` invocation once ``batch_size``
+    payloads are pending; a positive ``batch_interval_s`` additionally flushes
+    every buffer on that period from a dedicated timer thread. :meth:`flush`
+    and :meth:`close` send any remainder.
+    """
 
     def __init__(
         self,
@@ -72,21 +269,39 @@ class DeephavenMCPTransport(MessageTransport):
         *,
         tools: DeephavenMCPTools | None = None,
         heartbeat_interval: float = 30.0,
+        copy_on_deliver: bool = False,
+        skip_heartbeat_when_active: bool = True,
+        batch_size: int = 0,
+        batch_interval_s: float = 0.0,
     ) -> None:
         self._client = client
+        self._copy_on_deliver = copy_on_deliver
         self._tools = tools or DeephavenMCPTools()
         self._heartbeat_interval = heartbeat_interval
+        self._skip_heartbeat_when_active = skip_heartbeat_when_active
+        self._last_rpc_at = float("-inf")
         self._tool_cache: dict[str, Mapping[str, Any]] = {}
+        self._invoke_errors = {name: f"Failed to invoke MCP tool '{name}'" for name in self._iter_tool_names()}
         self._subscriptions: dict[TransportSubscription, MCPSubscriptionHandle] = {}
-        self._lock = Lock()
         self._closed = False
-        self._heartbeat_stop = Event()
-        self._heartbeat_thread: Thread | None = None
+        self._heartbeat: _Heartbeat | None = None
         self._handshake_metadata: Mapping[str, Any] | None = None
+        self._batch_size = batch_size
+        self._pending: dict[str, list[dict[str, Any]]] = {}
+        self._pending_lock = Lock()
+        self._batch_flusher_stop: Event | None = None
 
         self._perform_handshake()
-        self._warm_tool_cache()
+        # Registering with the shared scheduler is cheap, so the heartbeat is armed
+        # before warm-up rather than waiting on the schema round-trip.
         self._start_heartbeat_loop()
+        try:
+            self._warm_tool_cache()
+        except BaseException:
+            self.close()
+            raise
+        if batch_size > 0 and batch_interval_s > 0:
+            self._start_batch_flusher(batch_interval_s)
 
     @property
     def handshake_metadata(self) -> Mapping[str, Any] | None:
@@ -95,31 +310,109 @@ class DeephavenMCPTransport(MessageTransport):
         return self._handshake_metadata
 
     def publish_message(self, message: Mapping[str, Any]) -> None:
-        self._ensure_open()
-        payload = dict(message)
-        self._invoke(self._tools.publish_message, payload)
+        self._publish(self._tools.publish_message, message)
 
     def publish_event(self, event: Mapping[str, Any]) -> None:
-        self._ensure_open()
-        payload = dict(event)
-        self._invoke(self._tools.publish_event, payload)
+        self._publish(self._tools.publish_event, event)
 
     def publish_metrics(self, metrics: Mapping[str, Any]) -> None:
+        self._publish(self._tools.publish_metrics, metrics)
+
+    def flush(self) -> None:
+        """Send every buffered publish as one batch per tool.
+
+        Raises:
+            TransportError: If a batch cannot be sent. That batch and any not yet
+                attempted are put back in the buffer so a later flush retries them.
+        """
+
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        batches = list(pending.items())
+        for index, (tool_name, batch) in enumerate(batches):
+            try:
+                self._invoke(tool_name, {"batch": batch})
+            except BaseException:
+                self._restore_pending(batches[index:])
+                raise
+
+    def subscribe_messages(
+        self,
+        *,
+        filters: Mapping[str, Any] | None = None,
+        coalesce_window_ms: float = 0.0,
+    ) -> TransportSubscription:
+        """Subscribe to routed messages streamed by the MCP server.
+
+        With a positive ``coalesce_window_ms``, messages delivered within that
+        window of the first one are enqueued together as a single batch; the
+        subscription still yields them one at a time, in order.
+        """
+
         self._ensure_open()
-        payload = dict(metrics)
-        self._invoke(self._tools.publish_metrics, payload)
+        queue: SimpleQueue[Mapping[str, Any]] | _UnbatchingQueue
+        buffer: _CoalescingBuffer | None = None
+        if coalesce_window_ms > 0:
+            queue = _UnbatchingQueue()
+            buffer = _CoalescingBuffer(queue.put, coalesce_window_ms / 1000)
+            put = buffer.append
+        else:
+            queue = SimpleQueue()
+            put = queue.put
+        return self._open_subscription(queue, put, filters, buffer)
+
+    async def asubscribe_messages(self, *, filters: Mapping[str, Any] | None = None) -> TransportSubscription:
+        """Subscribe on the running event loop; consume with ``aget`` or ``async for``.
+
+        Delivered messages are handed to the loop with ``call_soon_threadsafe``;
+        subscriptions from :meth:`subscribe_messages` cannot be awaited.
+        """
 
-    def subscribe_messages(self, *, filters: Mapping[str, Any] | None = None) -> TransportSubscription:
         self._ensure_open()
-        predicate = build_filter_predicate(filters)
-        queue: Queue[Mapping[str, Any]] = Queue()
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Mapping[str, Any]] = asyncio.Queue()
+        enqueue = queue.put_nowait
 
-        def _callback(message: Mapping[str, Any]) -> None:
+        def put(message: Mapping[str, Any]) -> None:
             try:
-                if predicate(message):
-                    queue.put(dict(message))
-            except Exception:  # pragma: no cover - defensive safety for callbacks
-                LOGGER.exception("Unhandled exception while processing MCP message callback")
+                loop.call_soon_threadsafe(enqueue, message)
+            except RuntimeError:
+                # The consumer's loop is closed; nothing can receive the message, and
+                # the error must not surface on the MCP client's callback thread.
+                pass
+
+        return self._open_subscription(queue, put, filters, None)
+
+    def _open_subscription(
+        self,
+        queue: Any,
+        put: Callable[[Mapping[str, Any]], None],
+        filters: Mapping[str, Any] | None,
+        buffer: _CoalescingBuffer | None,
+    ) -> TransportSubscription:
+        # Unfiltered subscriptions never call a predicate per message.
+        _callback: Callable[[Mapping[str, Any]], None]
+        if not filters and not self._copy_on_deliver:
+            # Unfiltered, uncopied delivery: every ``put`` handed in here never raises.
+            _callback = put
+        elif not filters:
+
+            def _callback(message: Mapping[str, Any]) -> None:
+                try:
+                    put(dict(message))
+                except Exception:  # pragma: no cover - defensive safety for callbacks
+                    LOGGER.exception("Unhandled exception while processing MCP message callback")
+
+        else:
+            predicate = build_filter_predicate(filters)
+            copy_on_deliver = self._copy_on_deliver
+
+            def _callback(message: Mapping[str, Any]) -> None:
+                try:
+                    if predicate(message):
+                        put(dict(message) if copy_on_deliver else message)
+                except Exception:  # pragma: no cover - defensive safety for callbacks
+                    LOGGER.exception("Unhandled exception while processing MCP message callback")
 
         arguments: dict[str, Any] = {"filters": dict(filters) if filters else {}}
         handle = self._subscribe(self._tools.subscribe_messages, arguments, _callback)
@@ -127,39 +420,59 @@ class DeephavenMCPTransport(MessageTransport):
         subscription: TransportSubscription | None = None
 
         def _on_close() -> None:
+            if buffer is not None:
+                buffer.cancel()
             try:
                 handle.close()
             except Exception:  # pragma: no cover - remote close best-effort
                 LOGGER.warning("Failed to close MCP subscription", exc_info=True)
-            with self._lock:
-                if subscription is not None:
-                    self._subscriptions.pop(subscription, None)
+            if subscription is not None:
+                self._subscriptions.pop(subscription, None)
 
         subscription = TransportSubscription(queue, on_close=_on_close)
-        with self._lock:
-            self._subscriptions[subscription] = handle
+        self._subscriptions[subscription] = handle
         return subscription
 
     def close(self) -> None:
+        """Flush buffered publishes and release every resource.
+
+        Teardown completes even when the final flush fails; the flush error is
+        re-raised afterwards and the unsent payloads remain in
+        :attr:`pending_publishes`.
+        """
+
         if self._closed:
             return
+        try:
+            self.flush()
+        finally:
+            self._teardown()
+
+    @property
+    def pending_publishes(self) -> dict[str, list[dict[str, Any]]]:
+        """Return a copy of the buffered, not yet sent batched publishes per tool."""
+
+        with self._pending_lock:
+            return {tool_name: list(batch) for tool_name, batch in self._pending.items()}
+
+    # Internal helpers -------------------------------------------------
+
+    def _teardown(self) -> None:
         self._closed = True
-        self._heartbeat_stop.set()
-        if self._heartbeat_thread is not None:
-            self._heartbeat_thread.join(timeout=self._heartbeat_interval or 0.1)
-        with self._lock:
-            subscriptions_snapshot = list(self._subscriptions.keys())
-        for subscription in subscriptions_snapshot:
+        if self._heartbeat is not None:
+            _HEARTBEATS.cancel(self._heartbeat)
+        if self._batch_flusher_stop is not None:
+            self._batch_flusher_stop.set()
+        # The registry is only touched through atomic single dict operations, so no
+        # lock is needed. Newest first; each close's own pop hits the fresh dict.
+        subscriptions, self._subscriptions = self._subscriptions, {}
+        for subscription in reversed(tuple(subscriptions)):
             subscription.close()
-        with self._lock:
-            self._subscriptions.clear()
         try:
             self._client.close()
         except Exception:  # pragma: no cover - best effort shutdown
             LOGGER.warning("Error while closing MCP client", exc_info=True)
 
-    # Internal helpers -------------------------------------------------
-
     def _ensure_open(self) -> None:
         if self._closed:
             raise TransportError("DeephavenMCPTransport is closed")
@@ -175,28 +488,101 @@ class DeephavenMCPTransport(MessageTransport):
             raise TransportError("Failed to handshake with MCP server") from exc
 
     def _warm_tool_cache(self) -> None:
-        for tool_name in self._iter_tool_names():
-            self._get_tool_schema(tool_name)
+        """Fetch every tool schema concurrently so warm-up costs one round-trip, not one per tool."""
+
+        tool_names = self._iter_tool_names()
+        if len(tool_names) <= 1:
+            for tool_name in tool_names:
+                self._get_tool_schema(tool_name)
+            return
+        with ThreadPoolExecutor(max_workers=len(tool_names), thread_name_prefix="deephaven-mcp-warmup") as executor:
+            futures = [executor.submit(self._get_tool_schema, tool_name) for tool_name in tool_names]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in futures:
+                error = future.exception() if future in done else None
+                if error is not None:
+                    for pending in not_done:
+                        pending.cancel()
+                    raise error
 
     def _start_heartbeat_loop(self) -> None:
         if self._tools.heartbeat is None or self._heartbeat_interval <= 0:
             return
 
-        def _loop() -> None:
-            while not self._heartbeat_stop.wait(self._heartbeat_interval):
+        interval = self._heartbeat_interval
+        skip_when_active = self._skip_heartbeat_when_active
+        # The shared scheduler only holds a weak reference, so a transport that is
+        # dropped without ``close`` is still collected and its heartbeat cancelled.
+        transport_ref = weakref.ref(self)
+
+        def _beat() -> None:
+            transport = transport_ref()
+            if transport is None or transport._closed:
+                return
+            if skip_when_active and time.monotonic() - transport._last_rpc_at < interval:
+                return
+            try:
+                transport._client.send_heartbeat()
+            except Exception:
+                LOGGER.warning("MCP heartbeat failed", exc_info=True)
+
+        self._heartbeat = _HEARTBEATS.register(_beat, interval)
+        weakref.finalize(self, _HEARTBEATS.cancel, self._heartbeat)
+
+    def _start_batch_flusher(self, interval: float) -> None:
+        # Flushes block on ``invoke_tool``, so they get their own timer thread rather
+        # than stalling every transport's heartbeat on the shared scheduler.
+        stop = Event()
+        transport_ref = weakref.ref(self)
+
+        def _run() -> None:
+            while not stop.wait(interval):
+                transport = transport_ref()
+                if transport is None or transport._closed:
+                    return
                 try:
-                    self._client.send_heartbeat()
+                    transport.flush()
                 except Exception:
-                    LOGGER.warning("MCP heartbeat failed", exc_info=True)
+                    LOGGER.warning("Background MCP batch flush failed", exc_info=True)
+                del transport
 
-        self._heartbeat_thread = Thread(target=_loop, name="deephaven-mcp-heartbeat", daemon=True)
-        self._heartbeat_thread.start()
+        self._batch_flusher_stop = stop
+        weakref.finalize(self, stop.set)
+        Thread(target=_run, name="deephaven-mcp-batch-flush", daemon=True).start()
+
+    def _publish(self, tool_name: str, payload: Mapping[str, Any]) -> None:
+        self._ensure_open()
+        if self._batch_size <= 0:
+            self._invoke(tool_name, _coerce_payload(payload))
+            return
+        # Buffered payloads outlive the call, so unlike direct invokes they are
+        # copied: callers may reuse and mutate the mapping they published.
+        buffered = dict(payload)
+        with self._pending_lock:
+            pending = self._pending.setdefault(tool_name, [])
+            pending.append(buffered)
+            if len(pending) < self._batch_size:
+                return
+            del self._pending[tool_name]
+        try:
+            self._invoke(tool_name, {"batch": pending})
+        except BaseException:
+            self._restore_pending([(tool_name, pending)])
+            raise
+
+    def _restore_pending(self, batches: list[tuple[str, list[dict[str, Any]]]]) -> None:
+        """Put unsent ``batches`` back ahead of anything buffered since they were taken."""
+
+        with self._pending_lock:
+            for tool_name, batch in batches:
+                self._pending[tool_name] = batch + self._pending.get(tool_name, [])
 
     def _invoke(self, tool_name: str, payload: Mapping[str, Any]) -> Mapping[str, Any]:
+        self._last_rpc_at = time.monotonic()
         try:
             return self._client.invoke_tool(tool_name, payload)
         except Exception as exc:
-            msg = f"Failed to invoke MCP tool '{tool_name}'"
+            msg = self._invoke_errors.get(tool_name) or f"Failed to invoke MCP tool '{tool_name}'"
             raise TransportError(msg) from exc
 
     def _subscribe(
@@ -205,6 +591,7 @@ class DeephavenMCPTransport(MessageTransport):
         arguments: Mapping[str, Any],
         callback: Callable[[Mapping[str, Any]], None],
     ) -> MCPSubscriptionHandle:
+        self._last_rpc_at = time.monotonic()
         try:
             return self._client.subscribe(tool_name, arguments, callback)
         except Exception as exc:
@@ -212,8 +599,9 @@ class DeephavenMCPTransport(MessageTransport):
             raise TransportError(msg) from exc
 
     def _get_tool_schema(self, tool_name: str) -> Mapping[str, Any]:
-        with self._lock:
-            cached = self._tool_cache.get(tool_name)
+        # Single dict operations are atomic, so cached reads take no lock. Concurrent
+        # misses may both fetch, but ``setdefault`` keeps the first stored schema.
+        cached = self._tool_cache.get(tool_name)
         if cached is not None:
             return cached
         try:
@@ -221,32 +609,10 @@ class DeephavenMCPTransport(MessageTransport):
         except Exception as exc:
             msg = f"Failed to fetch schema for MCP tool '{tool_name}'"
             raise TransportError(msg) from exc
-        with self._lock:
-            self._tool_cache[tool_name] = schema
-        return schema
-
-    def _iter_tool_names(self) -> list[str]:
-        tool_names = [
-            self._tools.publish_message,
-            self._tools.publish_event,
-            self._tools.publish_metrics,
-            self._tools.subscribe_messages,
-        ]
-        return [name for name in tool_names if name]
-
-
-__all__ = ["DeephavenMCPTools", "DeephavenMCPTransport", "MCPClientProtocol", "MCPSubscriptionHandle"]
-"""Model Context Protocol transport primitives."""
-
-from __future__ import annotations
-
-import time
-from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Mapping, MutableMapping
+        return self._tool_cache.setdefault(tool_name, schema)
 
-from deepagents.transports.base import TransportError
-
-__all__ = ["HandshakeResult", "MCPTransport"]
+    def _iter_tool_names(self) -> tuple[str, ...]:
+        return self._tools.active_tool_names
 
 
 @dataclass(slots=True)
@@ -407,3 +773,12 @@ class MCPTransport:
         if not self._connected:
             raise TransportError("MCP transport is not connected")
 
+
+__all__ = [
+    "DeephavenMCPTools",
+    "DeephavenMCPTransport",
+    "HandshakeResult",
+    "MCPClientProtocol",
+    "MCPSubscriptionHandle",
+    "MCPTransport",
+]
@@ -2,19 +2,34 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence
 
-from deepagents.transports.base import QueueBackedTransport, TransportSubscription
+from deepagents.transports.base import OverflowPolicy, QueueBackedTransport, TransportSubscription
+
+
+def _read_only(payload: Mapping[str, Any]) -> Mapping[str, Any]:
+    return payload if type(payload) is MappingProxyType else MappingProxyType(payload)
 
 
 class InMemoryTransport(QueueBackedTransport):
-    """Simple message transport that stores payloads in local memory."""
+    """Simple message transport that stores payloads in local memory.
+
+    Published payloads are recorded by reference behind read-only
+    :class:`~types.MappingProxyType` views rather than copied, so callers must
+    not mutate a mapping after publishing it. Copy a recorded entry with
+    ``dict(...)`` when a mutable version is needed.
+
+    Each history keeps at most ``history_capacity`` entries; once full, the
+    oldest entry is evicted for every new one. Pass ``None`` to keep everything.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, *, history_capacity: int | None = 10_000) -> None:
         super().__init__()
-        self._messages: list[Mapping[str, Any]] = []
-        self._events: list[Mapping[str, Any]] = []
-        self._metrics: list[Mapping[str, Any]] = []
+        self._messages: deque[Mapping[str, Any]] = deque(maxlen=history_capacity)
+        self._events: deque[Mapping[str, Any]] = deque(maxlen=history_capacity)
+        self._metrics: deque[Mapping[str, Any]] = deque(maxlen=history_capacity)
 
     @property
     def messages(self) -> list[Mapping[str, Any]]:
@@ -31,14 +46,30 @@ class InMemoryTransport(QueueBackedTransport):
         return list(self._metrics)
 
     def publish_message(self, message: Mapping[str, Any]) -> None:
-        self._messages.append(dict(message))
+        self._messages.append(_read_only(message))
         self._broadcast(message)
 
+    def publish_messages_batch(self, messages: Sequence[Mapping[str, Any]]) -> None:
+        self._messages.extend(map(_read_only, messages))
+        self._broadcast_many(messages)
+
     def publish_event(self, event: Mapping[str, Any]) -> None:
-        self._events.append(dict(event))
+        self._events.append(_read_only(event))
 
     def publish_metrics(self, metrics: Mapping[str, Any]) -> None:
-        self._metrics.append(dict(metrics))
+        self._metrics.append(_read_only(metrics))
+
+    def subscribe_messages(
+        self,
+        *,
+        filters: Mapping[str, Any] | None = None,
+        maxsize: int = 0,
+        policy: OverflowPolicy = "block",
+    ) -> TransportSubscription:
+        # Deques reject iteration while being appended to, so replay a snapshot.
+        return self._create_subscription(filters=filters, replay=list(self._messages), maxsize=maxsize, policy=policy)
+
+    async def asubscribe_messages(self, *, filters: Mapping[str, Any] | None = None) -> TransportSubscription:
+        """Subscribe on the running event loop; consume with ``aget`` or ``async for``."""
 
-    def subscribe_messages(self, *, filters: Mapping[str, Any] | None = None) -> TransportSubscription:
-        return self._create_subscription(filters=filters, replay=self._messages)
+        return self._create_subscription(filters=filters, replay=list(self._messages), async_mode=True)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable, Sequence
 from contextlib import AbstractContextManager
 import json
+import threading
 from typing import Any
 
 import pytest
@@ -175,3 +176,37 @@ def test_close_flushes_and_unsubscribes(writer_factory, fake_client: FakeMCPClie
     assert payload["updates"] == [{"symbol": "AAPL", "price": 198.25}]
     assert len(bus_events) == 1
     assert fake_client.closed_streams == ["prices"]
+
+
+def test_concurrent_streams_flush_every_update(writer_factory, fake_client: FakeMCPClient) -> None:
+    emitter = DeephavenTelemetryEmitter(
+        session=object(),
+        agent_events_table="agent_events",
+        agent_metrics_table="agent_metrics",
+        batch_size=1,
+        writer_factory=writer_factory,
+    )
+    config = MCPStreamBridgeConfig(agent_id="agent-1", buffer_size=5)
+    subscriber = MCPStreamSubscriber(fake_client, emitter, bridge_config=config)
+    streams = ["alpha", "beta", "gamma"]
+    for stream in streams:
+        subscriber.subscribe(stream)
+
+    def _produce(stream: str) -> None:
+        for index in range(50):
+            fake_client.push(stream, {"id": index})
+
+    threads = [threading.Thread(target=_produce, args=(stream,)) for stream in streams]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    subscriber.close()
+
+    sink: list[RecordingWriter] = writer_factory.sink  # type: ignore[attr-defined]
+    seen: dict[str, list[int]] = {stream: [] for stream in streams}
+    for writer in sink:
+        for row in writer.rows:
+            payload = json.loads(row[4])
+            seen[payload["stream"]].extend(item["id"] for item in payload["updates"])
+    assert all(sorted(ids) == list(range(50)) for ids in seen.values())
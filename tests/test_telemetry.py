@@ -6,6 +6,7 @@ from collections.abc import Sequence
 from contextlib import AbstractContextManager
 from datetime import datetime, timezone
 import json
+import threading
 from typing import Any
 
 import pytest
@@ -159,3 +160,181 @@ def test_close_idempotent_flushes_remaining_rows() -> None:
     assert metric_writer.table_name == "agent_metrics"
     assert event_writer.rows[0][0] == ts
     assert metric_writer.rows[0][3] == pytest.approx(0.5)
+
+
+def test_custom_schema_order_and_unknown_columns() -> None:
+    sink: list[RecordingWriter] = []
+    reordered_schema = (
+        ColumnSpec("event_type", "String"),
+        ColumnSpec("timestamp", "Instant"),
+        ColumnSpec("extra", "String"),
+    )
+    emitter = DeephavenTelemetryEmitter(
+        session=object(),
+        agent_events_table="agent_events",
+        agent_metrics_table="agent_metrics",
+        event_schema=reordered_schema,
+        writer_factory=build_writer_factory(sink),
+    )
+
+    ts = datetime(2024, 3, 3, tzinfo=timezone.utc)
+    emitter.emit_event(timestamp=ts, agent_id="a", event_type="started")
+    emitter.emit_event(timestamp=ts, agent_id="a", event_type="stopped")
+    emitter.flush()
+
+    assert len(sink) == 1
+    assert sink[0].column_names == ["event_type", "timestamp", "extra"]
+    assert sink[0].rows == [("started", ts, None), ("stopped", ts, None)]
+
+
+class ColumnarRecordingWriter(RecordingWriter):
+    """Writer exposing the columnar ``write_rows`` fast path."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.batches: list[list[list[Any]]] = []
+
+    def write_rows(self, columns: Sequence[Sequence[Any]]) -> None:
+        self.batches.append([list(column) for column in columns])
+
+    def write_row(self, *values: Any) -> None:  # pragma: no cover - must not be used
+        raise AssertionError("write_row should not be called when write_rows is available")
+
+
+def test_columnar_writer_receives_single_batch() -> None:
+    sink: list[RecordingWriter] = []
+
+    def _factory(table_name: str, column_names: Sequence[str], column_types: Sequence[Any]) -> RecordingWriter:
+        return ColumnarRecordingWriter(table_name, column_names, column_types, sink)
+
+    emitter = DeephavenTelemetryEmitter(
+        session=object(),
+        agent_events_table="agent_events",
+        agent_metrics_table="agent_metrics",
+        batch_size=3,
+        writer_factory=_factory,
+    )
+
+    ts = datetime(2024, 4, 4, tzinfo=timezone.utc)
+    for index in range(3):
+        emitter.emit_metric(timestamp=ts, agent_id="a", metric_name="step", metric_value=index)
+
+    assert len(sink) == 1
+    writer = sink[0]
+    assert isinstance(writer, ColumnarRecordingWriter)
+    assert len(writer.batches) == 1
+    columns = writer.batches[0]
+    assert columns[2] == ["step", "step", "step"]
+    assert columns[3] == [0.0, 1.0, 2.0]
+
+
+def test_background_flush_writes_off_the_producer_thread() -> None:
+    sink: list[RecordingWriter] = []
+    writer_threads: list[str] = []
+    factory = build_writer_factory(sink)
+
+    def _factory(table_name: str, column_names: Sequence[str], column_types: Sequence[Any]) -> RecordingWriter:
+        writer_threads.append(threading.current_thread().name)
+        return factory(table_name, column_names, column_types)
+
+    emitter = DeephavenTelemetryEmitter(
+        session=object(),
+        agent_events_table="agent_events",
+        agent_metrics_table="agent_metrics",
+        batch_size=2,
+        writer_factory=_factory,
+        background_flush=True,
+    )
+
+    ts = datetime(2024, 5, 5, tzinfo=timezone.utc)
+    for index in range(5):
+        emitter.emit_event(timestamp=ts, agent_id="a", event_type=f"step-{index}")
+    emitter.flush()
+
+    assert [row[2] for writer in sink for row in writer.rows] == [f"step-{index}" for index in range(5)]
+    assert threading.current_thread().name not in writer_threads
+
+    emitter.close()
+    emitter.close()
+
+
+def test_background_backlog_drops_oldest_batches() -> None:
+    sink: list[RecordingWriter] = []
+    entered = threading.Event()
+    release = threading.Event()
+    factory = build_writer_factory(sink)
+
+    def _blocking_factory(table_name: str, column_names: Sequence[str], column_types: Sequence[Any]) -> RecordingWriter:
+        if not entered.is_set():
+            entered.set()
+            release.wait(timeout=5)
+        return factory(table_name, column_names, column_types)
+
+    emitter = DeephavenTelemetryEmitter(
+        session=object(),
+        agent_events_table="agent_events",
+        agent_metrics_table="agent_metrics",
+        batch_size=2,
+        writer_factory=_blocking_factory,
+        background_flush=True,
+        max_buffered_rows=4,
+    )
+
+    ts = datetime(2024, 6, 6, tzinfo=timezone.utc)
+    emitter.emit_event(timestamp=ts, agent_id="a", event_type="e0")
+    emitter.emit_event(timestamp=ts, agent_id="a", event_type="e1")
+    assert entered.wait(timeout=5)
+    for index in range(2, 10):
+        emitter.emit_event(timestamp=ts, agent_id="a", event_type=f"e{index}")
+    release.set()
+    emitter.close()
+
+    written = [row[2] for writer in sink for row in writer.rows]
+    assert written == ["e0", "e1", "e6", "e7", "e8", "e9"]
+    assert emitter.dropped_rows == 4
+
+
+def test_max_buffered_rows_must_cover_a_batch() -> None:
+    with pytest.raises(ValueError):
+        DeephavenTelemetryEmitter(
+            session=object(),
+            agent_events_table="agent_events",
+            agent_metrics_table="agent_metrics",
+            batch_size=10,
+            max_buffered_rows=5,
+        )
+
+
+def test_default_writer_factory_requires_batch_table_writer() -> None:
+    with pytest.raises(AttributeError):
+        DeephavenTelemetryEmitter(
+            session=object(),
+            agent_events_table="agent_events",
+            agent_metrics_table="agent_metrics",
+        )
+
+
+def test_background_batch_size_adapts_to_flush_latency() -> None:
+    emitter = DeephavenTelemetryEmitter(
+        session=object(),
+        agent_events_table="agent_events",
+        agent_metrics_table="agent_metrics",
+        batch_size=2,
+        writer_factory=build_writer_factory([]),
+        background_flush=True,
+        max_batch_size=8,
+    )
+
+    emitter._tune_batch_size(0.001)
+    assert emitter.effective_batch_size == 2
+
+    emitter._pending_rows = 1
+    for _ in range(3):
+        emitter._tune_batch_size(0.001)
+    assert emitter.effective_batch_size == 8
+
+    emitter._pending_rows = 0
+    for _ in range(3):
+        emitter._tune_batch_size(0.5)
+    assert emitter.effective_batch_size == 2
+    emitter.close()
@@ -104,3 +104,91 @@ def test_mcp_tool_adapter_validates_output_schema():
 
     with pytest.raises(ValueError):
         tool.invoke({"query": "SELECT 1"})
+
+
+def test_mcp_tool_adapters_share_compiled_models():
+    schema = MCPToolSchema(
+        name="run_query",
+        description="Execute a Deephaven query.",
+        input_schema={"type": "object", "properties": {"query": {"type": "string"}}, "required": ["query"]},
+    )
+    first = MCPToolAdapter(client=FakeClient(), server_name="deephaven", schema=schema)
+    second = MCPToolAdapter(client=FakeClient(), server_name="deephaven", schema=schema)
+
+    assert first.to_tool().args_schema is second.to_tool().args_schema
+
+
+def test_mcp_tool_adapter_sync_invocation_with_async_only_client():
+    class AsyncOnlyClient:
+        def __init__(self) -> None:
+            self.calls: list[tuple[str, str, dict[str, object]]] = []
+
+        async def call_tool(self, server_name: str, tool_name: str, *, arguments):
+            self.calls.append((server_name, tool_name, dict(arguments)))
+            return {"status": "ok"}
+
+    client = AsyncOnlyClient()
+    schema = MCPToolSchema(
+        name="run_query",
+        description="Execute a Deephaven query.",
+        input_schema={"type": "object", "properties": {"query": {"type": "string"}}, "required": ["query"]},
+    )
+    tool = MCPToolAdapter(client=client, server_name="deephaven", schema=schema).to_tool()
+
+    assert tool.invoke({"query": "SELECT 1"}) == {"status": "ok"}
+
+    async def _invoke_inside_running_loop():
+        return tool.invoke({"query": "SELECT 2"})
+
+    assert asyncio.run(_invoke_inside_running_loop()) == {"status": "ok"}
+    assert [call[2]["query"] for call in client.calls] == ["SELECT 1", "SELECT 2"]
+
+
+def test_mcp_tool_adapter_rejects_missing_required_arguments():
+    schema = MCPToolSchema(
+        name="run_query",
+        description="Execute a Deephaven query.",
+        input_schema={
+            "type": "object",
+            "properties": {"query": {"type": "string"}, "limit": {"type": "integer"}},
+            "required": ["query"],
+        },
+    )
+    adapter = MCPToolAdapter(client=FakeClient(), server_name="deephaven", schema=schema)
+
+    assert adapter._coerce_input({"query": "SELECT 1", "limit": "3", "unknown": True}) == {
+        "query": "SELECT 1",
+        "limit": 3,
+    }
+    with pytest.raises(ValueError):
+        adapter._coerce_input({"limit": 3})
+    with pytest.raises(ValueError):
+        adapter._coerce_input({"query": "SELECT 1", "limit": "many"})
+
+
+def test_mcp_tool_adapter_forwards_output_for_permissive_schema():
+    schema = MCPToolSchema(
+        name="run_query",
+        description="Execute a Deephaven query.",
+        input_schema={"type": "object", "properties": {"query": {"type": "string"}}},
+        output_schema={"type": "object", "properties": {"status": {"type": "string"}}},
+    )
+    adapter = MCPToolAdapter(client=FakeClient(), server_name="deephaven", schema=schema)
+    result = {"status": "ok", "rows": [{"value": 1}]}
+
+    assert adapter._coerce_output(result) is result
+
+
+def test_mcp_tool_adapter_permissive_schema_skips_property_types_but_rejects_non_mappings():
+    schema = MCPToolSchema(
+        name="count_rows",
+        description="Count rows in a Deephaven table.",
+        input_schema={"type": "object", "properties": {"table": {"type": "string"}}},
+        output_schema={"properties": {"count": {"type": "integer"}}},
+    )
+    adapter = MCPToolAdapter(client=FakeClient(), server_name="deephaven", schema=schema)
+
+    # Property types are not enforced for purely structural output schemas.
+    assert adapter._coerce_output({"count": "abc"}) == {"count": "abc"}
+    with pytest.raises(ValueError):
+        adapter._coerce_output("not a dict")
@@ -0,0 +1,177 @@
+import asyncio
+import threading
+
+import pytest
+
+from deepagents.transports.base import TransportError, build_filter_predicate
+from deepagents.transports.memory import InMemoryTransport
+
+
+def test_filter_predicate_matches_every_key():
+    predicate = build_filter_predicate({"recipient": "agent-a", "priority": 1})
+
+    assert predicate({"recipient": "agent-a", "priority": 1, "body": "hi"})
+    assert not predicate({"recipient": "agent-a", "priority": 2})
+    assert not predicate({"priority": 1})
+    assert build_filter_predicate({"priority": 1, "recipient": "agent-a"}) is predicate
+
+
+def test_filter_predicate_inlines_literal_values():
+    predicate = build_filter_predicate({"recipient": "agent-a", "priority": 1, "weight": float("nan")})
+
+    assert {"recipient", "agent-a", 1}.issubset(predicate.__code__.co_consts)
+    assert not predicate({"recipient": "agent-a", "priority": 1, "weight": float("nan")})
+    assert build_filter_predicate({"flag": None})({"other": 1})
+
+
+def test_filter_predicate_handles_unhashable_values():
+    predicate = build_filter_predicate({"tags": ["a", "b"]})
+
+    assert predicate({"tags": ["a", "b"]})
+    assert not predicate({"tags": ["a"]})
+    assert build_filter_predicate(None)({"anything": True})
+
+
+def test_queue_backed_transport_stops_delivering_after_close():
+    transport = InMemoryTransport()
+    first = transport.subscribe_messages()
+    first_queue = first._queue
+    second = transport.subscribe_messages(filters={"recipient": "agent-b"})
+
+    transport.publish_message({"recipient": "agent-a"})
+    first.close()
+    transport.publish_message({"recipient": "agent-b"})
+
+    assert first_queue.qsize() == 1
+    assert second.get(timeout=0.1) == {"recipient": "agent-b"}
+    assert transport._unfiltered_puts == ()
+    assert len(transport._watchers) == 1
+    second.close()
+    assert transport._watchers == ()
+
+
+def test_publish_messages_batch_fans_out_in_order():
+    transport = InMemoryTransport()
+    subscription = transport.subscribe_messages(filters={"recipient": "agent-a"})
+
+    transport.publish_messages_batch(
+        [{"recipient": "agent-a", "seq": 1}, {"recipient": "agent-b", "seq": 2}, {"recipient": "agent-a", "seq": 3}]
+    )
+
+    assert [subscription.get(timeout=0.1)["seq"] for _ in range(2)] == [1, 3]
+    assert [message["seq"] for message in transport.messages] == [1, 2, 3]
+
+
+def test_async_subscription_receives_messages_from_other_threads():
+    async def _consume():
+        transport = InMemoryTransport()
+        transport.publish_message({"seq": 0})
+        async with await transport.asubscribe_messages() as subscription:
+            publisher = threading.Thread(target=transport.publish_message, args=({"seq": 1},))
+            publisher.start()
+            received = [await subscription.aget(timeout=1.0), await subscription.aget(timeout=1.0)]
+            publisher.join()
+            with pytest.raises(TimeoutError):
+                await subscription.aget(timeout=0.01)
+        return received
+
+    assert [message["seq"] for message in asyncio.run(_consume())] == [0, 1]
+
+
+def test_closed_subscription_rejects_reads():
+    transport = InMemoryTransport()
+    subscription = transport.subscribe_messages()
+    subscription.close()
+    subscription.close()
+
+    with pytest.raises(TransportError):
+        subscription.get(timeout=0.01)
+    with pytest.raises(TransportError):
+        asyncio.run(subscription.aget())
+
+
+def test_sync_subscription_rejects_aget():
+    transport = InMemoryTransport()
+    subscription = transport.subscribe_messages()
+
+    with pytest.raises(TransportError, match="get"):
+        asyncio.run(subscription.aget(timeout=0.01))
+    transport.publish_message({"seq": 1})
+    assert subscription.get(timeout=0.1) == {"seq": 1}
+
+
+@pytest.mark.parametrize(("policy", "expected"), [("drop_oldest", [2, 3]), ("drop_newest", [0, 1])])
+def test_bounded_subscription_overflow_policies(policy, expected):
+    transport = InMemoryTransport()
+    transport.publish_message({"seq": 0})
+    subscription = transport.subscribe_messages(maxsize=2, policy=policy)
+
+    for seq in (1, 2, 3):
+        transport.publish_message({"seq": seq})
+
+    assert [subscription.get(timeout=0.1)["seq"] for _ in range(2)] == expected
+    with pytest.raises(TimeoutError):
+        subscription.get(timeout=0.01)
+
+
+def test_bounded_subscription_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        InMemoryTransport().subscribe_messages(maxsize=1, policy="spill")
+
+
+def test_in_memory_transport_records_read_only_views():
+    transport = InMemoryTransport()
+    message = {"seq": 1}
+    transport.publish_message(message)
+    transport.publish_event({"kind": "claimed"})
+
+    recorded = transport.messages[0]
+    assert recorded == message
+    with pytest.raises(TypeError):
+        recorded["seq"] = 2  # type: ignore[index]
+    assert transport.events == [{"kind": "claimed"}]
+    assert transport.subscribe_messages().get(timeout=0.1) == {"seq": 1}
+
+
+def test_in_memory_transport_history_is_bounded():
+    transport = InMemoryTransport(history_capacity=2)
+    for seq in range(3):
+        transport.publish_message({"seq": seq})
+
+    assert [message["seq"] for message in transport.messages] == [1, 2]
+    subscription = transport.subscribe_messages()
+    assert [subscription.get(timeout=0.1)["seq"] for _ in range(2)] == [1, 2]
+
+
+def test_async_subscription_on_closed_loop_is_dropped_by_publishers():
+    transport = InMemoryTransport()
+
+    async def _subscribe():
+        return await transport.asubscribe_messages()
+
+    asyncio.run(_subscribe())
+    survivor = transport.subscribe_messages()
+
+    transport.publish_message({"seq": 1})
+    transport.publish_message({"seq": 2})
+
+    assert transport._unfiltered_puts == (survivor._queue.put_nowait,)
+    assert [survivor.get(timeout=0.1)["seq"] for _ in range(2)] == [1, 2]
+
+
+def test_closing_a_full_blocking_subscription_releases_the_publisher():
+    transport = InMemoryTransport()
+    blocked = transport.subscribe_messages(maxsize=1, policy="block")
+    other = transport.subscribe_messages()
+    transport.publish_message({"seq": 1})
+
+    publisher = threading.Thread(target=transport.publish_message, args=({"seq": 2},))
+    publisher.start()
+    publisher.join(timeout=0.1)
+    assert publisher.is_alive()
+
+    blocked.close()
+    publisher.join(timeout=1.0)
+
+    assert not publisher.is_alive()
+    assert [other.get(timeout=0.1)["seq"] for _ in range(2)] == [1, 2]
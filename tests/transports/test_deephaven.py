@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Mapping
+
+import pytest
+
+from deepagents.transports.deephaven import DeephavenTransport
+
+
+class _Handle:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _UnfilteredSession:
+    """Session that ignores ``where=`` so the transport's own filtering is observable."""
+
+    def __init__(self) -> None:
+        self.published: list[tuple[str, Mapping[str, Any]]] = []
+        self.callbacks: list[Callable[[Mapping[str, Any]], None]] = []
+        self.where: list[Mapping[str, Any] | None] = []
+
+    def publish(self, table: str, data: Mapping[str, Any]) -> None:
+        self.published.append((table, data))
+        for callback in list(self.callbacks):
+            callback(data)
+
+    def subscribe(self, table, callback, *, where=None):
+        self.callbacks.append(callback)
+        self.where.append(where)
+        return _Handle()
+
+
+def test_scalar_filters_are_pushed_down_to_the_session():
+    session = _UnfilteredSession()
+    transport = DeephavenTransport(session=session)
+    subscription = transport.subscribe_messages(filters={"recipient": "agent-a"})
+
+    transport.publish_message({"recipient": "agent-b"})
+
+    assert session.where == [{"recipient": "agent-a"}]
+    assert subscription.get(timeout=0.1) == {"recipient": "agent-b"}
+    transport.close()
+
+
+def test_non_scalar_filters_are_checked_locally():
+    session = _UnfilteredSession()
+    transport = DeephavenTransport(session=session)
+    subscription = transport.subscribe_messages(filters={"tags": ["a"]})
+
+    transport.publish_message({"tags": ["b"]})
+    transport.publish_message({"tags": ["a"]})
+
+    assert subscription.get(timeout=0.1) == {"tags": ["a"]}
+    transport.close()
+
+
+def test_copy_on_deliver_snapshots_reused_rows():
+    session = _UnfilteredSession()
+    transport = DeephavenTransport(session=session, copy_on_deliver=True)
+    subscription = transport.subscribe_messages()
+    row = {"recipient": "agent-a"}
+
+    transport.publish_message(row)
+    row["recipient"] = "agent-b"
+
+    assert subscription.get(timeout=0.1) == {"recipient": "agent-a"}
+    transport.close()
+
+
+def test_publish_messages_batch_uses_publish_many_when_available():
+    class _BulkSession(_UnfilteredSession):
+        def __init__(self) -> None:
+            super().__init__()
+            self.bulk: list[tuple[str, list[Mapping[str, Any]]]] = []
+
+        def publish_many(self, table, rows):
+            self.bulk.append((table, list(rows)))
+
+    bulk_session = _BulkSession()
+    DeephavenTransport(session=bulk_session).publish_messages_batch([{"seq": 1}, {"seq": 2}])
+    assert bulk_session.bulk == [("agent_messages", [{"seq": 1}, {"seq": 2}])]
+
+    session = _UnfilteredSession()
+    DeephavenTransport(session=session).publish_messages_batch([{"seq": 1}, {"seq": 2}])
+    assert session.published == [("agent_messages", {"seq": 1}), ("agent_messages", {"seq": 2})]
+
+
+def test_closing_subscriptions_releases_session_handles():
+    handles: list[_Handle] = []
+
+    class _TrackingSession(_UnfilteredSession):
+        def subscribe(self, table, callback, *, where=None):
+            handles.append(super().subscribe(table, callback, where=where))
+            return handles[-1]
+
+    transport = DeephavenTransport(session=_TrackingSession())
+    first = transport.subscribe_messages()
+    transport.subscribe_messages()
+
+    first.close()
+    assert [handle.closed for handle in handles] == [True, False]
+    assert len(transport._subscriptions) == 1
+
+    transport.close()
+    assert all(handle.closed for handle in handles)
+    assert transport._subscriptions == {}
+
+
+def test_buffered_publishes_flush_in_batches():
+    class _BulkSession(_UnfilteredSession):
+        def __init__(self) -> None:
+            super().__init__()
+            self.bulk: list[list[Mapping[str, Any]]] = []
+
+        def publish_many(self, table, rows):
+            self.bulk.append([row["seq"] for row in rows])
+
+    session = _BulkSession()
+    transport = DeephavenTransport(session=session, publish_batch_size=2)
+
+    for seq in range(3):
+        transport.publish_message({"seq": seq})
+    assert session.bulk == [[0, 1]]
+
+    transport.close()
+    assert session.bulk == [[0, 1], [2]]
+    assert session.published == []
+
+
+def test_flush_interval_delivers_a_lone_buffered_message():
+    delivered = threading.Event()
+
+    class _BulkSession(_UnfilteredSession):
+        def __init__(self) -> None:
+            super().__init__()
+            self.bulk: list[list[Mapping[str, Any]]] = []
+
+        def publish_many(self, table, rows):
+            self.bulk.append([row["seq"] for row in rows])
+            delivered.set()
+
+    session = _BulkSession()
+    transport = DeephavenTransport(session=session, publish_batch_size=10, flush_interval_ms=10)
+
+    transport.publish_message({"seq": 0})
+
+    assert delivered.wait(timeout=1.0)
+    assert session.bulk == [[0]]
+    transport.close()
+    assert session.bulk == [[0]]
+
+
+def test_buffered_messages_are_copied_and_restored_after_a_failed_flush():
+    class _FlakySession(_UnfilteredSession):
+        def __init__(self) -> None:
+            super().__init__()
+            self.fail = True
+            self.bulk: list[list[Any]] = []
+
+        def publish_many(self, table, rows):
+            if self.fail:
+                raise RuntimeError("session unavailable")
+            self.bulk.append([row["seq"] for row in rows])
+
+    session = _FlakySession()
+    transport = DeephavenTransport(session=session, publish_batch_size=2)
+
+    message = {"seq": 0}
+    transport.publish_message(message)
+    message["seq"] = 1
+    with pytest.raises(RuntimeError):
+        transport.publish_message(message)
+
+    assert session.bulk == []
+
+    session.fail = False
+    transport.publish_message({"seq": 2})
+    assert session.bulk == [[0, 1, 2]]
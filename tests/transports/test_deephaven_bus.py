@@ -0,0 +1,479 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+import time
+from queue import Empty
+from typing import Any
+
+import pytest
+
+from deepagents.transports import deephaven_bus
+from deepagents.transports.deephaven_bus import DeephavenBus, DeephavenBusConfig
+
+_LITERAL = re.compile(r"`([^`]*)`")
+
+
+def _compile_where(expr: str):
+    source = _LITERAL.sub(lambda match: repr(match.group(1)), expr).replace("&&", " and ").replace("||", " or ")
+    code = compile(source, "<where>", "eval")
+    return lambda row: eval(code, {}, dict(row))  # noqa: S307 - test-only expression evaluator
+
+
+class _FakeArrowTable:
+    def __init__(self, names: tuple[str, ...], rows: list[dict[str, Any]]) -> None:
+        self.column_names = list(names)
+        self._rows = rows
+
+    def to_pydict(self) -> dict[str, list[Any]]:
+        return {name: [row.get(name) for row in self._rows] for name in self.column_names}
+
+    def to_pylist(self) -> list[dict[str, Any]]:
+        return [{name: row.get(name) for name in self.column_names} for row in self._rows]
+
+
+class _FakeTable:
+    def __init__(self, source: "_FakeInputTable", wheres: tuple[str, ...] = (), limit: int | None = None) -> None:
+        self._source = source
+        self.wheres = wheres
+        self._limit = limit
+
+    def where(self, expr: str) -> "_FakeTable":
+        self._source.where_calls.append(expr)
+        return _FakeTable(self._source, (*self.wheres, expr), self._limit)
+
+    def head(self, count: int) -> "_FakeTable":
+        return _FakeTable(self._source, self.wheres, count)
+
+    def snapshot(self) -> "_FakeTable":
+        return self
+
+    def to_arrow(self) -> _FakeArrowTable:
+        predicates = [_compile_where(expr) for expr in self.wheres]
+        rows = [row for row in self._source.rows() if all(predicate(row) for predicate in predicates)]
+        return _FakeArrowTable(self._source.names, rows[: self._limit] if self._limit is not None else rows)
+
+
+class _FakeInputTable:
+    def __init__(self, schema, key_columns) -> None:
+        self.names = tuple(name for name, _ in schema)
+        self._key_columns = key_columns
+        self._keyed: dict[tuple[Any, ...], dict[str, Any]] = {}
+        self._appended: list[dict[str, Any]] = []
+        self.add_calls = 0
+        self.where_calls: list[str] = []
+
+    def add(self, rows) -> None:
+        self.add_calls += 1
+        for row in rows:
+            if self._key_columns:
+                self._keyed[tuple(row[column] for column in self._key_columns)] = dict(row)
+            else:
+                self._appended.append(dict(row))
+
+    def rows(self) -> list[dict[str, Any]]:
+        return list(self._keyed.values()) if self._key_columns else list(self._appended)
+
+
+class _FakeTableService:
+    def __init__(self, session: "_FakeSession") -> None:
+        self._session = session
+
+    def input_table_for(self, name: str) -> _FakeInputTable:
+        return self._session.inputs[name]
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.inputs = {
+            "agent_messages": _FakeInputTable(DeephavenBus.MESSAGE_SCHEMA, ("message_id",)),
+            "agent_events": _FakeInputTable(DeephavenBus.EVENT_SCHEMA, None),
+            "agent_metrics": _FakeInputTable(DeephavenBus.METRIC_SCHEMA, ("window_start", "agent_id", "session_id")),
+        }
+        self.table_service = _FakeTableService(self)
+        self.alive_checks = 0
+
+    def open_table(self, name: str) -> _FakeTable:
+        return _FakeTable(self.inputs[name])
+
+    def is_alive(self) -> bool:
+        self.alive_checks += 1
+        return True
+
+
+def _make_bus(session: _FakeSession | None = None, **overrides: Any) -> tuple[DeephavenBus, _FakeSession]:
+    session = session or _FakeSession()
+    bus = DeephavenBus(DeephavenBusConfig(session_factory=lambda: session, **overrides))
+    return bus, session
+
+
+def test_claim_ack_round_trip_by_priority():
+    bus, session = _make_bus()
+    low = bus.publish({"topic": "work", "priority": 0, "agent_id": "producer"})
+    high = bus.publish({"topic": "work", "priority": 5, "agent_id": "producer"})
+
+    claimed = bus.claim(agent_id="worker", topic="work")
+    assert claimed is not None
+    assert claimed["message_id"] == high
+    assert claimed["status"] == "processing"
+    assert bus.ack(high, agent_id="worker")
+
+    assert bus.claim(agent_id="worker", topic="work")["message_id"] == low
+    assert bus.claim(agent_id="worker", topic="work") is None
+    assert not bus.ack("missing")
+    statuses = {row["message_id"]: row["status"] for row in session.inputs["agent_messages"].rows()}
+    assert statuses == {high: "done", low: "processing"}
+
+
+def test_fetch_messages_pushes_ingest_watermark_into_where():
+    bus, session = _make_bus()
+    bus.publish({"topic": "work", "ingest_ts": 10})
+    bus.publish({"topic": "work", "ingest_ts": 20})
+
+    rows = bus._fetch_messages("topic == `work`", 10)
+
+    assert [row["ingest_ts"] for row in rows] == [20]
+    assert session.inputs["agent_messages"].where_calls[-1] == "(topic == `work`) && ingest_ts > 10"
+
+
+def test_table_to_dicts_transposes_columns():
+    bus, _ = _make_bus()
+
+    class _Snapshot:
+        def __init__(self, columns):
+            self._columns = columns
+
+        def to_arrow(self):
+            columns = self._columns
+
+            class _Arrow:
+                num_rows = len(next(iter(columns.values()), []))
+
+                def to_pydict(self):
+                    return columns
+
+            return _Arrow()
+
+    assert bus._table_to_dicts(_Snapshot({"a": [], "b": []})) == []
+    assert bus._table_to_dicts(_Snapshot({"a": [1], "b": ["x"]})) == [{"a": 1, "b": "x"}]
+    assert bus._table_to_dicts(_Snapshot({"a": [1, 2], "b": ["x", "y"]})) == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+
+
+def test_subscription_uses_ticking_listener_when_available(monkeypatch):
+    listeners: list[Any] = []
+
+    class _Handle:
+        def __init__(self, table, on_update) -> None:
+            self.table = table
+            self.on_update = on_update
+            self.started = self.stopped = False
+
+        def start(self) -> None:
+            self.started = True
+
+        def stop(self) -> None:
+            self.stopped = True
+
+    class _Update:
+        def __init__(self, columns) -> None:
+            self._columns = columns
+
+        def added(self):
+            return self._columns
+
+    def _listen(table, on_update):
+        listeners.append(_Handle(table, on_update))
+        return listeners[-1]
+
+    monkeypatch.setattr(deephaven_bus, "dh_listen", _listen)
+    bus, _ = _make_bus(use_ticking_listener=True)
+    subscription = bus.subscribe(topic="work", status=None)
+
+    assert subscription._thread is None
+    (handle,) = listeners
+    assert handle.started
+    assert handle.table.wheres == ("topic == `work`",)
+
+    handle.on_update(_Update({"message_id": ["m1"], "topic": ["work"]}))
+    assert subscription.get(timeout=0.1) == {"message_id": "m1", "topic": "work"}
+
+    subscription.close()
+    assert handle.stopped
+
+
+def test_event_rows_are_coalesced_until_flush():
+    bus, session = _make_bus(max_flush_latency_ms=60_000, max_batch_rows=100)
+    for _ in range(3):
+        bus.publish({"topic": "work"})
+
+    events = session.inputs["agent_events"]
+    assert events.add_calls == 0
+    assert session.inputs["agent_messages"].add_calls == 3
+
+    bus.flush()
+    assert events.add_calls == 1
+    assert [row["event"] for row in events.rows()] == ["publish"] * 3
+    bus.close()
+
+
+def test_event_rows_flush_when_the_batch_fills():
+    bus, session = _make_bus(max_flush_latency_ms=60_000, max_batch_rows=2)
+    bus.publish({"topic": "work"})
+    bus.publish({"topic": "work"})
+    bus.close()
+
+    assert len(session.inputs["agent_events"].rows()) == 2
+
+
+def test_local_claim_index_avoids_queue_scans():
+    bus, session = _make_bus(local_claim_index=True)
+    low = bus.publish({"topic": "work", "priority": 0})
+    high = bus.publish({"topic": "work", "priority": 5})
+    other = bus.publish({"topic": "other", "priority": 9})
+
+    assert bus.claim(agent_id="worker", topic="work")["message_id"] == high
+    assert bus.nack(high, agent_id="worker")
+    assert bus.claim(agent_id="worker", topic="work")["message_id"] == high
+    assert bus.claim(agent_id="worker", topic="work")["message_id"] == low
+    assert bus.claim(agent_id="worker")["message_id"] == other
+    messages = session.inputs["agent_messages"]
+    assert not any(expr.startswith("status == `queued`") for expr in messages.where_calls)
+
+    messages.add([{**messages.rows()[0], "message_id": "external", "status": "queued", "topic": "work"}])
+    assert bus.claim(agent_id="worker", topic="work")["message_id"] == "external"
+    assert bus.claim(agent_id="worker", topic="work") is None
+
+
+def test_claim_expires_lapsed_leases_server_side():
+    bus, session = _make_bus(max_flush_latency_ms=0)
+    first = bus.publish({"topic": "work"})
+    bus.claim(agent_id="worker", lease_ms=1)
+    bus.publish({"topic": "work"})
+    messages = session.inputs["agent_messages"]
+    lease = messages.rows()[0]["lease_expires_ts"]
+
+    bus._now_ns = lambda: lease + 1
+    calls_before = len(messages.where_calls)
+    bus.claim(agent_id="worker")
+
+    assert {row["message_id"]: row["status"] for row in messages.rows()}[first] == "expired"
+    (claim_query,) = messages.where_calls[calls_before:]
+    assert f"lease_expires_ts <= {lease + 1}" in claim_query
+    assert [row["event"] for row in session.inputs["agent_events"].rows()].count("timeout") == 1
+
+
+def test_polling_subscription_hands_off_new_rows():
+    bus, _ = _make_bus(poll_interval_s=0.01)
+    bus.publish({"topic": "work", "message_id": "m1"})
+    subscription = bus.subscribe(topic="work", queue_size=1)
+
+    assert subscription.get(timeout=1.0)["message_id"] == "m1"
+    with pytest.raises(Empty):
+        subscription.get(timeout=0.02)
+
+    def _publish_later() -> None:
+        time.sleep(0.02)
+        bus.publish({"topic": "work", "message_id": "m2"})
+
+    publisher = threading.Thread(target=_publish_later)
+    publisher.start()
+    assert subscription.get(timeout=1.0)["message_id"] == "m2"
+    publisher.join()
+    subscription.close()
+    bus.close()
+
+
+@pytest.mark.parametrize(
+    "details",
+    [None, {}, {"message_id": "m1", "topic": None}, {"message_id": "é\n\"", "lease_extension_ms": 5}, {"nested": {"a": [1.5, True]}}],
+)
+def test_event_details_encoding_matches_json_dumps(details):
+    assert deephaven_bus._encode_details(details) == json.dumps(details or {})
+
+
+def test_rows_are_added_as_one_arrow_table_when_supported(monkeypatch):
+    class _FakeArrow:
+        @staticmethod
+        def schema(fields):
+            return tuple(name for name, _ in fields)
+
+        def __getattr__(self, name):
+            return lambda: name
+
+        class Table:
+            @staticmethod
+            def from_pydict(columns, schema):
+                assert tuple(columns) == schema
+                return columns
+
+    class _ImportingSession(_FakeSession):
+        def import_table(self, columns):
+            names = list(columns)
+            return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+    monkeypatch.setattr(deephaven_bus, "pa", _FakeArrow())
+    bus, session = _make_bus(_ImportingSession(), max_flush_latency_ms=0)
+    message_id = bus.publish({"topic": "work", "priority": 3})
+
+    (row,) = session.inputs["agent_messages"].rows()
+    assert row["message_id"] == message_id
+    assert row["priority"] == 3
+    assert tuple(row) == tuple(name for name, _ in DeephavenBus.MESSAGE_SCHEMA)
+    assert bus._tables.messages_arrow_schema == tuple(row)
+
+
+def test_message_ids_are_unique_hex():
+    ids = {deephaven_bus._next_message_id() for _ in range(1000)}
+
+    assert len(ids) == 1000
+    assert all(len(message_id) == 32 and int(message_id, 16) >= 0 for message_id in ids)
+
+
+def test_polling_subscription_reuses_its_filtered_view():
+    bus, session = _make_bus(poll_interval_s=0.005)
+    subscription = bus.subscribe(topic="work", status=None)
+    bus.publish({"topic": "work", "message_id": "m1"})
+    assert subscription.get(timeout=1.0)["message_id"] == "m1"
+    bus.publish({"topic": "other", "message_id": "m2"})
+    bus.publish({"topic": "work", "message_id": "m3"})
+    assert subscription.get(timeout=1.0)["message_id"] == "m3"
+    subscription.close()
+
+    where_calls = session.inputs["agent_messages"].where_calls
+    assert where_calls.count("topic == `work`") == 1
+    bus.close()
+
+
+def test_metrics_accumulate_per_window_and_coalesce_writes():
+    bus, session = _make_bus(max_flush_latency_ms=60_000)
+    bus._now_ns = lambda: 120_000_000_000
+    ids = [bus.publish({"topic": "work", "agent_id": "agent", "session_id": "s"}) for _ in range(3)]
+    for _ in ids:
+        bus.claim(agent_id="agent")
+    bus.ack(ids[0], latency_ms=10)
+    bus.ack(ids[1], latency_ms=30)
+    bus.nack(ids[2], reason="retry")
+    bus.flush()
+
+    metrics = session.inputs["agent_metrics"]
+    assert metrics.add_calls == 1
+    (row,) = metrics.rows()
+    assert (row["messages_processed"], row["errors"]) == (2, 1)
+    assert row["avg_latency_ms"] == 40 / 3
+    bus.close()
+
+
+def test_publish_is_not_blocked_by_inflight_event_write():
+    bus, session = _make_bus(max_flush_latency_ms=0)
+    events = session.inputs["agent_events"]
+    entered, release = threading.Event(), threading.Event()
+    original_add = events.add
+
+    def _slow_add(rows) -> None:
+        if not entered.is_set():
+            entered.set()
+            release.wait(1.0)
+        original_add(rows)
+
+    events.add = _slow_add
+    first = threading.Thread(target=bus.publish, args=({"topic": "work"},))
+    first.start()
+    assert entered.wait(1.0)
+
+    second = threading.Thread(target=bus.publish, args=({"topic": "work"},))
+    second.start()
+    deadline = time.monotonic() + 1.0
+    while len(session.inputs["agent_messages"].rows()) < 2 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    written = len(session.inputs["agent_messages"].rows())
+    release.set()
+    first.join()
+    second.join()
+
+    assert written == 2
+    assert len(events.rows()) == 2
+
+
+def test_subscribe_reuses_filter_expression_for_equivalent_filters():
+    bus, _ = _make_bus()
+    first = bus.subscribe(topic="work", status=("queued", "processing"), poll_interval_s=60)
+    second = bus.subscribe(topic="work", status=["processing", "queued"], poll_interval_s=60)
+    try:
+        assert first._filter_expr is second._filter_expr
+        assert first._filter_expr == "topic == `work` && (status == `processing` || status == `queued`)"
+    finally:
+        first.close()
+        second.close()
+
+
+def test_poll_messages_reduces_ingest_watermark_from_columns():
+    bus, session = _make_bus()
+    bus.publish({"topic": "work", "ingest_ts": 10})
+    bus.publish({"topic": "work", "ingest_ts": 30})
+    bus.publish({"topic": "work", "ingest_ts": 20})
+    table = session.open_table("agent_messages")
+
+    rows, watermark = bus._poll_messages(10, table)
+    assert sorted(row["ingest_ts"] for row in rows) == [20, 30]
+    assert watermark == 30
+    assert bus._poll_messages(30, table) == ([], 30)
+
+
+def test_polling_interval_backs_off_when_idle_and_tightens_on_rows():
+    bus, _ = _make_bus(poll_interval_s=0.001)
+    subscription = bus.subscribe(topic="work", status=None)
+    deadline = time.monotonic() + 1.0
+    while subscription._poll_interval < 0.1 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    idle_interval = subscription._poll_interval
+    assert 0.1 <= idle_interval <= subscription._max_poll_interval == 1.0
+
+    bus.publish({"topic": "work", "message_id": "m1"})
+    assert subscription.get(timeout=2.0)["message_id"] == "m1"
+    assert subscription._poll_interval < idle_interval
+    subscription.close()
+    bus.close()
+
+
+def test_subscription_aget_awaits_rows_from_poller():
+    bus, _ = _make_bus(poll_interval_s=0.005)
+    subscription = bus.subscribe(topic="work", status=None)
+
+    async def _consume() -> list[str]:
+        publisher = threading.Timer(0.02, bus.publish, args=({"topic": "work", "message_id": "m1"},))
+        publisher.start()
+        received = [(await subscription.aget(timeout=2.0))["message_id"]]
+        publisher.join()
+        with pytest.raises(Empty):
+            await subscription.aget(timeout=0.01)
+        return received
+
+    assert asyncio.run(_consume()) == ["m1"]
+    subscription.close()
+    bus.close()
+
+
+def test_session_liveness_is_cached_until_an_operation_fails():
+    bus, session = _make_bus(max_flush_latency_ms=0)
+    bus.publish({"topic": "work"})
+    bus._tables = None
+    bus.publish({"topic": "work"})
+    assert session.alive_checks == 0
+
+    messages = session.inputs["agent_messages"]
+    original_add = messages.add
+
+    def _failing_add(rows) -> None:
+        messages.add = original_add
+        raise RuntimeError("connection reset")
+
+    messages.add = _failing_add
+    with pytest.raises(RuntimeError):
+        bus.publish({"topic": "work"})
+    assert bus._tables is None
+
+    bus.publish({"topic": "work"})
+    assert session.alive_checks == 1
+    assert len(messages.rows()) == 3
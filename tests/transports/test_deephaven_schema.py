@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import copy
+import pickle
+import threading
+from dataclasses import asdict, dataclass
 
 import pytest
 
@@ -118,3 +121,143 @@ def test_bootstrap_wraps_non_missing_error() -> None:
         bootstrap_deephaven_tables(session, table_specs=(BASIC_SPEC,), publisher_factory=lambda *args, **kwargs: None)
 
     assert "permission denied" in str(excinfo.value.__cause__)
+
+
+def test_bootstrap_inspects_all_tables_in_one_call() -> None:
+    other_spec = TableSpec(name="agent_events", columns=(ColumnSpec("ts", "Instant"),))
+
+    class DescribingSession(FakeSession):
+        def __init__(self) -> None:
+            super().__init__()
+            self.describe_calls: list[list[str]] = []
+            self.table_service = self
+
+        def describe_tables(self, names: list[str]) -> dict[str, FakeTable]:
+            self.describe_calls.append(names)
+            return {name: self.tables[name] for name in names if name in self.tables}
+
+        def open_table(self, name: str) -> FakeTable:
+            raise AssertionError("tables must not be opened one by one")
+
+    session = DescribingSession()
+    _install_table(session, BASIC_SPEC)
+
+    result = bootstrap_deephaven_tables(
+        session,
+        table_specs=(BASIC_SPEC, other_spec),
+        publisher_factory=lambda session, spec, *, replace: _install_table(session, spec),
+    )
+
+    assert [(entry.created, entry.updated) for entry in result] == [(False, False), (True, False)]
+    assert session.describe_calls == [["agent_messages", "agent_events"]]
+
+
+def test_bootstrap_skips_inspection_when_fingerprint_is_cached(tmp_path) -> None:
+    class CachingSession(FakeSession):
+        cache_dir = tmp_path
+        server_url = "dh://primary"
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.opened: list[str] = []
+
+        def open_table(self, name: str) -> FakeTable:
+            self.opened.append(name)
+            return super().open_table(name)
+
+    session = CachingSession()
+
+    def publisher_factory(session: FakeSession, spec: TableSpec, *, replace: bool) -> None:
+        _install_table(session, spec)
+
+    first = bootstrap_deephaven_tables(session, table_specs=(BASIC_SPEC,), publisher_factory=publisher_factory)
+    second = bootstrap_deephaven_tables(session, table_specs=(BASIC_SPEC,), publisher_factory=publisher_factory)
+
+    assert first[0].created is True
+    assert (second[0].created, second[0].updated) == (False, False)
+    assert session.opened == ["agent_messages"]
+
+    bootstrap_deephaven_tables(session, table_specs=(BASIC_SPEC,), publisher_factory=publisher_factory, force_refresh=True)
+    assert session.opened == ["agent_messages", "agent_messages"]
+
+
+def test_table_spec_derives_column_types_once() -> None:
+    spec = TableSpec(name="t", columns=(ColumnSpec("ts", "Instant"),))
+
+    assert spec.column_types() == {"ts": "Instant"}
+    with pytest.raises(TypeError):
+        spec.column_types()["ts"] = "String"  # type: ignore[index]
+    assert spec == TableSpec(name="t", columns=(ColumnSpec("ts", "Instant"),))
+    assert hash(spec) == hash(TableSpec(name="t", columns=(ColumnSpec("ts", "Instant"),)))
+
+
+def test_bootstrap_matches_dtypes_case_insensitively() -> None:
+    session = FakeSession()
+    session.tables[BASIC_SPEC.name] = FakeTable((FakeColumn("ts", "INSTANT"), FakeColumn("topic", "string")))
+
+    result = bootstrap_deephaven_tables(session, table_specs=(BASIC_SPEC,), publisher_factory=lambda *args, **kwargs: None)
+
+    assert (result[0].created, result[0].updated) == (False, False)
+
+
+@pytest.mark.parametrize("message", ["Table NOT FOUND: agent_messages", "scope variable does not exist"])
+def test_bootstrap_treats_missing_table_messages_as_absent(message: str) -> None:
+    class MissingSession(FakeSession):
+        def open_table(self, name: str) -> FakeTable:
+            raise RuntimeError(message)
+
+    calls: list[bool] = []
+    bootstrap_deephaven_tables(
+        MissingSession(),
+        table_specs=(BASIC_SPEC,),
+        publisher_factory=lambda session, spec, *, replace: calls.append(replace),
+    )
+
+    assert calls == [False]
+
+
+def test_bootstrap_publishes_missing_tables_concurrently() -> None:
+    specs = (BASIC_SPEC, TableSpec(name="agent_events", columns=(ColumnSpec("ts", "Instant"),)))
+    barrier = threading.Barrier(len(specs), timeout=1.0)
+
+    def publisher_factory(session: FakeSession, spec: TableSpec, *, replace: bool) -> None:
+        barrier.wait()
+        _install_table(session, spec)
+
+    session = FakeSession()
+    result = bootstrap_deephaven_tables(session, table_specs=specs, publisher_factory=publisher_factory)
+
+    assert [entry.spec.name for entry in result] == ["agent_messages", "agent_events"]
+    assert all(entry.created for entry in result)
+    assert set(session.tables) == {"agent_messages", "agent_events"}
+
+
+def test_bootstrap_validates_every_table_before_publishing() -> None:
+    session = FakeSession()
+    session.tables["agent_messages"] = FakeTable((FakeColumn("ts", "String"),))
+    published: list[str] = []
+
+    with pytest.raises(SchemaBootstrapError):
+        bootstrap_deephaven_tables(
+            session,
+            table_specs=(TableSpec(name="agent_events", columns=(ColumnSpec("ts", "Instant"),)), BASIC_SPEC),
+            publisher_factory=lambda session, spec, *, replace: published.append(spec.name),
+        )
+    assert published == []
+
+
+def test_bootstrap_reports_mismatches_in_spec_order() -> None:
+    session = FakeSession()
+    session.tables[BASIC_SPEC.name] = FakeTable((FakeColumn("topic", "Int"), FakeColumn("ts", "String")))
+
+    with pytest.raises(SchemaBootstrapError, match=r"ts \(expected Instant, found String\), topic \(expected String"):
+        bootstrap_deephaven_tables(session, table_specs=(BASIC_SPEC,), publisher_factory=lambda *args, **kwargs: None)
+
+
+@pytest.mark.parametrize("clone", [lambda spec: pickle.loads(pickle.dumps(spec)), copy.deepcopy])
+def test_table_spec_survives_pickle_and_deepcopy(clone) -> None:
+    restored = clone(BASIC_SPEC)
+
+    assert restored == BASIC_SPEC
+    assert restored.column_types() == {"ts": "Instant", "topic": "String"}
+    assert asdict(restored)["name"] == "agent_messages"
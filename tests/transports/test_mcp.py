@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from unittest.mock import AsyncMock
 
 import pytest
@@ -20,7 +21,7 @@ if "pydeephaven.dtypes" not in sys.modules:
     sys.modules["pydeephaven.dtypes"] = stub_dtypes
 
 from deepagents.transports.base import TransportError
-from deepagents.transports.mcp import MCPTransport
+from deepagents.transports.mcp import DeephavenMCPTools, DeephavenMCPTransport, MCPTransport
 
 
 class FakeClock:
@@ -131,3 +132,209 @@ def test_heartbeat_timeout_occurs_without_refresh() -> None:
     clock.advance(2.0)
     with pytest.raises(TransportError):
         transport.ensure_alive()
+
+
+class FakeMCPClient:
+    def __init__(self) -> None:
+        self.invocations: list[tuple[str, object]] = []
+        self.callbacks: list = []
+        self.closed = False
+
+    def handshake(self) -> dict:
+        return {"server": "fake"}
+
+    def get_tool_schema(self, tool_name: str) -> dict:
+        return {"name": tool_name}
+
+    def invoke_tool(self, tool_name: str, arguments) -> dict:
+        self.invocations.append((tool_name, arguments))
+        return {}
+
+    def subscribe(self, tool_name: str, arguments, callback):
+        self.callbacks.append(callback)
+        return types.SimpleNamespace(close=lambda: None)
+
+    def send_heartbeat(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_deephaven_mcp_publish_forwards_plain_dicts_without_copying() -> None:
+    client = FakeMCPClient()
+    transport = DeephavenMCPTransport(client, heartbeat_interval=0)
+    message = {"topic": "work"}
+
+    transport.publish_message(message)
+    transport.publish_event(types.MappingProxyType({"event": "ack"}))
+
+    assert client.invocations[0][1] is message
+    assert client.invocations[1][1] == {"event": "ack"}
+    assert type(client.invocations[1][1]) is dict
+    transport.close()
+
+
+@pytest.mark.parametrize("filters", [{"topic": "work"}, None])
+@pytest.mark.parametrize("copy_on_deliver", [False, True])
+def test_deephaven_mcp_subscription_copies_only_when_requested(copy_on_deliver: bool, filters) -> None:
+    client = FakeMCPClient()
+    transport = DeephavenMCPTransport(client, heartbeat_interval=0, copy_on_deliver=copy_on_deliver)
+    subscription = transport.subscribe_messages(filters=filters)
+    message = {"topic": "work"}
+
+    client.callbacks[0](message)
+    client.callbacks[0]({"topic": "other"})
+
+    received = subscription.get(timeout=0.1)
+    assert received == message
+    assert (received is message) is not copy_on_deliver
+    transport.close()
+
+
+def test_deephaven_mcp_warms_tool_schemas_concurrently() -> None:
+    class SlowSchemaClient(FakeMCPClient):
+        def __init__(self) -> None:
+            super().__init__()
+            self.barrier = threading.Barrier(4, timeout=1.0)
+
+        def get_tool_schema(self, tool_name: str) -> dict:
+            self.barrier.wait()
+            return super().get_tool_schema(tool_name)
+
+    client = SlowSchemaClient()
+    transport = DeephavenMCPTransport(client, heartbeat_interval=0)
+
+    assert sorted(transport._tool_cache) == sorted(transport._iter_tool_names())
+    transport.close()
+
+
+def test_deephaven_mcp_warmup_errors_are_wrapped() -> None:
+    class FailingSchemaClient(FakeMCPClient):
+        def get_tool_schema(self, tool_name: str) -> dict:
+            raise RuntimeError("schema unavailable")
+
+    client = FailingSchemaClient()
+    with pytest.raises(TransportError) as excinfo:
+        DeephavenMCPTransport(client, heartbeat_interval=0)
+
+    assert "Failed to fetch schema" in str(excinfo.value)
+    assert client.closed
+
+
+def test_deephaven_mcp_unfiltered_subscription_enqueues_directly() -> None:
+    client = FakeMCPClient()
+    transport = DeephavenMCPTransport(client, heartbeat_interval=0)
+    subscription = transport.subscribe_messages()
+
+    client.callbacks[0]({"seq": 1})
+
+    assert client.callbacks[0] == subscription._queue.put
+    assert subscription.get(timeout=0.1) == {"seq": 1}
+    transport.close()
+
+
+def test_deephaven_mcp_coalesces_bursts_into_one_enqueue() -> None:
+    client = FakeMCPClient()
+    transport = DeephavenMCPTransport(client, heartbeat_interval=0)
+    subscription = transport.subscribe_messages(filters={"topic": "work"}, coalesce_window_ms=20)
+    batches = subscription._queue._batches
+
+    for seq in range(5):
+        client.callbacks[0]({"topic": "work", "seq": seq})
+    client.callbacks[0]({"topic": "other", "seq": 99})
+
+    assert subscription.get(timeout=1.0)["seq"] == 0
+    assert batches.empty()
+    assert [subscription.get(timeout=0.1)["seq"] for _ in range(4)] == [1, 2, 3, 4]
+    with pytest.raises(TimeoutError):
+        subscription.get(timeout=0.05)
+    transport.close()
+
+
+def test_deephaven_mcp_tools_collect_active_names_once() -> None:
+    tools = DeephavenMCPTools(publish_event="", heartbeat=None)
+
+    assert tools.active_tool_names == (
+        "deephaven.messages.publish",
+        "deephaven.metrics.publish",
+        "deephaven.messages.subscribe",
+    )
+    assert tools == DeephavenMCPTools(publish_event="", heartbeat=None)
+
+
+def test_deephaven_mcp_invoke_errors_name_the_tool() -> None:
+    class FailingInvokeClient(FakeMCPClient):
+        def invoke_tool(self, tool_name: str, arguments) -> dict:
+            raise RuntimeError("backpressure")
+
+    transport = DeephavenMCPTransport(FailingInvokeClient(), heartbeat_interval=0)
+
+    with pytest.raises(TransportError, match="Failed to invoke MCP tool 'deephaven.events.publish'"):
+        transport.publish_event({"kind": "started"})
+    transport.close()
+
+
+def test_deephaven_mcp_heartbeat_is_armed_before_warmup(monkeypatch: pytest.MonkeyPatch) -> None:
+    from deepagents.transports import mcp as mcp_module
+
+    registered = threading.Event()
+    original_register = mcp_module._HEARTBEATS.register
+
+    def _register(callback, interval):
+        registered.set()
+        return original_register(callback, interval)
+
+    class OrderingClient(FakeMCPClient):
+        def get_tool_schema(self, tool_name: str) -> dict:
+            if not registered.is_set():
+                raise RuntimeError("heartbeat not armed")
+            return super().get_tool_schema(tool_name)
+
+    monkeypatch.setattr(mcp_module._HEARTBEATS, "register", _register)
+    transport = DeephavenMCPTransport(OrderingClient(), heartbeat_interval=60.0)
+
+    assert transport._heartbeat is not None
+    transport.close()
+    assert transport._heartbeat.cancelled
+
+
+def test_deephaven_mcp_async_subscription_delivers_on_the_loop() -> None:
+    client = FakeMCPClient()
+    transport = DeephavenMCPTransport(client, heartbeat_interval=0)
+
+    async def _consume() -> list[dict]:
+        subscription = await transport.asubscribe_messages(filters={"topic": "work"})
+
+        def _deliver() -> None:
+            for payload in ({"topic": "idle"}, {"topic": "work"}):
+                client.callbacks[0](payload)
+
+        publisher = threading.Thread(target=_deliver)
+        publisher.start()
+        received = [await subscription.aget(timeout=1.0)]
+        publisher.join()
+        subscription.close()
+        return received
+
+    assert asyncio.run(_consume()) == [{"topic": "work"}]
+    assert transport._subscriptions == {}
+    transport.close()
+
+
+def test_deephaven_mcp_async_subscription_rejects_sync_reads_and_closed_loops() -> None:
+    client = FakeMCPClient()
+    transport = DeephavenMCPTransport(client, heartbeat_interval=0)
+
+    async def _subscribe():
+        return await transport.asubscribe_messages()
+
+    subscription = asyncio.run(_subscribe())
+
+    # The consumer's loop is gone; late deliveries are dropped instead of raising.
+    client.callbacks[0]({"topic": "late"})
+    with pytest.raises(TransportError, match="aget"):
+        subscription.get(timeout=0.01)
+    with pytest.raises(TransportError):
+        next(iter(subscription))
+    transport.close()
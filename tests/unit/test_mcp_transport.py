@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import gc
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Callable, Mapping
@@ -92,12 +94,15 @@ def test_transport_performs_handshake_and_caches_tool_schemas() -> None:
     transport = _create_transport(client)
 
     assert client.handshake_calls == 1
-    assert client.schema_requests == [
-        "deephaven.messages.publish",
-        "deephaven.events.publish",
-        "deephaven.metrics.publish",
-        "deephaven.messages.subscribe",
-    ]
+    # Schemas are warmed concurrently, so only the set of requests is deterministic.
+    assert sorted(client.schema_requests) == sorted(
+        [
+            "deephaven.messages.publish",
+            "deephaven.events.publish",
+            "deephaven.metrics.publish",
+            "deephaven.messages.subscribe",
+        ]
+    )
 
     # Subsequent publishes should reuse the cached schema and only invoke the tool.
     transport.publish_message({"topic": "alpha"})
@@ -151,3 +156,182 @@ def test_transport_wraps_handshake_errors() -> None:
         _create_transport(client)
 
     assert client.closed is True
+
+
+def test_transports_share_one_heartbeat_thread() -> None:
+    first_client, second_client = _FakeMCPClient(), _FakeMCPClient()
+    first = _create_transport(first_client, heartbeat_interval=0.01, heartbeat="deephaven.heartbeat")
+    second = _create_transport(second_client, heartbeat_interval=0.01, heartbeat="deephaven.heartbeat")
+
+    time.sleep(0.05)
+    first.close()
+    stopped_at = first_client.heartbeat_calls
+    time.sleep(0.05)
+    second.close()
+
+    heartbeat_threads = [thread for thread in threading.enumerate() if thread.name == "deephaven-mcp-heartbeat"]
+    assert len(heartbeat_threads) == 1
+    assert first_client.heartbeat_calls == stopped_at
+    assert second_client.heartbeat_calls >= 4
+
+
+def test_abandoned_transport_cancels_its_heartbeat() -> None:
+    client = _FakeMCPClient()
+    transport = _create_transport(client, heartbeat_interval=60.0, heartbeat="deephaven.heartbeat")
+    heartbeat = transport._heartbeat
+    assert heartbeat is not None
+
+    del transport
+    gc.collect()
+
+    assert heartbeat.cancelled
+
+
+def test_close_closes_every_subscription_newest_first() -> None:
+    client = _FakeMCPClient()
+    transport = _create_transport(client)
+    transport.subscribe_messages()
+    transport.subscribe_messages(filters={"topic": "alpha"})
+    closed: list[int] = []
+    for index, handle in enumerate(client.subscriptions):
+        handle.close = lambda index=index: closed.append(index)
+
+    transport.close()
+
+    assert closed == [1, 0]
+    assert transport._subscriptions == {}
+
+
+@pytest.mark.parametrize(("skip_when_active", "expected_calls"), [(True, 0), (False, 1)])
+def test_heartbeat_is_skipped_after_recent_tool_calls(skip_when_active: bool, expected_calls: int) -> None:
+    client = _FakeMCPClient()
+    client.schemas = {name: {"type": "object"} for name in DeephavenMCPTools().active_tool_names}
+    transport = DeephavenMCPTransport(
+        client,
+        tools=DeephavenMCPTools(heartbeat="deephaven.heartbeat"),
+        heartbeat_interval=60.0,
+        skip_heartbeat_when_active=skip_when_active,
+    )
+    assert transport._heartbeat is not None
+    beat = transport._heartbeat.callback
+
+    transport.publish_message({"topic": "alpha"})
+    beat()
+    assert client.heartbeat_calls == expected_calls
+
+    transport._last_rpc_at -= 60.0
+    beat()
+    assert client.heartbeat_calls == expected_calls + 1
+    transport.close()
+
+
+def test_batched_publishes_are_sent_per_tool_in_batches() -> None:
+    client = _FakeMCPClient()
+    client.schemas = {name: {"type": "object"} for name in DeephavenMCPTools().active_tool_names}
+    transport = DeephavenMCPTransport(client, tools=DeephavenMCPTools(heartbeat=None), batch_size=2)
+
+    transport.publish_message({"seq": 1})
+    transport.publish_event({"event": "claimed"})
+    assert client.tool_invocations == []
+    transport.publish_message({"seq": 2})
+    transport.close()
+
+    assert client.tool_invocations == [
+        ("deephaven.messages.publish", {"batch": [{"seq": 1}, {"seq": 2}]}),
+        ("deephaven.events.publish", {"batch": [{"event": "claimed"}]}),
+    ]
+
+
+def test_batch_interval_flushes_in_the_background() -> None:
+    flush_threads: list[str] = []
+
+    class _RecordingClient(_FakeMCPClient):
+        def invoke_tool(self, tool_name: str, arguments: Mapping[str, Any]) -> Mapping[str, Any]:
+            flush_threads.append(threading.current_thread().name)
+            return super().invoke_tool(tool_name, arguments)
+
+    client = _RecordingClient()
+    client.schemas = {name: {"type": "object"} for name in DeephavenMCPTools().active_tool_names}
+    transport = DeephavenMCPTransport(
+        client, tools=DeephavenMCPTools(heartbeat=None), batch_size=100, batch_interval_s=0.01
+    )
+
+    transport.publish_metrics({"count": 5})
+    deadline = time.monotonic() + 1.0
+    while not client.tool_invocations and time.monotonic() < deadline:
+        time.sleep(0.005)
+    transport.close()
+
+    assert client.tool_invocations == [("deephaven.metrics.publish", {"batch": [{"count": 5}]})]
+    # Blocking flushes must stay off the shared heartbeat scheduler thread.
+    assert flush_threads == ["deephaven-mcp-batch-flush"]
+
+
+def test_batched_publishes_copy_reused_payloads() -> None:
+    client = _FakeMCPClient()
+    client.schemas = {name: {"type": "object"} for name in DeephavenMCPTools().active_tool_names}
+    transport = DeephavenMCPTransport(client, tools=DeephavenMCPTools(heartbeat=None), batch_size=3)
+
+    row: dict[str, int] = {}
+    for index in range(3):
+        row["i"] = index
+        transport.publish_message(row)
+    transport.close()
+
+    assert client.tool_invocations == [("deephaven.messages.publish", {"batch": [{"i": 0}, {"i": 1}, {"i": 2}]})]
+
+
+def test_close_tears_down_and_keeps_batches_when_final_flush_fails() -> None:
+    class _FailingInvokeClient(_FakeMCPClient):
+        def invoke_tool(self, tool_name: str, arguments: Mapping[str, Any]) -> Mapping[str, Any]:
+            raise RuntimeError("server unavailable")
+
+    client = _FailingInvokeClient()
+    client.schemas = {name: {"type": "object"} for name in DeephavenMCPTools().active_tool_names}
+    transport = DeephavenMCPTransport(
+        client,
+        tools=DeephavenMCPTools(heartbeat="deephaven.heartbeat"),
+        heartbeat_interval=60.0,
+        batch_size=10,
+        batch_interval_s=60.0,
+    )
+    subscription = transport.subscribe_messages()
+    transport.publish_message({"seq": 1})
+    transport.publish_event({"event": "claimed"})
+
+    with pytest.raises(TransportError):
+        transport.close()
+
+    assert transport._closed is True
+    assert client.closed is True
+    assert client.subscriptions[0].closed is True
+    assert transport._heartbeat is not None and transport._heartbeat.cancelled
+    assert transport._batch_flusher_stop is not None and transport._batch_flusher_stop.is_set()
+    with pytest.raises(TransportError):
+        subscription.get(timeout=0.01)
+    assert transport.pending_publishes == {
+        "deephaven.messages.publish": [{"seq": 1}],
+        "deephaven.events.publish": [{"event": "claimed"}],
+    }
+
+
+def test_slow_heartbeat_does_not_stall_other_transports() -> None:
+    release = threading.Event()
+
+    class _HungHeartbeatClient(_FakeMCPClient):
+        def send_heartbeat(self) -> None:
+            super().send_heartbeat()
+            release.wait(timeout=2.0)
+
+    slow_client, fast_client = _HungHeartbeatClient(), _FakeMCPClient()
+    slow = _create_transport(slow_client, heartbeat_interval=0.01, heartbeat="deephaven.heartbeat")
+    fast = _create_transport(fast_client, heartbeat_interval=0.01, heartbeat="deephaven.heartbeat")
+
+    time.sleep(0.1)
+    slow.close()
+    fast.close()
+    release.set()
+
+    # The hung beat is never re-entered while in flight, and the other transport keeps beating.
+    assert slow_client.heartbeat_calls == 1
+    assert fast_client.heartbeat_calls >= 4